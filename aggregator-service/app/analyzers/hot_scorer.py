@@ -10,6 +10,7 @@ Formula: Score = (Engagement - 1) / (Hours_Elapsed + 2)^Gravity
 Based on proven Hacker News ranking algorithm.
 """
 
+import numpy as np
 import structlog
 from datetime import datetime, timezone
 from typing import List, Dict
@@ -29,7 +30,13 @@ class HotScorer:
             gravity: Time decay factor (higher = faster decay)
                     1.8 is Hacker News default
         """
-        self.gravity = gravity
+        self.gravity = float(gravity)
+
+    @staticmethod
+    def _hours_elapsed(published_at: str, now: datetime) -> float:
+        """Hours between published_at and now, clamped at 0 for future timestamps"""
+        pub_time = date_parser.parse(published_at)
+        return max(0, (now - pub_time).total_seconds() / 3600)
 
     def calculate_score(
         self,
@@ -49,19 +56,11 @@ class HotScorer:
             Hotness score (higher = hotter)
         """
         try:
-            # Parse publication time
-            pub_time = date_parser.parse(published_at)
-
-            # Calculate hours elapsed
-            now = datetime.now(timezone.utc)
-            hours_elapsed = (now - pub_time).total_seconds() / 3600
-
-            # Prevent negative hours
-            hours_elapsed = max(0, hours_elapsed)
+            hours_elapsed = self._hours_elapsed(published_at, datetime.now(timezone.utc))
 
             # Apply Hacker News formula
             # Score = (Engagement - 1) / (Hours + 2)^Gravity
-            score = (engagement - 1) / pow(hours_elapsed + 2, self.gravity)
+            score = (engagement - 1) / (hours_elapsed + 2) ** self.gravity
 
             # Apply source weight
             score *= source_weight
@@ -75,7 +74,8 @@ class HotScorer:
     def score_articles(
         self,
         articles: List[Dict],
-        source_weights: Dict[str, float] = None
+        source_weights: Dict[str, float] = None,
+        copy: bool = True
     ) -> List[Dict]:
         """
         Calculate hotness scores for all articles
@@ -83,45 +83,46 @@ class HotScorer:
         Args:
             articles: List of article dictionaries
             source_weights: Optional dict of {source_name: weight}
+            copy: Score copies of the articles (False adds 'hot_score' in place)
 
         Returns:
             Articles with added 'hot_score' field, sorted by score
         """
         source_weights = source_weights or {}
 
-        scored_articles = []
-
-        for article in articles:
-            # Get engagement metric
-            engagement = article.get("score", 0)
-
-            # If no score, use comment count as proxy
-            if engagement == 0:
-                engagement = article.get("comments", 0)
+        # Gather inputs per article, then apply the formula to all at once
+        count = len(articles)
+        engagements = np.ones(count)
+        hours = np.zeros(count)
+        weights = np.ones(count)
+        valid = np.zeros(count, dtype=bool)
+        now = datetime.now(timezone.utc)
 
-            # If still no engagement, use minimum value
-            if engagement == 0:
-                engagement = 1
+        for i, article in enumerate(articles):
+            # Score, else comment count as proxy, else minimum value
+            engagements[i] = article.get("score", 0) or article.get("comments", 0) or 1
 
-            # Get published timestamp
+            # No timestamp - zero score
             published_at = article.get("published_at")
             if not published_at:
-                # No timestamp - use very low score
-                hot_score = 0.0
-            else:
-                # Get source weight
-                source = article.get("source", "")
-                source_weight = source_weights.get(source, 1.0)
-
-                # Calculate score
-                hot_score = self.calculate_score(
-                    engagement=engagement,
-                    published_at=published_at,
-                    source_weight=source_weight
-                )
-
-            # Add score to article
-            article_with_score = article.copy()
+                continue
+
+            try:
+                hours[i] = self._hours_elapsed(published_at, now)
+            except Exception as e:
+                logger.warning("hot_score_calculation_failed", error=str(e))
+                continue
+
+            weights[i] = source_weights.get(article.get("source", ""), 1.0)
+            valid[i] = True
+
+        # Score = (Engagement - 1) / (Hours + 2)^Gravity * Weight, clamped at 0
+        scores = (engagements - 1) / np.power(hours + 2, self.gravity) * weights
+        scores = np.where(valid, np.maximum(scores, 0.0), 0.0)
+
+        scored_articles = []
+        for article, hot_score in zip(articles, scores.tolist()):
+            article_with_score = article.copy() if copy else article
             article_with_score["hot_score"] = hot_score
             scored_articles.append(article_with_score)
 
@@ -9,13 +9,20 @@ Outputs phrases rather than single words, which is better for trending topics.
 
 from rake_nltk import Rake
 import structlog
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set, Tuple
 from collections import Counter
 import re
 import html
 
 logger = structlog.get_logger()
 
+# Text cleanup patterns, compiled once at import
+_TAG_RE = re.compile(r"<[^>]+>")
+_URL_RE = re.compile(r"http[s]?://\S+")
+_GARBAGE_RE = re.compile(r"[»«•·|→←↑↓]")
+_CONTROL_RE = re.compile(r"[\x00-\x1f\x7f-\x9f]")
+_WS_RE = re.compile(r"\s+")
+
 
 class KeywordExtractor:
     """Extract keywords and phrases from article content"""
@@ -109,16 +116,33 @@ class KeywordExtractor:
         Returns:
             Dictionary of {keyword: frequency}
         """
-        all_keywords = []
+        keyword_freq, _ = self._extract_with_index(articles, min_frequency)
+        return keyword_freq
 
-        for article in articles:
-            keywords = self.extract_from_article(article)
-            all_keywords.extend(keywords)
+    def _extract_with_index(
+        self,
+        articles: List[Dict],
+        min_frequency: int
+    ) -> Tuple[Dict[str, int], Dict[str, List[Dict]]]:
+        """
+        Count keyword frequencies and index which articles produced each keyword
 
-        # Count keyword frequencies
-        keyword_counts = Counter(
-            kw.lower() for kw in all_keywords
-        )
+        Args:
+            articles: List of article dictionaries
+            min_frequency: Minimum frequency to include keyword
+
+        Returns:
+            ({keyword: frequency}, {keyword: [articles in input order]})
+        """
+        keyword_counts = Counter()
+        keyword_articles: Dict[str, List[Dict]] = {}
+
+        for article in articles:
+            # extract_from_article already drops per-article duplicates
+            for kw in self.extract_from_article(article):
+                kw_lower = kw.lower()
+                keyword_counts[kw_lower] += 1
+                keyword_articles.setdefault(kw_lower, []).append(article)
 
         # Filter by minimum frequency
         filtered_keywords = {
@@ -133,7 +157,7 @@ class KeywordExtractor:
             total_articles=len(articles)
         )
 
-        return filtered_keywords
+        return filtered_keywords, keyword_articles
 
     def get_top_keywords(
         self,
@@ -152,7 +176,7 @@ class KeywordExtractor:
         Returns:
             List of dicts with keyword, frequency, and sample articles
         """
-        keyword_freq = self.extract_from_articles(articles, min_frequency)
+        keyword_freq, keyword_articles = self._extract_with_index(articles, min_frequency)
 
         # Sort by frequency
         sorted_keywords = sorted(
@@ -168,7 +192,8 @@ class KeywordExtractor:
             sample_articles = self._find_articles_with_keyword(
                 articles,
                 keyword,
-                limit=3
+                limit=3,
+                index=keyword_articles
             )
 
             results.append({
@@ -183,7 +208,8 @@ class KeywordExtractor:
         self,
         articles: List[Dict],
         keyword: str,
-        limit: int = 3
+        limit: int = 3,
+        index: Optional[Dict[str, List[Dict]]] = None
     ) -> List[Dict]:
         """
         Find articles that mention a specific keyword
@@ -192,28 +218,38 @@ class KeywordExtractor:
             articles: List of articles
             keyword: Keyword to search for
             limit: Maximum articles to return
+            index: Optional {keyword: articles} index from _extract_with_index;
+                   indexed articles match without rescanning their text, other
+                   articles are still checked by substring
 
         Returns:
-            List of article metadata (title, url, source)
+            List of article metadata (title, url, source), in input order
         """
-        matching_articles = []
         keyword_lower = keyword.lower()
+        indexed_ids = {id(article) for article in (index or {}).get(keyword_lower, [])}
 
+        matches = []
         for article in articles:
-            title = (article.get("title") or "").lower()
-            text = (article.get("text") or "").lower()
+            if id(article) in indexed_ids:
+                matches.append(article)
+            else:
+                title = (article.get("title") or "").lower()
+                text = (article.get("text") or "").lower()
 
-            if keyword_lower in title or keyword_lower in text:
-                matching_articles.append({
-                    "title": article.get("title", ""),
-                    "url": article.get("url", ""),
-                    "source": article.get("source", "")
-                })
+                if keyword_lower in title or keyword_lower in text:
+                    matches.append(article)
 
-                if len(matching_articles) >= limit:
-                    break
+            if len(matches) >= limit:
+                break
 
-        return matching_articles
+        return [
+            {
+                "title": article.get("title", ""),
+                "url": article.get("url", ""),
+                "source": article.get("source", "")
+            }
+            for article in matches
+        ]
 
     @staticmethod
     def _clean_text(text: str) -> str:
@@ -227,22 +263,22 @@ class KeywordExtractor:
             Cleaned text
         """
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _TAG_RE.sub('', text)
 
         # Decode HTML entities (&nbsp;, &raquo;, &amp;, etc.)
         text = html.unescape(text)
 
         # Remove URLs
-        text = re.sub(r'http[s]?://\S+', '', text)
+        text = _URL_RE.sub('', text)
 
         # Remove common garbage characters from RSS feeds
-        text = re.sub(r'[»«•·|→←↑↓]', ' ', text)
+        text = _GARBAGE_RE.sub(' ', text)
 
         # Remove non-printable and control characters
-        text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
+        text = _CONTROL_RE.sub('', text)
 
         # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
 
         return text.strip()
 
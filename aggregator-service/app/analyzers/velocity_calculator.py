@@ -11,12 +11,84 @@ Based on MIT research (95% accuracy, 1.5-5 hour lead time) and BuzzSumo's
 velocity-based trending detection.
 """
 
+import re
+
+import numpy as np
 import structlog
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional, Tuple
 
 logger = structlog.get_logger()
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Trailing UTC designator, and any remaining UTC offset, on ISO-8601 strings
+_UTC_SUFFIX_RE = re.compile(r"(?:Z|[+-]00:?00)$")
+_OFFSET_RE = re.compile(r"[+-]\d{2}:?\d{2}$")
+
+
+def _epoch_us(value: datetime) -> int:
+    """Microseconds since the Unix epoch (naive datetimes are taken as UTC)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _parse_dates_us(values: List[str]) -> np.ndarray:
+    """
+    Parse ISO-8601 date strings to epoch microseconds
+
+    UTC and naive strings (what the history tables hold) are parsed by NumPy
+    in a single call; if any string carries another offset, every string is
+    parsed with datetime.fromisoformat instead.
+
+    Args:
+        values: ISO-8601 date strings
+
+    Returns:
+        int64 array of microseconds since the Unix epoch
+    """
+    naive = [_UTC_SUFFIX_RE.sub("", value) for value in values]
+    if any(_OFFSET_RE.search(value) for value in naive):
+        return np.fromiter(
+            (_epoch_us(datetime.fromisoformat(value.replace('Z', '+00:00'))) for value in values),
+            dtype=np.int64,
+            count=len(values)
+        )
+    return np.array(naive, dtype="datetime64[us]").view(np.int64)
+
+
+def _spike_kernel(
+    volumes: np.ndarray,
+    current_volume: float,
+    spike_threshold: float
+) -> Tuple[bool, float]:
+    """
+    Z-score spike test of current_volume against historical volumes
+
+    Args:
+        volumes: Historical mentions (float64)
+        current_volume: Current mentions
+        spike_threshold: Multiple of standard deviation to flag as spike
+
+    Returns:
+        (is_spike, z_score)
+    """
+    # One pass over the data: sum and sum of squares. Mentions are integer
+    # counts, so both sums are exact and identical values still give a
+    # variance of exactly 0; clamp guards against rounding below zero.
+    count = volumes.shape[0]
+    mean = volumes.sum() / count
+    variance = max(float(volumes @ volumes) / count - mean * mean, 0.0)
+    std_dev = variance ** 0.5
+
+    if std_dev == 0:
+        return bool(current_volume > mean * 2), 0.0
+
+    z_score = float((current_volume - mean) / std_dev)
+    return z_score >= spike_threshold, z_score
+
 
 class VelocityCalculator:
     """Calculate trending velocity for keywords"""
@@ -66,6 +138,41 @@ class VelocityCalculator:
 
         return velocity * magnitude_weight
 
+    @staticmethod
+    def calculate_velocity_vec(
+        current: np.ndarray,
+        previous: np.ndarray,
+        time_period_days: int
+    ) -> np.ndarray:
+        """
+        Calculate velocity scores for arrays of volumes
+
+        This is the bulk API: inputs are cast to float64 once here and
+        element values are not checked individually.
+
+        Args:
+            current: Mentions in current period (array-like, cast to float64)
+            previous: Mentions in previous period (array-like, cast to float64)
+            time_period_days: Length of period in days
+
+        Returns:
+            Velocity per element, matching calculate_velocity
+        """
+        current = np.asarray(current, dtype=np.float64)
+        previous = np.asarray(previous, dtype=np.float64)
+
+        # Computed in place: change per day times magnitude weight
+        magnitude_weight = current / 100
+        magnitude_weight += 1
+        velocity = current - previous
+        velocity /= time_period_days
+        velocity *= magnitude_weight
+
+        # No previous volume: constant high score (current * 10)
+        is_new = previous == 0
+        np.multiply(current, 10.0, out=velocity, where=is_new)
+        return velocity
+
     def calculate_percent_growth(
         self,
         current_volume: int,
@@ -88,6 +195,33 @@ class VelocityCalculator:
         growth = ((current_volume - previous_volume) / previous_volume) * 100
         return growth
 
+    @staticmethod
+    def calculate_percent_growth_vec(
+        current: np.ndarray,
+        previous: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate percent growth for arrays of volumes (no per-element branches)
+
+        This is the bulk API: inputs are cast to float64 once here and
+        element values are not checked individually.
+
+        Args:
+            current: Current mentions (array-like, cast to float64)
+            previous: Previous mentions (array-like, cast to float64)
+
+        Returns:
+            Percent growth per element, matching calculate_percent_growth
+        """
+        current = np.asarray(current, dtype=np.float64)
+        previous = np.asarray(previous, dtype=np.float64)
+
+        has_previous = previous > 0
+        growth = np.where(current > 0, 1000.0, 0.0)
+        np.divide(current - previous, previous, out=growth, where=has_previous)
+        growth[has_previous] *= 100
+        return growth
+
     def find_trending_up_keywords(
         self,
         current_keywords: Dict[str, int],
@@ -105,64 +239,94 @@ class VelocityCalculator:
         Returns:
             List of trending up keywords with metadata
         """
-        trending_keywords = []
-
-        for keyword, current_volume in current_keywords.items():
-            # Skip if below minimum volume
-            if current_volume < self.min_current_volume:
-                continue
-
-            # Get historical data for this keyword
-            history = historical_data.get(keyword, [])
-
-            if not history:
-                # No historical data - treat as potentially new trend
-                if current_volume >= self.min_current_volume * 2:
-                    trending_keywords.append({
-                        "keyword": keyword,
-                        "current_volume": current_volume,
-                        "previous_volume": 0,
-                        "velocity": current_volume * 10.0,
-                        "percent_growth": 1000.0,
-                        "is_new": True
-                    })
-                continue
-
-            # Calculate previous period volume
-            previous_volume = self._calculate_previous_volume(
-                history,
-                timeframe_days
-            )
+        return self._rank_trending(current_keywords, historical_data, timeframe_days)
 
-            # Calculate metrics
-            velocity = self.calculate_velocity(
-                current_volume=current_volume,
-                previous_volume=previous_volume,
-                time_period_days=timeframe_days
-            )
+    def _rank_trending(
+        self,
+        current_keywords: Dict[str, int],
+        historical_data: Dict[str, List[Dict]],
+        timeframe_days: int,
+        top_n: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Rank trending up keywords by velocity
 
-            percent_growth = self.calculate_percent_growth(
-                current_volume=current_volume,
-                previous_volume=previous_volume
-            )
+        Args:
+            current_keywords: {keyword: current_mentions}
+            historical_data: {keyword: [{date, mentions, sources}]}
+            timeframe_days: Comparison timeframe in days
+            top_n: Only build entries for the top N keywords (None for all)
+
+        Returns:
+            Trending up keywords, highest velocity first
+        """
+        keywords = list(current_keywords)
+        counts = list(current_keywords.values())
+        current = np.fromiter(counts, dtype=np.float64, count=len(counts))
+
+        # Previous volumes are only needed for keywords above the volume floor;
+        # keywords with no history are potential new trends (previous = 0)
+        eligible = current >= self.min_current_volume
+        histories = [historical_data.get(keyword, []) for keyword in keywords]
+        has_history = np.fromiter(
+            (bool(history) for history in histories), dtype=bool, count=len(histories)
+        )
+        # Each history is parsed once per call; nothing is kept between calls,
+        # so in-place edits to historical_data and the clock are always current
+        now = datetime.now(timezone.utc)
+        previous_volumes = [
+            self._calculate_previous_volume(history, timeframe_days, now=now)
+            if history and ok else 0
+            for history, ok in zip(histories, eligible.tolist())
+        ]
+        previous = np.fromiter(
+            previous_volumes, dtype=np.float64, count=len(previous_volumes)
+        )
 
-            # Filter by minimum growth threshold
-            if percent_growth >= self.min_growth_percent:
-                trending_keywords.append({
-                    "keyword": keyword,
-                    "current_volume": current_volume,
-                    "previous_volume": previous_volume,
-                    "velocity": velocity,
-                    "percent_growth": percent_growth,
-                    "is_new": False
-                })
+        # Metrics for all keywords at once (same formulas as the scalar methods)
+        velocity = self.calculate_velocity_vec(current, previous, timeframe_days)
+        percent_growth = self.calculate_percent_growth_vec(current, previous)
+        percent_growth[~has_history] = 1000.0
 
-        # Sort by velocity (highest first)
-        trending_keywords.sort(key=lambda x: x["velocity"], reverse=True)
+        # New keywords need double the minimum volume instead of a growth rate
+        keep = eligible & np.where(
+            has_history,
+            percent_growth >= self.min_growth_percent,
+            current >= self.min_current_volume * 2
+        )
+
+        # Sort by velocity (highest first); stable so ties keep input order
+        indices = np.flatnonzero(keep)
+        total = len(indices)
+        if top_n is not None and 0 < top_n < total:
+            # Partial selection: keep everything at or above the N-th highest
+            # velocity (ties included) so only that head needs sorting
+            kth = np.partition(velocity[indices], total - top_n)[total - top_n]
+            indices = indices[velocity[indices] >= kth]
+        indices = indices[np.argsort(-velocity[indices], kind="stable")][:top_n]
+
+        # Plain Python values for the selected rows only (one tolist per
+        # column instead of boxing a NumPy scalar per field)
+        trending_keywords = [
+            {
+                "keyword": keywords[i],
+                "current_volume": counts[i],
+                "previous_volume": previous_volumes[i],
+                "velocity": velocity_value,
+                "percent_growth": growth_value,
+                "is_new": is_new
+            }
+            for i, velocity_value, growth_value, is_new in zip(
+                indices.tolist(),
+                velocity[indices].tolist(),
+                percent_growth[indices].tolist(),
+                (~has_history[indices]).tolist()
+            )
+        ]
 
         logger.info(
             "found_trending_up_keywords",
-            count=len(trending_keywords),
+            count=total,
             timeframe_days=timeframe_days
         )
 
@@ -187,18 +351,18 @@ class VelocityCalculator:
         Returns:
             Top N trending up keywords
         """
-        trending = self.find_trending_up_keywords(
+        return self._rank_trending(
             current_keywords=current_keywords,
             historical_data=historical_data,
-            timeframe_days=timeframe_days
+            timeframe_days=timeframe_days,
+            top_n=top_n
         )
 
-        return trending[:top_n]
-
     def _calculate_previous_volume(
         self,
         history: List[Dict],
-        timeframe_days: int
+        timeframe_days: int,
+        now: Optional[datetime] = None
     ) -> int:
         """
         Calculate volume from previous period
@@ -206,6 +370,7 @@ class VelocityCalculator:
         Args:
             history: List of {date, mentions, sources}
             timeframe_days: Days to look back
+            now: Reference time (defaults to the current time)
 
         Returns:
             Average daily mentions in previous period
@@ -213,25 +378,39 @@ class VelocityCalculator:
         if not history:
             return 0
 
+        dates, mentions = self._get_history_arrays(history)
+
         # Calculate date range for previous period
         # If timeframe is 7 days, previous period is days 8-14 ago
-        end_date = datetime.now(timezone.utc) - timedelta(days=timeframe_days)
-        start_date = end_date - timedelta(days=timeframe_days)
+        timeframe_us = timeframe_days * 86_400_000_000
+        end_us = _epoch_us(now or datetime.now(timezone.utc)) - timeframe_us
+        start_us = end_us - timeframe_us
 
-        # Filter history to previous period
-        previous_mentions = []
-        for entry in history:
-            # Parse date
-            entry_date = datetime.fromisoformat(entry["date"].replace('Z', '+00:00'))
+        # Average mentions in the previous period (dates are sorted)
+        lo = int(np.searchsorted(dates, start_us, side="left"))
+        hi = int(np.searchsorted(dates, end_us, side="right"))
+        if hi > lo:
+            return int(mentions[lo:hi].sum() / (hi - lo))
 
-            if start_date <= entry_date <= end_date:
-                previous_mentions.append(entry["mentions"])
+        return 0
 
-        # Return average
-        if previous_mentions:
-            return int(sum(previous_mentions) / len(previous_mentions))
+    @staticmethod
+    def _get_history_arrays(history: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Parse a history list into date-sorted (dates, mentions) arrays
 
-        return 0
+        Args:
+            history: List of {date, mentions, sources}
+
+        Returns:
+            Dates as epoch microseconds (int64, ascending) and their mentions (float64)
+        """
+        dates = _parse_dates_us([entry["date"] for entry in history])
+        mentions = np.fromiter(
+            (entry["mentions"] for entry in history), dtype=np.float64, count=len(history)
+        )
+        order = np.argsort(dates, kind="stable")
+        return dates[order], mentions[order]
 
     def detect_spike(
         self,
@@ -253,24 +432,10 @@ class VelocityCalculator:
         if not history or len(history) < 3:
             return False, 0.0
 
-        # Calculate mean and std dev of historical mentions
-        historical_volumes = [entry["mentions"] for entry in history]
-        mean = sum(historical_volumes) / len(historical_volumes)
-
-        # Standard deviation
-        variance = sum((x - mean) ** 2 for x in historical_volumes) / len(historical_volumes)
-        std_dev = variance ** 0.5
-
-        if std_dev == 0:
-            return current_volume > mean * 2, 0.0
-
-        # Calculate z-score
-        z_score = (current_volume - mean) / std_dev
-
-        # Is it a spike?
-        is_spike = z_score >= spike_threshold
-
-        return is_spike, z_score
+        volumes = np.fromiter(
+            (entry["mentions"] for entry in history), dtype=np.float64, count=len(history)
+        )
+        return _spike_kernel(volumes, current_volume, spike_threshold)
 
 
 # Convenience function
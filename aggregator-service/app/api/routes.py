@@ -488,7 +488,7 @@ async def fetch_and_process_content(job_id: str, sources: Optional[List[str]] =
         logger.info("keyword_history_stored", count=len(keyword_history))
 
         # Step 7: Calculate Trending Up (if enough historical data)
-        history = await database.get_all_keywords_history(days=14)
+        history = await database.get_all_keywords_history(days=14, include_sources=False)
         if history and len(history) > 0:
             # Convert keywords list to dict format {keyword: frequency}
             current_keywords_dict = {
@@ -27,6 +27,15 @@ class Settings(BaseSettings):
     reddit_update_freq: int = 30
     rss_update_freq: int = 60
 
+    # Feed parsing: worker processes for RSS parsing (0 = parse in a thread)
+    rss_parse_processes: int = 0
+
+    # Discovery: seconds to cache Substack top posts per newsletter
+    substack_post_cache_ttl: int = 900  # 15 minutes
+
+    # API docs: disable in production to skip serving the OpenAPI schema
+    enable_api_docs: bool = True
+
     # Trending detection
     hot_now_cache_ttl: int = 900  # 15 minutes
     trending_up_cache_ttl: int = 1800  # 30 minutes
@@ -5,17 +5,18 @@ Uses SQLAlchemy with asyncpg for PostgreSQL async database access.
 Table names match Prisma's @@map() directives.
 """
 
-import json
 import os
 import time
 import uuid
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 
+import orjson
 import structlog
-from sqlalchemy import select, delete, and_, desc
+from sqlalchemy import select, insert, delete, and_, or_, desc, bindparam, String
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 
+from .fetchers.article import to_json_bytes
 from .models import Base, Feed, HotTopic, TrendingUpTopic, KeywordHistory
 
 logger = structlog.get_logger()
@@ -33,13 +34,27 @@ def get_database_url() -> str:
     return db_url
 
 
-# Create async engine with connection pooling
+DATABASE_URL = get_database_url()
+
+# Keep more prepared statements per connection than asyncpg's default so the
+# same topic inserts/selects skip the Parse round trip on every refresh
+_connect_args = {}
+if DATABASE_URL.startswith("postgresql+asyncpg://"):
+    _connect_args = {"prepared_statement_cache_size": 256, "statement_cache_size": 256}
+
+# Create async engine with connection pooling. Connections are recycled
+# every 30 minutes instead of pinged before each checkout.
 engine = create_async_engine(
-    get_database_url(),
+    DATABASE_URL,
     pool_size=5,
     max_overflow=10,
-    pool_pre_ping=True,
+    pool_pre_ping=False,
+    pool_recycle=1800,
+    connect_args=_connect_args,
     echo=os.environ.get("DEBUG_SQL", "").lower() == "true",
+    # JSON/JSONB columns bind and load Python lists via orjson
+    json_serializer=lambda obj: to_json_bytes(obj).decode(),
+    json_deserializer=orjson.loads,
 )
 
 # Create async session factory
@@ -57,6 +72,29 @@ def generate_cuid() -> str:
     return f"c{timestamp}{random_part}"
 
 
+def _valid_batch(items: List[Dict[str, Any]], event: str) -> List[Dict[str, Any]]:
+    """
+    Drop entries without a usable keyword before building insert rows
+
+    Validating the batch upfront keeps the insert loop free of per-row
+    exception handling. Invalid entries are logged once per batch.
+
+    Args:
+        items: Topic or keyword dicts to store
+        event: Log event name used when entries are dropped
+
+    Returns:
+        Entries with a non-empty string keyword
+    """
+    valid = [
+        item for item in items
+        if isinstance(item.get("keyword"), str) and item["keyword"]
+    ]
+    if len(valid) != len(items):
+        logger.warning(event, skipped=len(items) - len(valid))
+    return valid
+
+
 async def store_hot_topics(
     topics: List[Dict[str, Any]],
     timeframe: str,
@@ -75,31 +113,30 @@ async def store_hot_topics(
     """
     logger.info("storing_hot_topics", timeframe=timeframe, count=len(topics))
 
+    topics = _valid_batch(topics, "store_hot_topics_invalid")
+
     async with async_session() as session:
-        stored = 0
-        for i, topic in enumerate(topics):
-            try:
-                hot_topic = HotTopic(
-                    id=generate_cuid(),
-                    keyword=topic.get("keyword", ""),
-                    timeframe=timeframe,
-                    rank=i + 1,
-                    score=topic.get("score", 0.0),
-                    mentions=topic.get("mentions", 0),
-                    summary=topic.get("summary", ""),
-                    sources=json.dumps(topic.get("sources", [])),
-                    sampleUrls=json.dumps(topic.get("sample_articles", [])),
-                    fetchedAt=fetched_at,
-                    createdAt=datetime.utcnow(),
-                )
-                session.add(hot_topic)
-                stored += 1
-            except Exception as e:
-                logger.error("store_hot_topic_failed", keyword=topic.get("keyword"), error=str(e))
+        if topics:
+            # Core executemany insert: skips building ORM instances
+            await session.execute(insert(HotTopic), [
+                {
+                    "id": generate_cuid(),
+                    "keyword": topic["keyword"],
+                    "timeframe": timeframe,
+                    "rank": i + 1,
+                    "score": topic.get("score", 0.0),
+                    "mentions": topic.get("mentions", 0),
+                    "summary": topic.get("summary", ""),
+                    "sources": topic.get("sources", []),
+                    "sampleUrls": topic.get("sample_articles", []),
+                    "fetchedAt": fetched_at,
+                }
+                for i, topic in enumerate(topics)
+            ])
 
         await session.commit()
-        logger.info("hot_topics_stored", count=stored, timeframe=timeframe)
-        return stored
+        logger.info("hot_topics_stored", count=len(topics), timeframe=timeframe)
+        return len(topics)
 
 
 async def store_trending_up_topics(
@@ -120,33 +157,32 @@ async def store_trending_up_topics(
     """
     logger.info("storing_trending_up_topics", timeframe=timeframe, count=len(topics))
 
+    topics = _valid_batch(topics, "store_trending_up_topics_invalid")
+
     async with async_session() as session:
-        stored = 0
-        for i, topic in enumerate(topics):
-            try:
-                trending_topic = TrendingUpTopic(
-                    id=generate_cuid(),
-                    keyword=topic.get("keyword", ""),
-                    timeframe=timeframe,
-                    rank=i + 1,
-                    velocity=topic.get("velocity", 0.0),
-                    currentVolume=topic.get("current_volume", 0),
-                    previousVolume=topic.get("previous_volume", 0),
-                    percentGrowth=topic.get("percent_growth", 0.0),
-                    summary=topic.get("summary", ""),
-                    sources=json.dumps(topic.get("sources", [])),
-                    sampleUrls=json.dumps(topic.get("sample_articles", [])),
-                    fetchedAt=fetched_at,
-                    createdAt=datetime.utcnow(),
-                )
-                session.add(trending_topic)
-                stored += 1
-            except Exception as e:
-                logger.error("store_trending_up_topic_failed", keyword=topic.get("keyword"), error=str(e))
+        if topics:
+            # Core executemany insert: skips building ORM instances
+            await session.execute(insert(TrendingUpTopic), [
+                {
+                    "id": generate_cuid(),
+                    "keyword": topic["keyword"],
+                    "timeframe": timeframe,
+                    "rank": i + 1,
+                    "velocity": topic.get("velocity", 0.0),
+                    "currentVolume": topic.get("current_volume", 0),
+                    "previousVolume": topic.get("previous_volume", 0),
+                    "percentGrowth": topic.get("percent_growth", 0.0),
+                    "summary": topic.get("summary", ""),
+                    "sources": topic.get("sources", []),
+                    "sampleUrls": topic.get("sample_articles", []),
+                    "fetchedAt": fetched_at,
+                }
+                for i, topic in enumerate(topics)
+            ])
 
         await session.commit()
-        logger.info("trending_up_topics_stored", count=stored, timeframe=timeframe)
-        return stored
+        logger.info("trending_up_topics_stored", count=len(topics), timeframe=timeframe)
+        return len(topics)
 
 
 async def store_keyword_history(
@@ -165,26 +201,25 @@ async def store_keyword_history(
     """
     logger.info("storing_keyword_history", count=len(keywords))
 
+    keywords = _valid_batch(keywords, "store_keyword_history_invalid")
+
     async with async_session() as session:
-        stored = 0
-        for kw in keywords:
-            try:
-                keyword_hist = KeywordHistory(
-                    id=generate_cuid(),
-                    keyword=kw.get("keyword", ""),
-                    mentions=kw.get("mentions", kw.get("count", 0)),
-                    sources=json.dumps(kw.get("sources", [])),
-                    date=date,
-                    createdAt=datetime.utcnow(),
-                )
-                session.add(keyword_hist)
-                stored += 1
-            except Exception as e:
-                logger.error("store_keyword_history_failed", keyword=kw.get("keyword"), error=str(e))
+        if keywords:
+            # Core executemany insert: skips building ORM instances
+            await session.execute(insert(KeywordHistory), [
+                {
+                    "id": generate_cuid(),
+                    "keyword": kw["keyword"],
+                    "mentions": kw.get("mentions", kw.get("count", 0)),
+                    "sources": kw.get("sources", []),
+                    "date": date,
+                }
+                for kw in keywords
+            ])
 
         await session.commit()
-        logger.info("keyword_history_stored", count=stored)
-        return stored
+        logger.info("keyword_history_stored", count=len(keywords))
+        return len(keywords)
 
 
 async def get_hot_topics(
@@ -220,9 +255,18 @@ async def get_hot_topics(
 
         latest_fetch = row
 
-        # Get topics from that fetch
+        # Get topics from that fetch (column rows only - skips ORM instance hydration)
         stmt = (
-            select(HotTopic)
+            select(
+                HotTopic.rank,
+                HotTopic.keyword,
+                HotTopic.score,
+                HotTopic.mentions,
+                HotTopic.summary,
+                HotTopic.sources,
+                HotTopic.sampleUrls,
+                HotTopic.fetchedAt,
+            )
             .where(and_(
                 HotTopic.timeframe == timeframe,
                 HotTopic.fetchedAt == latest_fetch
@@ -231,7 +275,7 @@ async def get_hot_topics(
             .limit(limit)
         )
         result = await session.execute(stmt)
-        rows = result.scalars().all()
+        rows = result.all()
 
         topics = []
         for row in rows:
@@ -241,8 +285,8 @@ async def get_hot_topics(
                 "score": row.score,
                 "mentions": row.mentions,
                 "summary": row.summary,
-                "sources": json.loads(row.sources),
-                "sample_articles": json.loads(row.sampleUrls),
+                "sources": row.sources,
+                "sample_articles": row.sampleUrls,
                 "fetched_at": row.fetchedAt.isoformat() if row.fetchedAt else None,
             })
 
@@ -283,9 +327,20 @@ async def get_trending_up_topics(
 
         latest_fetch = row
 
-        # Get topics from that fetch
+        # Get topics from that fetch (column rows only - skips ORM instance hydration)
         stmt = (
-            select(TrendingUpTopic)
+            select(
+                TrendingUpTopic.rank,
+                TrendingUpTopic.keyword,
+                TrendingUpTopic.velocity,
+                TrendingUpTopic.currentVolume,
+                TrendingUpTopic.previousVolume,
+                TrendingUpTopic.percentGrowth,
+                TrendingUpTopic.summary,
+                TrendingUpTopic.sources,
+                TrendingUpTopic.sampleUrls,
+                TrendingUpTopic.fetchedAt,
+            )
             .where(and_(
                 TrendingUpTopic.timeframe == timeframe,
                 TrendingUpTopic.fetchedAt == latest_fetch
@@ -294,7 +349,7 @@ async def get_trending_up_topics(
             .limit(limit)
         )
         result = await session.execute(stmt)
-        rows = result.scalars().all()
+        rows = result.all()
 
         topics = []
         for row in rows:
@@ -306,8 +361,8 @@ async def get_trending_up_topics(
                 "previous_volume": row.previousVolume,
                 "percent_growth": row.percentGrowth,
                 "summary": row.summary,
-                "sources": json.loads(row.sources),
-                "sample_articles": json.loads(row.sampleUrls),
+                "sources": row.sources,
+                "sample_articles": row.sampleUrls,
                 "fetched_at": row.fetchedAt.isoformat() if row.fetchedAt else None,
             })
 
@@ -333,7 +388,12 @@ async def get_keyword_history(
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
         stmt = (
-            select(KeywordHistory)
+            select(
+                KeywordHistory.keyword,
+                KeywordHistory.mentions,
+                KeywordHistory.sources,
+                KeywordHistory.date,
+            )
             .where(and_(
                 KeywordHistory.keyword == keyword,
                 KeywordHistory.date >= cutoff_date
@@ -341,14 +401,14 @@ async def get_keyword_history(
             .order_by(KeywordHistory.date)
         )
         result = await session.execute(stmt)
-        rows = result.scalars().all()
+        rows = result.all()
 
         history = []
         for row in rows:
             history.append({
                 "keyword": row.keyword,
                 "mentions": row.mentions,
-                "sources": json.loads(row.sources),
+                "sources": row.sources,
                 "date": row.date.isoformat() if row.date else None,
             })
 
@@ -356,13 +416,17 @@ async def get_keyword_history(
 
 
 async def get_all_keywords_history(
-    days: int = 30
+    days: int = 30,
+    include_sources: bool = True
 ) -> Dict[str, List[Dict[str, Any]]]:
     """
     Get historical data for all keywords (for velocity calculation)
 
     Args:
         days: How many days of history to fetch
+        include_sources: Whether to load the sources JSON.
+                         Velocity calculation only needs mentions and date,
+                         so it can skip transferring a JSON value per row.
 
     Returns:
         Dict mapping keyword -> list of history entries
@@ -370,28 +434,50 @@ async def get_all_keywords_history(
     async with async_session() as session:
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
+        columns = [KeywordHistory.keyword, KeywordHistory.mentions, KeywordHistory.date]
+        if include_sources:
+            columns.append(KeywordHistory.sources)
+
         stmt = (
-            select(KeywordHistory)
+            select(*columns)
             .where(KeywordHistory.date >= cutoff_date)
             .order_by(KeywordHistory.keyword, KeywordHistory.date)
         )
         result = await session.execute(stmt)
-        rows = result.scalars().all()
+        rows = result.all()
 
         history: Dict[str, List[Dict[str, Any]]] = {}
         for row in rows:
             keyword = row.keyword
             if keyword not in history:
                 history[keyword] = []
-            history[keyword].append({
+            entry = {
                 "mentions": row.mentions,
-                "sources": json.loads(row.sources),
                 "date": row.date.isoformat() if row.date else None,
-            })
+            }
+            if include_sources:
+                entry["sources"] = row.sources
+            history[keyword].append(entry)
 
         return history
 
 
+# Single statement shape for every filter combination; the optional filters
+# are NULL-tolerant bind parameters so the compiled/prepared statement is reused
+_feed_type_param = bindparam("feed_type", type_=String)
+_category_param = bindparam("category", type_=String)
+_ENABLED_FEEDS_STMT = (
+    select(Feed)
+    .where(and_(
+        Feed.enabled == True,
+        Feed.status == "active",
+        or_(_feed_type_param.is_(None), Feed.type == _feed_type_param),
+        or_(_category_param.is_(None), Feed.category == _category_param),
+    ))
+    .order_by(desc(Feed.priority), Feed.name)
+)
+
+
 async def get_enabled_feeds(
     feed_type: Optional[str] = None,
     category: Optional[str] = None
@@ -409,24 +495,10 @@ async def get_enabled_feeds(
     logger.info("fetching_enabled_feeds", type=feed_type, category=category)
 
     async with async_session() as session:
-        # Build query with optional filters
-        conditions = [
-            Feed.enabled == True,
-            Feed.status == "active"
-        ]
-
-        if feed_type:
-            conditions.append(Feed.type == feed_type)
-        if category:
-            conditions.append(Feed.category == category)
-
-        stmt = (
-            select(Feed)
-            .where(and_(*conditions))
-            .order_by(desc(Feed.priority), Feed.name)
+        result = await session.execute(
+            _ENABLED_FEEDS_STMT,
+            {"feed_type": feed_type, "category": category}
         )
-
-        result = await session.execute(stmt)
         rows = result.scalars().all()
 
         feeds = []
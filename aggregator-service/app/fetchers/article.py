@@ -0,0 +1,174 @@
+"""
+Standardized Article Shape
+
+Every fetcher converts source items into the same flat dict so the analyzers
+(deduplicator, hot scorer, keyword extractor) can treat them uniformly.
+"""
+
+import html
+import re
+import time
+import orjson
+from typing import NotRequired, Optional, Sequence, TypedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Same output as datetime(..., tzinfo=timezone.utc).isoformat() for whole seconds
+_ISO_UTC_FORMAT = "%04d-%02d-%02dT%02d:%02d:%02d+00:00"
+
+# Query parameters that only track the referrer (utm_* is matched by prefix;
+# Medium feed links carry ?source=...)
+_TRACKING_PARAMS = frozenset({"source"})
+
+# Precompiled patterns for feed summary cleaning
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+
+class StandardArticle(TypedDict):
+    """Standardized article returned by the API fetchers"""
+
+    id: str
+    title: str
+    url: str
+    text: str
+    score: int
+    author: str
+    comments: int
+    published_at: Optional[str]
+    source: str
+    source_id: str
+    image_url: NotRequired[Optional[str]]
+
+
+def iso_utc(timestamp: float) -> str:
+    """
+    Format a Unix timestamp as an ISO-8601 UTC string (whole seconds)
+
+    Avoids building a timezone-aware datetime per article.
+
+    Args:
+        timestamp: Seconds since the epoch
+
+    Returns:
+        ISO-8601 string, e.g. "2024-01-01T12:00:00+00:00"
+    """
+    return _ISO_UTC_FORMAT % time.gmtime(int(timestamp))[:6]
+
+
+def iso_utc_from_struct(parsed: Sequence[int]) -> str:
+    """
+    Format a UTC time tuple (e.g. feedparser's published_parsed) as ISO-8601
+
+    Args:
+        parsed: time.struct_time or tuple starting (year, month, day, hour, minute, second)
+
+    Returns:
+        ISO-8601 string, e.g. "2024-01-01T12:00:00+00:00"
+    """
+    return _ISO_UTC_FORMAT % tuple(parsed[:6])
+
+
+def clean_summary(summary_html: str, max_length: int = 300) -> str:
+    """
+    Clean an HTML feed summary into short plain text
+
+    Strips tags, decodes entities and collapses whitespace.
+
+    Args:
+        summary_html: Summary from a feed entry
+        max_length: Maximum length of the returned text
+
+    Returns:
+        Plain-text summary
+    """
+    text = _TAG_RE.sub(" ", summary_html) if "<" in summary_html else summary_html
+    if "&" in text:
+        text = html.unescape(text)
+    return _WS_RE.sub(" ", text).strip()[:max_length]
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalize an article URL for duplicate detection
+
+    Lowercases the scheme and host, drops the fragment, tracking parameters
+    (utm_*, source) and any trailing slash.
+
+    Args:
+        url: Article URL
+
+    Returns:
+        Canonical form of the URL
+    """
+    parts = urlsplit(url.strip())
+    query = parts.query
+    if "utm_" in query or "source=" in query:
+        query = urlencode([
+            (key, value) for key, value in parse_qsl(query, keep_blank_values=True)
+            if not key.startswith("utm_") and key not in _TRACKING_PARAMS
+        ])
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip("/"),
+        query,
+        ""
+    ))
+
+
+def dedupe_by_url(articles: Sequence[dict]) -> list:
+    """
+    Drop articles whose canonical URL was already seen, keeping the first
+
+    Articles without a URL can't be compared, so they are always kept.
+
+    Args:
+        articles: Standardized articles
+
+    Returns:
+        Articles with unique canonical URLs, in original order
+    """
+    seen = set()
+    unique = []
+    for article in articles:
+        url = article.get("url")
+        if not url:
+            unique.append(article)
+            continue
+        key = canonical_url(url)
+        if key not in seen:
+            seen.add(key)
+            unique.append(article)
+    return unique
+
+
+def copy_articles(articles: Sequence[dict]) -> list:
+    """
+    Shallow-copy cached articles before handing them to a caller
+
+    Scoring and the API routes add fields to articles in place, so a cache
+    must never return its own dicts.
+
+    Args:
+        articles: Standardized articles held by a cache
+
+    Returns:
+        New list of new article dicts
+    """
+    return [dict(article) for article in articles]
+
+
+def to_json_bytes(articles: Sequence[dict]) -> bytes:
+    """
+    Encode standardized articles as JSON with orjson
+
+    Standardized articles only hold str/int/None values (timestamps are
+    already ISO strings), so they always serialize without a default hook.
+
+    Args:
+        articles: Standardized articles
+
+    Returns:
+        UTF-8 encoded JSON array
+    """
+    return orjson.dumps(articles)
@@ -152,37 +152,39 @@ class DiscoveryFetcher:
         Returns:
             List of matching authors/publications
         """
-        results = []
+        platform_limit = limit // 2 if platform == "all" else limit
+
+        # Search both platforms concurrently
+        platforms = []
+        tasks = []
 
         if platform in ["all", "substack"]:
-            try:
-                substack_results = await self.substack.search_publications(
-                    query,
-                    limit=limit // 2 if platform == "all" else limit
-                )
-                results.extend(substack_results)
-            except Exception as e:
-                logger.warning("substack_search_error", error=str(e))
+            platforms.append("substack")
+            tasks.append(self.substack.search_publications(query, limit=platform_limit))
 
         if platform in ["all", "medium"]:
-            try:
-                medium_results = await self.medium.search_authors(
-                    query,
-                    limit=limit // 2 if platform == "all" else limit
-                )
-                results.extend(medium_results)
-            except Exception as e:
-                logger.warning("medium_search_error", error=str(e))
-
-        # Sort by relevance (exact matches first)
+            platforms.append("medium")
+            tasks.append(self.medium.search_authors(query, limit=platform_limit))
+
+        platform_results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        results = []
+        for platform_name, result in zip(platforms, platform_results):
+            if isinstance(result, list):
+                results.extend(result)
+            elif isinstance(result, Exception):
+                logger.warning(f"{platform_name}_search_error", error=str(result))
+
+        # Sort by relevance (exact matches first), lowercasing each name once
         query_lower = query.lower()
-        results.sort(key=lambda x: (
-            0 if query_lower == x.get("name", "").lower() else
-            1 if query_lower in x.get("name", "").lower() else
-            2
-        ))
+        ranked = []
+        for result in results:
+            name_lower = result.get("name", "").lower()
+            relevance = 0 if query_lower == name_lower else 1 if query_lower in name_lower else 2
+            ranked.append((relevance, result))
+        ranked.sort(key=lambda x: x[0])
 
-        return results[:limit]
+        return [result for _, result in ranked[:limit]]
 
     def _rank_articles(self, articles: List[Dict]) -> List[Dict]:
         """
@@ -0,0 +1,179 @@
+"""
+Feed Parsing Helpers
+
+Shared by the RSS and discovery fetchers. Well-formed RSS 2.0 and Atom
+feeds are parsed with lxml into feedparser-style entries; callers fall back
+to the feedparser library when fast_parse returns None.
+"""
+
+import feedparser
+import httpx
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from itertools import islice
+from typing import Callable, List, Optional, Tuple
+from lxml import etree
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+DC_CREATOR = "{http://purl.org/dc/elements/1.1/}creator"
+CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+
+# Entry selectors compiled once at import rather than per feed
+_RSS_ITEMS = etree.XPath("channel/item")
+_ATOM_ENTRIES = etree.ETXPath(f"{ATOM_NS}entry")
+
+
+async def read_feed(
+    response: httpx.Response,
+    limit: Optional[int] = None
+) -> Tuple[bytes, Optional[List[etree._Element]]]:
+    """
+    Download a streamed feed body, stopping once `limit` entries are complete
+
+    Chunks are pushed into an lxml pull parser as they arrive, so a feed
+    with hundreds of entries is not downloaded in full for a limit of 10.
+
+    Args:
+        response: Streaming response
+        limit: Maximum number of entries needed
+
+    Returns:
+        Tuple of (body read so far, the first `limit` RSS/Atom entry elements
+        or None if the whole body was read and still needs parsing)
+    """
+    body = bytearray()
+    pull = None
+    if limit:
+        pull = etree.XMLPullParser(
+            events=("end",),
+            tag=("item", f"{ATOM_NS}entry"),
+            resolve_entities=False,
+            no_network=True
+        )
+    items = []
+
+    async for chunk in response.aiter_bytes():
+        body += chunk
+        if pull is None:
+            continue
+        try:
+            pull.feed(chunk)
+        except etree.XMLSyntaxError:
+            # Leave malformed feeds to the full parsers
+            pull = None
+            continue
+        items.extend(element for _, element in pull.read_events())
+        if len(items) >= limit:
+            return bytes(body), items[:limit]
+
+    return bytes(body), None
+
+
+def fast_parse(
+    content: bytes,
+    limit: Optional[int] = None
+) -> Optional[List[feedparser.FeedParserDict]]:
+    """
+    Parse a well-formed RSS 2.0 or Atom feed with lxml
+
+    Produces feedparser-style entries so callers can standardize entries
+    from either parser the same way.
+
+    Args:
+        content: Raw feed body
+        limit: Maximum number of entries to extract
+
+    Returns:
+        List of entries, or None if feedparser should handle this feed
+    """
+    try:
+        parser = etree.XMLParser(resolve_entities=False, no_network=True)
+        root = etree.fromstring(content, parser)
+    except (etree.XMLSyntaxError, ValueError):
+        return None
+
+    if root.tag == "rss":
+        items, extract = _RSS_ITEMS(root), rss_entry
+    elif root.tag == f"{ATOM_NS}feed":
+        items, extract = _ATOM_ENTRIES(root), atom_entry
+    else:
+        return None
+
+    entries = [extract(item) for item in islice(items, limit)]
+    return entries or None
+
+
+def rss_entry(item: etree._Element) -> feedparser.FeedParserDict:
+    """Extract a feedparser-style entry from an RSS <item>"""
+    entry = feedparser.FeedParserDict()
+    entry["title"] = item.findtext("title") or ""
+    entry["link"] = (item.findtext("link") or "").strip()
+
+    guid = item.findtext("guid")
+    if guid:
+        entry["id"] = guid.strip()
+
+    summary = item.findtext("description")
+    if summary is not None:
+        entry["summary"] = summary
+
+    encoded = item.findtext(CONTENT_ENCODED)
+    if encoded:
+        entry["content"] = [{"value": encoded}]
+
+    author = item.findtext(DC_CREATOR) or item.findtext("author")
+    if author:
+        entry["author"] = author.strip()
+
+    _set_published(entry, item.findtext("pubDate"), parsedate_to_datetime)
+    return entry
+
+
+def atom_entry(item: etree._Element) -> feedparser.FeedParserDict:
+    """Extract a feedparser-style entry from an Atom <entry>"""
+    entry = feedparser.FeedParserDict()
+    entry["title"] = item.findtext(f"{ATOM_NS}title") or ""
+    entry["link"] = ""
+    for link in item.iterfind(f"{ATOM_NS}link"):
+        if link.get("rel", "alternate") == "alternate":
+            entry["link"] = link.get("href", "")
+            break
+
+    entry_id = item.findtext(f"{ATOM_NS}id")
+    if entry_id:
+        entry["id"] = entry_id.strip()
+
+    summary = item.findtext(f"{ATOM_NS}summary")
+    if summary is not None:
+        entry["summary"] = summary
+
+    content = item.findtext(f"{ATOM_NS}content")
+    if content:
+        entry["content"] = [{"value": content}]
+
+    author = item.findtext(f"{ATOM_NS}author/{ATOM_NS}name")
+    if author:
+        entry["author"] = author.strip()
+
+    published = item.findtext(f"{ATOM_NS}published") or item.findtext(f"{ATOM_NS}updated")
+    _set_published(entry, published, datetime.fromisoformat)
+    return entry
+
+
+def _set_published(
+    entry: feedparser.FeedParserDict,
+    value: Optional[str],
+    parse: Callable[[str], datetime]
+) -> None:
+    """Store a UTC published_parsed time, or the raw string if unparseable"""
+    if not value:
+        return
+    try:
+        published = parse(value.strip())
+    except (TypeError, ValueError):
+        entry["published"] = value
+        return
+
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    entry["published_parsed"] = published.astimezone(timezone.utc).timetuple()
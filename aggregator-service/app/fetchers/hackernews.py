@@ -4,30 +4,68 @@ Hacker News Fetcher
 Fetches stories from Hacker News using the Firebase API.
 No rate limits, free to use.
 
+Small front-page requests are served by the HN Algolia search API, which
+returns full story payloads in a single response.
+
 API Docs: https://github.com/HackerNews/API
+Algolia API Docs: https://hn.algolia.com/api
 """
 
+import asyncio
 import httpx
+import orjson
 import structlog
-from datetime import datetime, timezone
+from cachetools import TTLCache
 from typing import List, Dict, Optional
 
+from .article import StandardArticle, iso_utc
+from .http_client import CircuitBreaker, get_shared_client, retry_transient
+
 logger = structlog.get_logger()
 
 BASE_URL = "https://hacker-news.firebaseio.com/v0"
+ALGOLIA_URL = "https://hn.algolia.com/api/v1"
+
+# The Algolia front_page tag only covers the current front page
+ALGOLIA_FRONT_PAGE_SIZE = 30
+
+# Maximum concurrent item requests per fetcher
+MAX_CONCURRENT_FETCHES = 20
+
+# Cache TTLs (seconds): story lists change slowly, items are near-immutable
+STORY_IDS_CACHE_TTL = 600
+ITEM_CACHE_TTL = 3600
+
+# How long a known-low score lets us skip re-fetching a story (seconds)
+SCORE_CACHE_TTL = 600
 
 
 class HackerNewsFetcher:
     """Fetches content from Hacker News"""
 
-    def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0)
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            client: Externally managed HTTP client (default: the shared client)
+        """
+        self._client = client
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        self._ids_cache = TTLCache(maxsize=4, ttl=STORY_IDS_CACHE_TTL)
+        self._item_cache = TTLCache(maxsize=5000, ttl=ITEM_CACHE_TTL)
+        self._circuit = CircuitBreaker()
+        # story_id -> last known score, kept across aggregation runs
+        self._score_cache = TTLCache(maxsize=5000, ttl=SCORE_CACHE_TTL)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client, resolved per use so a closed shared client is replaced"""
+        return self._client or get_shared_client()
 
     async def fetch_top_stories(
         self,
         limit: int = 100,
         min_score: Optional[int] = None
-    ) -> List[Dict]:
+    ) -> List[StandardArticle]:
         """
         Fetch top stories from Hacker News
 
@@ -38,22 +76,29 @@ class HackerNewsFetcher:
         Returns:
             List of story dictionaries with standardized format
         """
+        if self._circuit.is_open:
+            logger.warning("hn_circuit_open", reason="Too many recent request failures")
+            return []
+
+        # One Algolia request replaces N item fetches when the front page
+        # can satisfy the limit; otherwise use the Firebase top-500 list
+        if limit <= ALGOLIA_FRONT_PAGE_SIZE:
+            stories = await self._fetch_via_algolia(limit)
+            if stories is not None:
+                return [
+                    story for story in stories
+                    if min_score is None or story["score"] >= min_score
+                ]
+
         try:
             # Get list of top story IDs
-            response = await self.client.get(f"{BASE_URL}/topstories.json")
-            response.raise_for_status()
-            story_ids = response.json()[:limit]
+            story_ids = (await self._fetch_story_ids("topstories"))[:limit]
 
             logger.info("fetched_hn_story_ids", count=len(story_ids))
 
-            # Fetch individual stories
-            stories = []
-            for story_id in story_ids:
-                story = await self._fetch_story(story_id)
-                if story:
-                    # Filter by minimum score if specified
-                    if min_score is None or story.get("score", 0) >= min_score:
-                        stories.append(story)
+            # Fetch individual stories concurrently, filtering by minimum
+            # score before standardizing
+            stories = await self._fetch_stories(story_ids, min_score=min_score)
 
             logger.info(
                 "fetched_hn_stories",
@@ -67,7 +112,7 @@ class HackerNewsFetcher:
             logger.error("hn_fetch_failed", error=str(e))
             return []
 
-    async def fetch_best_stories(self, limit: int = 100) -> List[Dict]:
+    async def fetch_best_stories(self, limit: int = 100) -> List[StandardArticle]:
         """
         Fetch best stories from Hacker News
 
@@ -78,15 +123,9 @@ class HackerNewsFetcher:
             List of story dictionaries
         """
         try:
-            response = await self.client.get(f"{BASE_URL}/beststories.json")
-            response.raise_for_status()
-            story_ids = response.json()[:limit]
+            story_ids = (await self._fetch_story_ids("beststories"))[:limit]
 
-            stories = []
-            for story_id in story_ids:
-                story = await self._fetch_story(story_id)
-                if story:
-                    stories.append(story)
+            stories = await self._fetch_stories(story_ids)
 
             logger.info("fetched_hn_best_stories", count=len(stories))
             return stories
@@ -95,53 +134,193 @@ class HackerNewsFetcher:
             logger.error("hn_best_fetch_failed", error=str(e))
             return []
 
-    async def _fetch_story(self, story_id: int) -> Optional[Dict]:
+    async def _fetch_via_algolia(self, limit: int) -> Optional[List[StandardArticle]]:
         """
-        Fetch individual story details
+        Fetch front page stories in a single request via the Algolia API
 
         Args:
-            story_id: Hacker News story ID
+            limit: Maximum number of stories to fetch
 
         Returns:
-            Standardized story dictionary or None if failed
+            Standardized stories in front page order, or None if the request failed
         """
         try:
-            response = await self.client.get(f"{BASE_URL}/item/{story_id}.json")
+            response = await self.client.get(
+                f"{ALGOLIA_URL}/search",
+                params={"tags": "front_page", "hitsPerPage": limit}
+            )
             response.raise_for_status()
-            item = response.json()
-
-            # Skip if not a story or deleted
-            if not item or item.get("type") != "story" or item.get("deleted"):
-                return None
-
-            # Return standardized format
-            return {
-                "id": str(item.get("id")),
-                "title": item.get("title", ""),
-                "url": item.get("url", f"https://news.ycombinator.com/item?id={item.get('id')}"),
-                "text": item.get("text", ""),  # For Ask HN posts
-                "score": item.get("score", 0),
-                "author": item.get("by", ""),
-                "comments": item.get("descendants", 0),
-                "published_at": datetime.fromtimestamp(
-                    item.get("time", 0),
-                    tz=timezone.utc
-                ).isoformat(),
+            hits = orjson.loads(response.content).get("hits", [])
+        except Exception as e:
+            self._circuit.record(False)
+            logger.warning("hn_algolia_fetch_failed", error=str(e))
+            return None
+        self._circuit.record(True)
+
+        stories = []
+        for hit in hits[:limit]:
+            story_id = hit.get("objectID")
+            stories.append({
+                "id": str(story_id),
+                "title": hit.get("title") or "",
+                "url": hit.get("url") or f"https://news.ycombinator.com/item?id={story_id}",
+                "text": hit.get("story_text") or "",
+                "score": hit.get("points") or 0,
+                "author": hit.get("author") or "",
+                "comments": hit.get("num_comments") or 0,
+                "published_at": iso_utc(hit.get("created_at_i") or 0),
                 "source": "HackerNews",
                 "source_id": str(story_id)
-            }
+            })
+
+        logger.info("fetched_hn_algolia_stories", count=len(stories))
+        return stories
+
+    async def _fetch_story_ids(self, listing: str) -> List[int]:
+        """
+        Fetch a story ID listing, served from cache within STORY_IDS_CACHE_TTL
+
+        Args:
+            listing: Listing endpoint name ("topstories", "beststories")
+
+        Returns:
+            List of story IDs
+        """
+        if listing in self._ids_cache:
+            return list(self._ids_cache[listing])
+
+        response = await self.client.get(f"{BASE_URL}/{listing}.json")
+        response.raise_for_status()
+        story_ids = orjson.loads(response.content)
+
+        self._ids_cache[listing] = story_ids
+        return list(story_ids)
+
+    async def _fetch_stories(
+        self,
+        story_ids: List[int],
+        min_score: Optional[int] = None
+    ) -> List[StandardArticle]:
+        """
+        Fetch multiple stories concurrently, bounded by the fetcher semaphore
+
+        Raw items are filtered by score before standardizing, so skipped
+        stories never pay for date formatting and dict construction. Stories
+        recently seen below min_score are skipped without a request.
+
+        Args:
+            story_ids: Hacker News story IDs
+            min_score: Minimum score (points) required (optional filter)
+
+        Returns:
+            Standardized stories in the same order as story_ids (failures dropped)
+        """
+        if min_score is not None:
+            score_cache = self._score_cache
+            story_ids = [
+                story_id for story_id in story_ids
+                if score_cache.get(story_id, min_score) >= min_score
+            ]
+
+        items = await asyncio.gather(
+            *[self._bounded_fetch_item(story_id) for story_id in story_ids],
+            return_exceptions=True
+        )
+
+        for story_id, item in zip(story_ids, items):
+            if isinstance(item, dict):
+                self._score_cache[story_id] = item.get("score", 0)
+
+        return [
+            self._standardize_item(item)
+            for item in items
+            if isinstance(item, dict)
+            and (min_score is None or item.get("score", 0) >= min_score)
+        ]
+
+    async def _bounded_fetch_item(self, story_id: int) -> Optional[Dict]:
+        """Fetch a raw item while holding a concurrency slot"""
+        async with self._semaphore:
+            return await self._fetch_item_raw(story_id)
+
+    async def _fetch_story(self, story_id: int) -> Optional[StandardArticle]:
+        """
+        Fetch individual story details
+
+        Args:
+            story_id: Hacker News story ID
+
+        Returns:
+            Standardized story dictionary or None if failed
+        """
+        item = await self._fetch_item_raw(story_id)
+        return self._standardize_item(item) if item else None
+
+    async def _fetch_item_raw(self, story_id: int) -> Optional[Dict]:
+        """
+        Fetch a raw story item, served from cache within ITEM_CACHE_TTL
+
+        Args:
+            story_id: Hacker News story ID
 
+        Returns:
+            Raw item JSON, or None if failed, deleted, or not a story
+        """
+        if story_id in self._item_cache:
+            return self._item_cache[story_id]
+
+        try:
+            item = await self._get_item(story_id)
         except Exception as e:
+            self._circuit.record(False)
             logger.warning("hn_story_fetch_failed", story_id=story_id, error=str(e))
             return None
+        self._circuit.record(True)
+
+        # Skip if not a story or deleted (cached so it isn't re-fetched)
+        if not item or item.get("type") != "story" or item.get("deleted"):
+            item = None
+
+        self._item_cache[story_id] = item
+        return item
+
+    @retry_transient
+    async def _get_item(self, story_id: int) -> Optional[Dict]:
+        """Request a raw item, retrying timeouts and 5xx responses"""
+        response = await self.client.get(f"{BASE_URL}/item/{story_id}.json")
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    @staticmethod
+    def _standardize_item(item: Dict) -> StandardArticle:
+        """
+        Convert a raw story item to standardized format
+
+        Args:
+            item: Raw Hacker News item JSON
+
+        Returns:
+            Standardized story dictionary
+        """
+        return {
+            "id": str(item.get("id")),
+            "title": item.get("title", ""),
+            "url": item.get("url", f"https://news.ycombinator.com/item?id={item.get('id')}"),
+            "text": item.get("text", ""),  # For Ask HN posts
+            "score": item.get("score", 0),
+            "author": item.get("by", ""),
+            "comments": item.get("descendants", 0),
+            "published_at": iso_utc(item.get("time", 0)),
+            "source": "HackerNews",
+            "source_id": str(item.get("id"))
+        }
 
     async def close(self):
-        """Close the HTTP client"""
-        await self.client.aclose()
+        """Release the fetcher (the shared HTTP client is closed on app shutdown)"""
 
 
 # Convenience function for quick fetching
-async def fetch_trending_hn(min_score: int = 50, limit: int = 100) -> List[Dict]:
+async def fetch_trending_hn(min_score: int = 50, limit: int = 100) -> List[StandardArticle]:
     """
     Fetch trending stories from Hacker News
 
@@ -152,9 +331,16 @@ async def fetch_trending_hn(min_score: int = 50, limit: int = 100) -> List[Dict]
     Returns:
         List of trending stories
     """
-    fetcher = HackerNewsFetcher()
-    try:
-        stories = await fetcher.fetch_top_stories(limit=limit, min_score=min_score)
-        return stories
-    finally:
-        await fetcher.close()
+    return await _get_fetcher().fetch_top_stories(limit=limit, min_score=min_score)
+
+
+# Module-level fetcher so its caches persist across aggregation runs
+_fetcher: Optional[HackerNewsFetcher] = None
+
+
+def _get_fetcher() -> HackerNewsFetcher:
+    """Get the module-level fetcher, creating it on first use"""
+    global _fetcher
+    if _fetcher is None:
+        _fetcher = HackerNewsFetcher()
+    return _fetcher
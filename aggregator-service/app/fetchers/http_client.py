@@ -0,0 +1,154 @@
+"""
+Shared HTTP client configuration for fetchers
+
+Fetchers hit a single host (Firebase, NewsAPI, RapidAPI) many times in a
+burst, so clients use HTTP/2 multiplexing and a tuned keep-alive pool to
+avoid repeated TCP/TLS handshakes. The API fetchers share one process-wide
+client so they also share a connection pool and TLS session cache.
+
+Transient upstream failures (timeouts, 5xx) are retried with exponential
+jitter, and a CircuitBreaker lets fetchers stop issuing requests while an
+upstream is mostly failing.
+"""
+
+import time
+from collections import deque
+from typing import Optional
+
+import httpx
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=64,
+    keepalive_expiry=30.0,
+)
+
+
+def create_client(**kwargs) -> httpx.AsyncClient:
+    """
+    Create an HTTP/2 AsyncClient with the shared timeout and pool limits
+
+    Args:
+        **kwargs: Extra httpx.AsyncClient options (headers, follow_redirects, ...)
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    kwargs.setdefault("limits", DEFAULT_LIMITS)
+    return httpx.AsyncClient(http2=True, **kwargs)
+
+
+# Pool limits for the process-wide client shared by all API fetchers
+SHARED_LIMITS = httpx.Limits(
+    max_keepalive_connections=64,
+    max_connections=128,
+    keepalive_expiry=60.0,
+)
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client, creating it on first use
+
+    Fetchers must not close this client; it is closed on app shutdown via
+    close_shared_client().
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = create_client(limits=SHARED_LIMITS)
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the process-wide HTTP client if it was created"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """
+    Check whether a request failure is worth retrying
+
+    Args:
+        exc: Exception raised by the request
+
+    Returns:
+        True for timeouts and 5xx responses
+    """
+    if isinstance(exc, httpx.TimeoutException):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return False
+
+
+# Retry transient failures up to 3 attempts with jittered backoff (max 4s)
+retry_transient = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=0.5, max=4),
+    retry=retry_if_exception(is_transient_error),
+    reraise=True,
+)
+
+
+class CircuitBreaker:
+    """
+    Failure-ratio circuit breaker over a sliding window of recent requests
+
+    The breaker opens once more than failure_ratio of the last window
+    requests failed, and resets after reset_after seconds so the upstream
+    is probed again.
+    """
+
+    def __init__(
+        self,
+        window: int = 50,
+        failure_ratio: float = 0.5,
+        min_samples: int = 10,
+        reset_after: float = 60.0
+    ):
+        self._failure_window = deque(maxlen=window)
+        self.failure_ratio = failure_ratio
+        self.min_samples = min_samples
+        self.reset_after = reset_after
+        self._opened_at: Optional[float] = None
+
+    def record(self, success: bool) -> None:
+        """Record the outcome of a request"""
+        self._failure_window.append(0 if success else 1)
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests should be short-circuited"""
+        samples = len(self._failure_window)
+        if samples < self.min_samples:
+            return False
+        if sum(self._failure_window) / samples <= self.failure_ratio:
+            self._opened_at = None
+            return False
+
+        now = time.monotonic()
+        if self._opened_at is None:
+            self._opened_at = now
+        elif now - self._opened_at >= self.reset_after:
+            # Half-open: forget the window and let requests through again
+            self._failure_window.clear()
+            self._opened_at = None
+            return False
+        return True
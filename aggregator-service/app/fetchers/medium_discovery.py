@@ -5,12 +5,19 @@ Fetches trending articles from Medium using the RapidAPI Medium2 endpoint.
 Also supports RSS fallback for specific author feeds.
 """
 
+import feedparser
 import httpx
 import structlog
+import orjson
 import os
 from datetime import datetime
 from typing import List, Dict, Optional
 import asyncio
+from operator import itemgetter
+from dateutil import parser as date_parser
+
+from .article import clean_summary, dedupe_by_url
+from .http_client import get_shared_client
 
 logger = structlog.get_logger()
 
@@ -42,6 +49,20 @@ POPULAR_MEDIUM_AUTHORS = {
     ],
 }
 
+# Normalized author index for the curated-list search fallback:
+# (username_lower, name_lower, category, author)
+_AUTHOR_INDEX = [
+    (author["username"].lower(), author["name"].lower(), category, author)
+    for category, authors in POPULAR_MEDIUM_AUTHORS.items()
+    for author in authors
+]
+
+# Exact handle lookup (reversed so the first category listed wins)
+_AUTHOR_BY_HANDLE = {entry[0]: entry for entry in reversed(_AUTHOR_INDEX)}
+
+# Maximum concurrent article detail requests per tag fetch
+MAX_CONCURRENT_FETCHES = 20
+
 # Trending tags to explore
 TRENDING_TAGS = [
     "programming", "technology", "artificial-intelligence",
@@ -64,6 +85,11 @@ class MediumDiscoveryFetcher:
                 "X-RapidAPI-Host": "medium2.p.rapidapi.com"
             }
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, resolved per use so a closed one is replaced"""
+        return get_shared_client()
+
     def is_api_available(self) -> bool:
         """Check if RapidAPI key is configured"""
         return bool(self.api_key)
@@ -88,37 +114,42 @@ class MediumDiscoveryFetcher:
             return []
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # Fetch trending articles for tag
-                response = await client.get(
-                    f"{self.RAPIDAPI_BASE_URL}/topfeeds/{tag}/hot",
-                    headers=self.headers
-                )
+            # Fetch trending articles for tag
+            response = await self.client.get(
+                f"{self.RAPIDAPI_BASE_URL}/topfeeds/{tag}/hot",
+                headers=self.headers
+            )
 
-                if response.status_code != 200:
-                    logger.warning(
-                        "medium_api_error",
-                        tag=tag,
-                        status=response.status_code
-                    )
-                    return []
-
-                data = response.json()
-                article_ids = data.get("topfeeds", [])[:limit]
-
-                # Fetch article details for each ID
-                articles = []
-                for article_id in article_ids:
-                    article = await self._fetch_article_details(client, article_id)
-                    if article:
-                        articles.append(article)
-
-                logger.info(
-                    "fetched_medium_trending",
+            if response.status_code != 200:
+                logger.warning(
+                    "medium_api_error",
                     tag=tag,
-                    count=len(articles)
+                    status=response.status_code
                 )
-                return articles
+                return []
+
+            data = orjson.loads(response.content)
+            article_ids = data.get("topfeeds", [])[:limit]
+
+            # Fetch article details concurrently, bounded by a semaphore
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+            async def bounded_fetch(article_id: str) -> Optional[Dict]:
+                async with semaphore:
+                    return await self._fetch_article_details(self.client, article_id)
+
+            results = await asyncio.gather(
+                *[bounded_fetch(article_id) for article_id in article_ids],
+                return_exceptions=True
+            )
+            articles = [article for article in results if isinstance(article, dict)]
+
+            logger.info(
+                "fetched_medium_trending",
+                tag=tag,
+                count=len(articles)
+            )
+            return articles
 
         except Exception as e:
             logger.error(
@@ -143,7 +174,7 @@ class MediumDiscoveryFetcher:
             if response.status_code != 200:
                 return None
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             return {
                 "title": data.get("title", "Untitled"),
@@ -183,40 +214,39 @@ class MediumDiscoveryFetcher:
             List of articles
         """
         try:
-            import feedparser
-
             feed_url = f"https://medium.com/feed/@{username}"
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(feed_url)
-                if response.status_code != 200:
-                    return []
-
-                feed = feedparser.parse(response.content)
-                articles = []
-
-                for entry in feed.entries[:limit]:
-                    articles.append({
-                        "title": entry.get("title", "Untitled"),
-                        "url": entry.get("link", ""),
-                        "author": display_name,
-                        "author_username": username,
-                        "source": f"medium:@{username}",
-                        "source_type": "medium",
-                        "published_at": self._parse_feed_date(entry),
-                        "summary": self._clean_summary(entry.get("summary", "")),
-                        "claps": 0,  # RSS doesn't provide claps
-                        "engagement_score": 0,
-                        "type": "medium_discovery",
-                        "fallback": True,
-                    })
-
-                logger.info(
-                    "fetched_medium_author_rss",
-                    author=display_name,
-                    count=len(articles)
-                )
-                return articles
+            response = await self.client.get(feed_url)
+            if response.status_code != 200:
+                return []
+
+            # Parse off the event loop so concurrent author fetches keep progressing
+            feed = await asyncio.to_thread(feedparser.parse, response.content)
+            now_iso = datetime.utcnow().isoformat()
+            articles = []
+
+            for entry in feed.entries[:limit]:
+                articles.append({
+                    "title": entry.get("title", "Untitled"),
+                    "url": entry.get("link", ""),
+                    "author": display_name,
+                    "author_username": username,
+                    "source": f"medium:@{username}",
+                    "source_type": "medium",
+                    "published_at": self._parse_feed_date(entry, now_iso),
+                    "summary": clean_summary(entry.get("summary", "")),
+                    "claps": 0,  # RSS doesn't provide claps
+                    "engagement_score": 0,
+                    "type": "medium_discovery",
+                    "fallback": True,
+                })
+
+            logger.info(
+                "fetched_medium_author_rss",
+                author=display_name,
+                count=len(articles)
+            )
+            return articles
 
         except Exception as e:
             logger.error(
@@ -310,18 +340,21 @@ class MediumDiscoveryFetcher:
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Flatten and deduplicate
-        seen_urls = set()
-        all_articles = []
+        # Flatten and deduplicate by canonical URL (Medium RSS links carry
+        # ?source= tracking params that differ per feed)
+        articles = []
         for result in results:
             if isinstance(result, list):
                 for article in result:
-                    if article["url"] not in seen_urls:
-                        seen_urls.add(article["url"])
-                        all_articles.append(article)
+                    article.setdefault("engagement_score", 0)
+                    articles.append(article)
 
         # Sort by engagement
-        all_articles.sort(key=lambda x: x.get("engagement_score", 0), reverse=True)
+        all_articles = sorted(
+            dedupe_by_url(articles),
+            key=itemgetter("engagement_score"),
+            reverse=True
+        )
         return all_articles[:limit]
 
     async def search_authors(
@@ -343,58 +376,60 @@ class MediumDiscoveryFetcher:
         """
         if self.is_api_available():
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.get(
-                        f"{self.RAPIDAPI_BASE_URL}/search/users",
-                        params={"q": query},
-                        headers=self.headers
-                    )
-
-                    if response.status_code == 200:
-                        data = response.json()
-                        users = data.get("users", [])[:limit]
-
-                        return [
-                            {
-                                "name": user.get("fullname", user.get("username", "")),
-                                "platform": "medium",
-                                "handle": user.get("username", ""),
-                                "feed_url": f"https://medium.com/feed/@{user.get('username', '')}",
-                                "profile_url": f"https://medium.com/@{user.get('username', '')}",
-                                "description": user.get("bio", "")[:200],
-                                "follower_count": user.get("followers_count", 0),
-                            }
-                            for user in users
-                        ]
+                response = await self.client.get(
+                    f"{self.RAPIDAPI_BASE_URL}/search/users",
+                    params={"q": query},
+                    headers=self.headers
+                )
+
+                if response.status_code == 200:
+                    data = orjson.loads(response.content)
+                    users = data.get("users", [])[:limit]
+
+                    return [
+                        {
+                            "name": user.get("fullname", user.get("username", "")),
+                            "platform": "medium",
+                            "handle": user.get("username", ""),
+                            "feed_url": f"https://medium.com/feed/@{user.get('username', '')}",
+                            "profile_url": f"https://medium.com/@{user.get('username', '')}",
+                            "description": user.get("bio", "")[:200],
+                            "follower_count": user.get("followers_count", 0),
+                        }
+                        for user in users
+                    ]
             except Exception as e:
                 logger.error("medium_search_failed", error=str(e))
 
-        # Fallback: search curated list
+        # Fallback: search curated list (exact handle first, then substring scan)
         query_lower = query.lower()
-        matches = []
-
-        for category, authors in POPULAR_MEDIUM_AUTHORS.items():
-            for author in authors:
-                if query_lower in author["name"].lower() or query_lower in author["username"].lower():
-                    matches.append({
-                        "name": author["name"],
-                        "platform": "medium",
-                        "handle": author["username"],
-                        "feed_url": f"https://medium.com/feed/@{author['username']}",
-                        "profile_url": f"https://medium.com/@{author['username']}",
-                        "category": category,
-                        "description": f"Popular {category} publication on Medium",
-                    })
-
-        # Deduplicate
         seen = set()
         unique = []
-        for m in matches:
-            if m["handle"] not in seen:
-                seen.add(m["handle"])
-                unique.append(m)
 
-        return unique[:limit]
+        exact = _AUTHOR_BY_HANDLE.get(query_lower)
+        candidates = [exact] if exact else []
+        candidates.extend(
+            entry for entry in _AUTHOR_INDEX
+            if query_lower in entry[1] or query_lower in entry[0]
+        )
+
+        for _, _, category, author in candidates:
+            if author["username"] in seen:
+                continue
+            seen.add(author["username"])
+            unique.append({
+                "name": author["name"],
+                "platform": "medium",
+                "handle": author["username"],
+                "feed_url": f"https://medium.com/feed/@{author['username']}",
+                "profile_url": f"https://medium.com/@{author['username']}",
+                "category": category,
+                "description": f"Popular {category} publication on Medium",
+            })
+            if len(unique) >= limit:
+                break
+
+        return unique
 
     async def get_top_writers(self, tag: str = "technology") -> List[Dict]:
         """
@@ -429,17 +464,16 @@ class MediumDiscoveryFetcher:
             ]
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    f"{self.RAPIDAPI_BASE_URL}/top_writers/{tag}",
-                    headers=self.headers
-                )
+            response = await self.client.get(
+                f"{self.RAPIDAPI_BASE_URL}/top_writers/{tag}",
+                headers=self.headers
+            )
 
-                if response.status_code != 200:
-                    return []
+            if response.status_code != 200:
+                return []
 
-                data = response.json()
-                return data.get("top_writers", [])
+            data = orjson.loads(response.content)
+            return data.get("top_writers", [])
 
         except Exception as e:
             logger.error("medium_top_writers_failed", tag=tag, error=str(e))
@@ -456,27 +490,20 @@ class MediumDiscoveryFetcher:
         except Exception:
             return datetime.utcnow().isoformat()
 
-    def _parse_feed_date(self, entry: Dict) -> str:
-        """Parse date from RSS entry"""
-        from dateutil import parser as date_parser
-
+    def _parse_feed_date(self, entry: Dict, now_iso: Optional[str] = None) -> str:
+        """Parse date from RSS entry, falling back to now_iso (or the current time)"""
         for field in ["published", "updated", "created"]:
             if field in entry:
+                value = entry[field]
                 try:
-                    return date_parser.parse(entry[field]).isoformat()
+                    return datetime.fromisoformat(value.replace("Z", "+00:00")).isoformat()
+                except ValueError:
+                    pass
+                try:
+                    return date_parser.parse(value).isoformat()
                 except Exception:
                     continue
-        return datetime.utcnow().isoformat()
-
-    def _clean_summary(self, html: str) -> str:
-        """Clean HTML summary"""
-        from bs4 import BeautifulSoup
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-            text = soup.get_text(separator=" ", strip=True)
-            return text[:300]
-        except Exception:
-            return html[:300]
+        return now_iso or datetime.utcnow().isoformat()
 
 
 # Module-level convenience functions
@@ -7,30 +7,49 @@ Free tier: 100 requests/day, headlines only, 24-hour delayed data.
 API Docs: https://newsapi.org/docs
 """
 
+import asyncio
+import orjson
 import httpx
 import structlog
+from cachetools import TTLCache
 from datetime import datetime, timezone
 from typing import List, Dict, Optional
 from dateutil import parser as date_parser
 
+from .article import StandardArticle, copy_articles
+from .http_client import CircuitBreaker, get_shared_client
+
 logger = structlog.get_logger()
 
 BASE_URL = "https://newsapi.org/v2"
 
+# Headline cache TTL (seconds) - keeps repeat fetches under the free-tier quota
+HEADLINES_CACHE_TTL = 900
+
+# One breaker for the NewsAPI upstream, shared by every fetcher instance so
+# failures accumulate across aggregation runs (one run is below min_samples)
+_circuit = CircuitBreaker()
+
 
 class NewsAPIFetcher:
     """Fetches content from NewsAPI.org"""
 
     def __init__(self, api_key: str):
         self.api_key = api_key
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self._headlines_cache = TTLCache(maxsize=32, ttl=HEADLINES_CACHE_TTL)
+        self._circuit = _circuit
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, resolved per use so a closed one is replaced"""
+        return get_shared_client()
 
     async def fetch_top_headlines(
         self,
         category: Optional[str] = None,
         country: str = "us",
         limit: int = 100
-    ) -> List[Dict]:
+    ) -> List[StandardArticle]:
         """
         Fetch top headlines from NewsAPI
 
@@ -42,6 +61,15 @@ class NewsAPIFetcher:
         Returns:
             List of article dictionaries with standardized format
         """
+        cache_key = (category, country, limit)
+        # Cached articles are copied out, since callers add fields in place
+        if cache_key in self._headlines_cache:
+            return copy_articles(self._headlines_cache[cache_key])
+
+        if self._circuit.is_open:
+            logger.warning("newsapi_circuit_open", reason="Too many recent request failures")
+            return []
+
         try:
             params = {
                 "apiKey": self.api_key,
@@ -51,20 +79,29 @@ class NewsAPIFetcher:
             if category:
                 params["category"] = category
 
-            response = await self.client.get(
-                f"{BASE_URL}/top-headlines",
-                params=params
-            )
-            response.raise_for_status()
-            data = response.json()
+            try:
+                data = await self._get_json("top-headlines", params)
+            except httpx.HTTPStatusError as e:
+                # A bad key (401) or exhausted quota (429) is not an upstream
+                # outage, so only 5xx responses count against the breaker
+                if e.response.status_code >= 500:
+                    self._circuit.record(False)
+                raise
+            except Exception:
+                self._circuit.record(False)
+                raise
+            self._circuit.record(True)
 
             if data.get("status") != "ok":
                 logger.error("newsapi_error", message=data.get("message"))
                 return []
 
+            # Fallback timestamp shared by every article in this batch
+            now_iso = datetime.now(timezone.utc).isoformat()
+
             articles = []
             for article in data.get("articles", []):
-                standardized = self._standardize_article(article)
+                standardized = self._standardize_article(article, now_iso)
                 if standardized:
                     articles.append(standardized)
 
@@ -75,7 +112,8 @@ class NewsAPIFetcher:
                 country=country
             )
 
-            return articles
+            self._headlines_cache[cache_key] = articles
+            return copy_articles(articles)
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
@@ -96,7 +134,7 @@ class NewsAPIFetcher:
         to_date: Optional[str] = None,
         sort_by: str = "publishedAt",
         limit: int = 100
-    ) -> List[Dict]:
+    ) -> List[StandardArticle]:
         """
         Search all articles (requires paid plan for recent articles)
 
@@ -123,20 +161,18 @@ class NewsAPIFetcher:
             if to_date:
                 params["to"] = to_date
 
-            response = await self.client.get(
-                f"{BASE_URL}/everything",
-                params=params
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_json("everything", params)
 
             if data.get("status") != "ok":
                 logger.error("newsapi_error", message=data.get("message"))
                 return []
 
+            # Fallback timestamp shared by every article in this batch
+            now_iso = datetime.now(timezone.utc).isoformat()
+
             articles = []
             for article in data.get("articles", []):
-                standardized = self._standardize_article(article)
+                standardized = self._standardize_article(article, now_iso)
                 if standardized:
                     articles.append(standardized)
 
@@ -152,12 +188,27 @@ class NewsAPIFetcher:
             logger.error("newsapi_everything_failed", error=str(e))
             return []
 
-    def _standardize_article(self, article: Dict) -> Optional[Dict]:
+    async def _get_json(self, endpoint: str, params: Dict) -> Dict:
+        """
+        Request an API endpoint once
+
+        Not retried: every attempt counts against the 100 requests/day quota.
+        """
+        response = await self.client.get(f"{BASE_URL}/{endpoint}", params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _standardize_article(
+        self,
+        article: Dict,
+        now_iso: Optional[str] = None
+    ) -> Optional[StandardArticle]:
         """
         Convert NewsAPI article to standardized format
 
         Args:
             article: Raw NewsAPI article
+            now_iso: Fallback timestamp for unparseable dates (computed once per batch)
 
         Returns:
             Standardized article dictionary or None if invalid
@@ -174,9 +225,15 @@ class NewsAPIFetcher:
         published_at = None
         if article.get("publishedAt"):
             try:
-                published_at = date_parser.parse(article["publishedAt"]).isoformat()
-            except Exception:
-                published_at = datetime.now(timezone.utc).isoformat()
+                # NewsAPI sends ISO-8601 ("...Z"); fall back to dateutil otherwise
+                published_at = datetime.fromisoformat(
+                    article["publishedAt"].replace("Z", "+00:00")
+                ).isoformat()
+            except ValueError:
+                try:
+                    published_at = date_parser.parse(article["publishedAt"]).isoformat()
+                except Exception:
+                    published_at = now_iso or datetime.now(timezone.utc).isoformat()
 
         # Get source name
         source_name = "NewsAPI"
@@ -198,8 +255,7 @@ class NewsAPIFetcher:
         }
 
     async def close(self):
-        """Close the HTTP client"""
-        await self.client.aclose()
+        """Release the fetcher (the shared HTTP client is closed on app shutdown)"""
 
 
 # Convenience function for quick fetching
@@ -207,7 +263,7 @@ async def fetch_trending_news(
     api_key: str,
     categories: Optional[List[str]] = None,
     limit_per_category: int = 20
-) -> List[Dict]:
+) -> List[StandardArticle]:
     """
     Fetch trending news across multiple categories
 
@@ -227,26 +283,34 @@ async def fetch_trending_news(
         # Default to tech-related categories
         categories = ["technology", "science", "business"]
 
-    fetcher = NewsAPIFetcher(api_key)
-    try:
-        all_articles = []
+    fetcher = _get_fetcher(api_key)
+
+    # Fetch all categories (plus general headlines) concurrently
+    results = await asyncio.gather(
+        *[
+            fetcher.fetch_top_headlines(category=category, limit=limit_per_category)
+            for category in [*categories, "general"]
+        ],
+        return_exceptions=True
+    )
+
+    all_articles = [
+        article
+        for result in results if isinstance(result, list)
+        for article in result
+    ]
+
+    logger.info("newsapi_fetch_complete", total=len(all_articles))
+    return all_articles
 
-        for category in categories:
-            articles = await fetcher.fetch_top_headlines(
-                category=category,
-                limit=limit_per_category
-            )
-            all_articles.extend(articles)
 
-        # Also fetch general headlines
-        general = await fetcher.fetch_top_headlines(
-            category="general",
-            limit=limit_per_category
-        )
-        all_articles.extend(general)
+# Module-level fetcher so its headline cache persists across aggregation runs
+_fetcher: Optional[NewsAPIFetcher] = None
 
-        logger.info("newsapi_fetch_complete", total=len(all_articles))
-        return all_articles
 
-    finally:
-        await fetcher.close()
+def _get_fetcher(api_key: str) -> NewsAPIFetcher:
+    """Get the module-level fetcher, creating it on first use or a new API key"""
+    global _fetcher
+    if _fetcher is None or _fetcher.api_key != api_key:
+        _fetcher = NewsAPIFetcher(api_key)
+    return _fetcher
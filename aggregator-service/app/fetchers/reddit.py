@@ -8,13 +8,26 @@ Fetches content from Reddit using OAuth for higher rate limits.
 API Docs: https://www.reddit.com/dev/api
 """
 
+import asyncio
+import time
 import praw
 import structlog
-from datetime import datetime, timezone
+from cachetools import TTLCache
 from typing import List, Dict, Optional
 
+from .article import copy_articles, dedupe_by_url, iso_utc
+
 logger = structlog.get_logger()
 
+# Concurrent subreddit requests, sized for the 60-100 req/min OAuth budget
+MAX_CONCURRENT_SUBREDDITS = 8
+
+# Pause requests until the quota window resets once fewer requests remain
+QUOTA_THRESHOLD = 5
+
+# Listing cache TTL (seconds) - identical queries within this window reuse posts
+LISTING_CACHE_TTL = 120
+
 
 class RedditFetcher:
     """Fetches content from Reddit using PRAW"""
@@ -37,6 +50,11 @@ class RedditFetcher:
         self.client_secret = client_secret
         self.user_agent = user_agent
         self.reddit = None
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUBREDDITS)
+        # Cleared while the Reddit quota is nearly exhausted
+        self._quota_ok = asyncio.Event()
+        self._quota_ok.set()
+        self._listing_cache = TTLCache(maxsize=512, ttl=LISTING_CACHE_TTL)
 
         # Initialize PRAW if credentials provided
         if client_id and client_secret:
@@ -68,23 +86,13 @@ class RedditFetcher:
         Returns:
             List of post dictionaries
         """
-        all_posts = []
-
-        for subreddit_name in subreddits:
-            try:
-                posts = await self._fetch_subreddit(
-                    subreddit_name,
-                    sort="hot",
-                    limit=limit,
-                    min_score=min_score
-                )
-                all_posts.extend(posts)
-            except Exception as e:
-                logger.error(
-                    "reddit_subreddit_fetch_failed",
-                    subreddit=subreddit_name,
-                    error=str(e)
-                )
+        all_posts = await self._fetch_subreddits(
+            subreddits,
+            "reddit_subreddit_fetch_failed",
+            sort="hot",
+            limit=limit,
+            min_score=min_score
+        )
 
         logger.info("fetched_reddit_posts", count=len(all_posts))
         return all_posts
@@ -108,24 +116,14 @@ class RedditFetcher:
         Returns:
             List of top posts
         """
-        all_posts = []
-
-        for subreddit_name in subreddits:
-            try:
-                posts = await self._fetch_subreddit(
-                    subreddit_name,
-                    sort="top",
-                    timeframe=timeframe,
-                    limit=limit,
-                    min_score=min_score
-                )
-                all_posts.extend(posts)
-            except Exception as e:
-                logger.error(
-                    "reddit_top_fetch_failed",
-                    subreddit=subreddit_name,
-                    error=str(e)
-                )
+        all_posts = await self._fetch_subreddits(
+            subreddits,
+            "reddit_top_fetch_failed",
+            sort="top",
+            timeframe=timeframe,
+            limit=limit,
+            min_score=min_score
+        )
 
         logger.info(
             "fetched_reddit_top_posts",
@@ -134,6 +132,38 @@ class RedditFetcher:
         )
         return all_posts
 
+    async def _fetch_subreddits(
+        self,
+        subreddits: List[str],
+        error_event: str,
+        **kwargs
+    ) -> List[Dict]:
+        """
+        Fetch several subreddits concurrently
+
+        Args:
+            subreddits: List of subreddit names
+            error_event: Log event name for a failed subreddit
+            **kwargs: Options passed to _fetch_subreddit (sort, timeframe, ...)
+
+        Returns:
+            Posts from all subreddits, deduplicated by URL
+        """
+        results = await asyncio.gather(
+            *[self._fetch_subreddit(name, **kwargs) for name in subreddits],
+            return_exceptions=True
+        )
+
+        all_posts = []
+        for subreddit_name, result in zip(subreddits, results):
+            if isinstance(result, Exception):
+                logger.error(error_event, subreddit=subreddit_name, error=str(result))
+            else:
+                all_posts.extend(result)
+
+        # Cross-posts share a link, so keep only the first subreddit's copy
+        return dedupe_by_url(all_posts)
+
     async def _fetch_subreddit(
         self,
         subreddit_name: str,
@@ -143,7 +173,10 @@ class RedditFetcher:
         min_score: Optional[int] = None
     ) -> List[Dict]:
         """
-        Fetch posts from a single subreddit
+        Fetch posts from a single subreddit without blocking the event loop
+
+        PRAW is synchronous, so the listing is fetched in a worker thread
+        while holding a concurrency slot.
 
         Args:
             subreddit_name: Subreddit name (without r/)
@@ -159,54 +192,119 @@ class RedditFetcher:
             logger.warning("reddit_client_not_initialized")
             return []
 
+        cache_key = (subreddit_name, sort, timeframe, limit, min_score)
+        if cache_key in self._listing_cache:
+            return copy_articles(self._listing_cache[cache_key])
+
+        await self._quota_ok.wait()
+        async with self._semaphore:
+            posts = await asyncio.to_thread(
+                self._fetch_subreddit_sync,
+                subreddit_name,
+                sort,
+                timeframe,
+                limit,
+                min_score
+            )
+        self._update_quota()
+
+        # Empty results are usually errors, so only cache real listings
+        if posts:
+            self._listing_cache[cache_key] = posts
+            return copy_articles(posts)
+        return posts
+
+    def _update_quota(self) -> None:
+        """
+        Pause new requests when PRAW reports the rate-limit quota is nearly used
+
+        Reads the X-Ratelimit-Remaining/Reset values PRAW tracks in
+        reddit.auth.limits and holds _quota_ok until the window resets.
+        """
+        limits = getattr(self.reddit.auth, "limits", None)
+        if not isinstance(limits, dict):
+            return
+
+        remaining = limits.get("remaining")
+        reset_timestamp = limits.get("reset_timestamp")
+        if remaining is None or reset_timestamp is None or remaining >= QUOTA_THRESHOLD:
+            return
+        if not self._quota_ok.is_set():
+            return
+
+        delay = max(0.0, reset_timestamp - time.time())
+        self._quota_ok.clear()
+        asyncio.get_running_loop().call_later(delay, self._quota_ok.set)
+        logger.warning("reddit_quota_throttle", remaining=remaining, resume_in=round(delay, 1))
+
+    def _fetch_subreddit_sync(
+        self,
+        subreddit_name: str,
+        sort: str = "hot",
+        timeframe: Optional[str] = None,
+        limit: int = 25,
+        min_score: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Fetch posts from a single subreddit (blocking PRAW calls)
+
+        Args:
+            subreddit_name: Subreddit name (without r/)
+            sort: "hot", "new", "rising", "top"
+            timeframe: For "top" sort: "hour", "day", "week", etc.
+            limit: Number of posts to fetch
+            min_score: Minimum score filter
+
+        Returns:
+            List of standardized post dictionaries
+        """
         try:
             subreddit = self.reddit.subreddit(subreddit_name)
 
-            # Get posts based on sort type
-            if sort == "hot":
-                submissions = subreddit.hot(limit=limit)
-            elif sort == "new":
-                submissions = subreddit.new(limit=limit)
-            elif sort == "rising":
-                submissions = subreddit.rising(limit=limit)
-            elif sort == "top":
+            # Get posts based on sort type ("top" also takes a time filter)
+            if sort == "top":
                 submissions = subreddit.top(
                     time_filter=timeframe or "day",
                     limit=limit
                 )
             else:
-                submissions = subreddit.hot(limit=limit)
+                listings = {
+                    "hot": subreddit.hot,
+                    "new": subreddit.new,
+                    "rising": subreddit.rising,
+                }
+                submissions = listings.get(sort, subreddit.hot)(limit=limit)
 
-            # Convert to standardized format
-            posts = []
-            for submission in submissions:
-                # Filter by minimum score
-                if min_score and submission.score < min_score:
-                    continue
+            # Listings are lazy and paginated; "top" is strictly score-ordered,
+            # so it can stop at the first post below min_score. Other sorts
+            # (e.g. "hot") aren't, and are scanned in full.
+            stop_below_min = sort == "top"
 
+            # Filter in one lazy pass, then build post dicts in a comprehension
+            accepted = []
+            for submission in submissions:
                 # Skip stickied posts
                 if submission.stickied:
                     continue
 
-                post = {
-                    "id": submission.id,
-                    "title": submission.title,
-                    "url": submission.url,
-                    "text": submission.selftext if submission.is_self else "",
-                    "score": submission.score,
-                    "author": str(submission.author) if submission.author else "[deleted]",
-                    "comments": submission.num_comments,
-                    "published_at": datetime.fromtimestamp(
-                        submission.created_utc,
-                        tz=timezone.utc
-                    ).isoformat(),
-                    "subreddit": subreddit_name,
-                    "source": "Reddit",
-                    "source_id": f"r/{subreddit_name}/{submission.id}",
-                    "permalink": f"https://reddit.com{submission.permalink}"
-                }
+                # Listing items carry their data as plain instance attributes;
+                # read the ones used more than once a single time
+                score = submission.score
+
+                # Filter by minimum score
+                if min_score and score < min_score:
+                    if stop_below_min:
+                        break
+                    continue
 
-                posts.append(post)
+                accepted.append((submission, score))
+
+            # Convert to standardized format
+            standardize = self._standardize_submission
+            posts = [
+                standardize(submission, score, subreddit_name)
+                for submission, score in accepted
+            ]
 
             return posts
 
@@ -218,6 +316,36 @@ class RedditFetcher:
             )
             return []
 
+    @staticmethod
+    def _standardize_submission(submission, score: int, subreddit_name: str) -> Dict:
+        """
+        Convert a PRAW submission to standardized format
+
+        Args:
+            submission: PRAW Submission from a listing
+            score: Submission score (already read by the filter pass)
+            subreddit_name: Subreddit name to label the post with
+
+        Returns:
+            Standardized post dictionary
+        """
+        post_id = submission.id
+        author = submission.author
+        return {
+            "id": post_id,
+            "title": submission.title,
+            "url": submission.url,
+            "text": submission.selftext if submission.is_self else "",
+            "score": score,
+            "author": str(author) if author else "[deleted]",
+            "comments": submission.num_comments,
+            "published_at": iso_utc(submission.created_utc),
+            "subreddit": subreddit_name,
+            "source": "Reddit",
+            "source_id": f"r/{subreddit_name}/{post_id}",
+            "permalink": f"https://reddit.com{submission.permalink}"
+        }
+
 
 # Convenience function
 async def fetch_trending_reddit(
@@ -250,10 +378,7 @@ async def fetch_trending_reddit(
             "science"
         ]
 
-    fetcher = RedditFetcher(
-        client_id=client_id,
-        client_secret=client_secret
-    )
+    fetcher = _get_fetcher(client_id, client_secret)
 
     # Fetch hot posts (current trending)
     posts = await fetcher.fetch_hot_posts(
@@ -263,3 +388,23 @@ async def fetch_trending_reddit(
     )
 
     return posts
+
+
+# Module-level fetcher so its quota governor and listing cache persist
+# across aggregation runs
+_fetcher: Optional[RedditFetcher] = None
+
+
+def _get_fetcher(
+    client_id: Optional[str] = None,
+    client_secret: Optional[str] = None
+) -> RedditFetcher:
+    """Get the module-level fetcher, creating it on first use or new credentials"""
+    global _fetcher
+    if (
+        _fetcher is None
+        or _fetcher.client_id != client_id
+        or _fetcher.client_secret != client_secret
+    ):
+        _fetcher = RedditFetcher(client_id=client_id, client_secret=client_secret)
+    return _fetcher
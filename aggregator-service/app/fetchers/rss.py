@@ -8,30 +8,57 @@ Fetches content from RSS/Atom feeds including:
 - Dev.to
 - Tech blogs and news sites
 
-Uses feedparser library for parsing.
+Well-formed RSS 2.0 and Atom feeds are parsed with lxml; anything else
+falls back to the feedparser library.
 """
 
+import asyncio
+import re
 import feedparser
-import httpx
 import structlog
+from cachetools import TTLCache
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import List, Dict, Optional
+from itertools import chain
+from typing import List, Dict, Optional, Tuple
 from dateutil import parser as date_parser
+from lxml import etree
+
+from app.config import settings
+from .article import copy_articles, dedupe_by_url, iso_utc_from_struct
+from .feed_parsing import atom_entry, fast_parse, read_feed, rss_entry
+from .http_client import create_client
 
 logger = structlog.get_logger()
 
+# Maximum concurrent feed requests per fetcher
+MAX_CONCURRENT_FEEDS = 16
+
+# Parsed feed cache TTL (seconds) - repeat fetches within this window skip HTTP
+FEED_CACHE_TTL = 120
+
+# Entry fields checked in priority order by _standardize_entry
+_DESC_KEYS = ("summary", "description")
+_DATE_KEYS = ("published_parsed", "updated_parsed")
+
+# Date strings without a digit can't parse, so skip dateutil for them
+_HAS_DIGIT_RE = re.compile(r"\d")
+
 
 class RSSFetcher:
     """Fetches content from RSS/Atom feeds"""
 
     def __init__(self):
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
+        self.client = create_client(
             follow_redirects=True,
             headers={
                 "User-Agent": "Mozilla/5.0 (compatible; TrendingAggregator/1.0)"
             }
         )
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_FEEDS)
+        self._feed_cache = TTLCache(maxsize=512, ttl=FEED_CACHE_TTL)
+        # cache key -> (conditional request headers, articles they validate)
+        self._validators: Dict[tuple, Tuple[Dict[str, str], List[Dict]]] = {}
 
     async def fetch_feed(
         self,
@@ -50,29 +77,51 @@ class RSSFetcher:
         Returns:
             List of article dictionaries in standardized format
         """
-        try:
-            # Fetch feed content
-            response = await self.client.get(feed_url)
-            response.raise_for_status()
-
-            # Parse feed
-            feed = feedparser.parse(response.content)
+        cache_key = (feed_url, source_name, limit)
+        if cache_key in self._feed_cache:
+            return copy_articles(self._feed_cache[cache_key])
 
-            if feed.bozo:  # Feed parsing had errors
-                logger.warning(
-                    "rss_parse_warning",
-                    source=source_name,
-                    error=str(feed.bozo_exception)
+        try:
+            # Send ETag/Last-Modified validators so unchanged feeds return 304
+            conditional_headers, previous_articles = self._validators.get(cache_key, ({}, None))
+
+            # Stream feed content, stopping early once `limit` entries arrived
+            async with self._semaphore:
+                async with self.client.stream(
+                    "GET", feed_url, headers=conditional_headers
+                ) as response:
+                    if response.status_code == 304 and previous_articles is not None:
+                        logger.info("rss_feed_not_modified", source=source_name)
+                        self._feed_cache[cache_key] = previous_articles
+                        return copy_articles(previous_articles)
+
+                    response.raise_for_status()
+                    content, items = await read_feed(response, limit)
+
+            # Parsing is CPU-bound, so keep it off the event loop (and off
+            # the GIL when a process pool is configured)
+            parse_pool = _get_parse_pool()
+            if items is not None:
+                articles = await asyncio.to_thread(
+                    _standardize_items, items, source_name, feed_url
+                )
+            elif parse_pool is not None:
+                articles = await asyncio.get_running_loop().run_in_executor(
+                    parse_pool,
+                    RSSFetcher._parse_and_standardize,
+                    content,
+                    source_name,
+                    feed_url,
+                    limit
+                )
+            else:
+                articles = await asyncio.to_thread(
+                    self._parse_and_standardize,
+                    content,
+                    source_name,
+                    feed_url,
+                    limit
                 )
-
-            # Convert entries to standardized format
-            articles = []
-            entries = feed.entries[:limit] if limit else feed.entries
-
-            for entry in entries:
-                article = self._standardize_entry(entry, source_name, feed_url)
-                if article:
-                    articles.append(article)
 
             logger.info(
                 "fetched_rss_feed",
@@ -80,7 +129,17 @@ class RSSFetcher:
                 count=len(articles)
             )
 
-            return articles
+            self._feed_cache[cache_key] = articles
+
+            validators = {}
+            if "ETag" in response.headers:
+                validators["If-None-Match"] = response.headers["ETag"]
+            if "Last-Modified" in response.headers:
+                validators["If-Modified-Since"] = response.headers["Last-Modified"]
+            if validators:
+                self._validators[cache_key] = (validators, articles)
+
+            return copy_articles(articles)
 
         except Exception as e:
             logger.error(
@@ -91,8 +150,54 @@ class RSSFetcher:
             )
             return []
 
+    @staticmethod
+    def _parse_and_standardize(
+        content: bytes,
+        source_name: str,
+        feed_url: str,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Parse feed content and convert its entries
+
+        Runs in a worker thread or a parse pool process, so it must not
+        touch fetcher state.
+
+        Args:
+            content: Raw feed body
+            source_name: Name of the source
+            feed_url: Original feed URL
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of standardized article dictionaries
+        """
+        entries = fast_parse(content, limit)
+
+        if entries is None:
+            feed = feedparser.parse(content)
+
+            if feed.bozo:  # Feed parsing had errors
+                logger.warning(
+                    "rss_parse_warning",
+                    source=source_name,
+                    error=str(feed.bozo_exception)
+                )
+
+            entries = feed.entries[:limit] if limit else feed.entries
+
+        # Convert entries to standardized format
+        articles = []
+
+        for entry in entries:
+            article = RSSFetcher._standardize_entry(entry, source_name, feed_url)
+            if article:
+                articles.append(article)
+
+        return articles
+
+    @staticmethod
     def _standardize_entry(
-        self,
         entry: Dict,
         source_name: str,
         feed_url: str
@@ -110,46 +215,49 @@ class RSSFetcher:
         """
         try:
             # Extract title
-            title = entry.get("title", "").strip()
+            title = (entry.get("title") or "").strip()
             if not title:
                 return None
 
             # Extract URL
-            url = entry.get("link", "")
+            url = entry.get("link") or ""
             if not url:
                 return None
 
             # Extract description/summary
             description = ""
-            if "summary" in entry:
-                description = entry.summary
-            elif "description" in entry:
-                description = entry.description
-            elif "content" in entry and entry.content:
-                description = entry.content[0].get("value", "")
+            for key in _DESC_KEYS:
+                description = entry.get(key)
+                if description:
+                    break
+            else:
+                content = entry.get("content")
+                description = content[0].get("value", "") if content else ""
 
             # Extract published date
             published_at = None
-            if "published_parsed" in entry and entry.published_parsed:
-                published_at = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc).isoformat()
-            elif "updated_parsed" in entry and entry.updated_parsed:
-                published_at = datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc).isoformat()
-            elif "published" in entry:
-                try:
-                    published_at = date_parser.parse(entry.published).isoformat()
-                except:
-                    pass
+            for key in _DATE_KEYS:
+                parsed = entry.get(key)
+                if parsed:
+                    published_at = iso_utc_from_struct(parsed)
+                    break
+            else:
+                published = entry.get("published")
+                if published and _HAS_DIGIT_RE.search(published):
+                    try:
+                        published_at = date_parser.parse(published).isoformat()
+                    except (ValueError, OverflowError):
+                        pass
 
             if not published_at:
                 published_at = datetime.now(timezone.utc).isoformat()
 
             # Extract author
-            author = entry.get("author", "")
-            if not author and "authors" in entry and entry.authors:
-                author = entry.authors[0].get("name", "")
+            author = entry.get("author") or (entry.get("authors") or [{}])[0].get("name", "")
 
+            entry_id = entry.get("id", url)
             return {
-                "id": entry.get("id", url),
+                "id": entry_id,
                 "title": title,
                 "url": url,
                 "text": description,
@@ -158,7 +266,7 @@ class RSSFetcher:
                 "comments": 0,  # RSS feeds don't have comment counts
                 "published_at": published_at,
                 "source": source_name,
-                "source_id": entry.get("id", url),
+                "source_id": entry_id,
                 "feed_url": feed_url
             }
 
@@ -179,24 +287,51 @@ class RSSFetcher:
             limit_per_feed: Max entries per feed
 
         Returns:
-            Combined list of articles from all feeds
+            Combined list of articles from all feeds, deduplicated by URL
         """
-        all_articles = []
-
-        for feed_info in feeds:
-            articles = await self.fetch_feed(
-                feed_url=feed_info["url"],
-                source_name=feed_info["name"],
-                limit=limit_per_feed
-            )
-            all_articles.extend(articles)
+        results = await asyncio.gather(
+            *[
+                self.fetch_feed(
+                    feed_url=feed_info["url"],
+                    source_name=feed_info["name"],
+                    limit=limit_per_feed
+                )
+                for feed_info in feeds
+            ],
+            return_exceptions=True
+        )
 
-        return all_articles
+        # Aggregators (e.g. Google News) republish the same stories as
+        # the sources they link to, so drop repeats across feeds
+        return dedupe_by_url(list(chain.from_iterable(
+            result for result in results if isinstance(result, list)
+        )))
 
     async def close(self):
         """Close the HTTP client"""
         await self.client.aclose()
 
+    async def __aenter__(self) -> "RSSFetcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+def _standardize_items(
+    items: List[etree._Element],
+    source_name: str,
+    feed_url: str
+) -> List[Dict]:
+    """Standardize RSS <item> / Atom <entry> elements from the pull parser"""
+    articles = []
+    for item in items:
+        extract = rss_entry if item.tag == "item" else atom_entry
+        article = RSSFetcher._standardize_entry(extract(item), source_name, feed_url)
+        if article:
+            articles.append(article)
+    return articles
+
 
 # Pre-defined feed collections
 GOOGLE_NEWS_FEEDS = [
@@ -227,41 +362,61 @@ TECH_NEWS_FEEDS = [
 ]
 
 
+# Module-level fetcher shared by the convenience functions so they reuse
+# one connection pool
+_shared_fetcher: Optional[RSSFetcher] = None
+
+
+def _get_fetcher() -> RSSFetcher:
+    """Get the shared RSS fetcher, creating it on first use"""
+    global _shared_fetcher
+    if _shared_fetcher is None:
+        _shared_fetcher = RSSFetcher()
+    return _shared_fetcher
+
+
+# Process pool for feed parsing, created on first use when configured
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """Get the feed parsing process pool, or None to parse in a thread"""
+    global _parse_pool
+    if _parse_pool is None and settings.rss_parse_processes > 0:
+        _parse_pool = ProcessPoolExecutor(max_workers=settings.rss_parse_processes)
+    return _parse_pool
+
+
+async def shutdown_rss() -> None:
+    """Close the shared RSS fetcher and parse pool (called on app shutdown)"""
+    global _shared_fetcher, _parse_pool
+    if _shared_fetcher is not None:
+        await _shared_fetcher.close()
+        _shared_fetcher = None
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
+
 # Convenience functions
 async def fetch_google_news(limit_per_feed: int = 10) -> List[Dict]:
     """Fetch Google News RSS feeds"""
-    fetcher = RSSFetcher()
-    try:
-        return await fetcher.fetch_multiple_feeds(GOOGLE_NEWS_FEEDS, limit_per_feed)
-    finally:
-        await fetcher.close()
+    return await _get_fetcher().fetch_multiple_feeds(GOOGLE_NEWS_FEEDS, limit_per_feed)
 
 
 async def fetch_substack_newsletters(limit_per_feed: int = 10) -> List[Dict]:
     """Fetch top Substack newsletters"""
-    fetcher = RSSFetcher()
-    try:
-        return await fetcher.fetch_multiple_feeds(TOP_SUBSTACK_FEEDS, limit_per_feed)
-    finally:
-        await fetcher.close()
+    return await _get_fetcher().fetch_multiple_feeds(TOP_SUBSTACK_FEEDS, limit_per_feed)
 
 
 async def fetch_medium_publications(limit_per_feed: int = 10) -> List[Dict]:
     """Fetch top Medium publications"""
-    fetcher = RSSFetcher()
-    try:
-        return await fetcher.fetch_multiple_feeds(TOP_MEDIUM_FEEDS, limit_per_feed)
-    finally:
-        await fetcher.close()
+    return await _get_fetcher().fetch_multiple_feeds(TOP_MEDIUM_FEEDS, limit_per_feed)
 
 
 async def fetch_tech_news(limit_per_feed: int = 10) -> List[Dict]:
     """Fetch tech news RSS feeds"""
-    fetcher = RSSFetcher()
-    try:
-        return await fetcher.fetch_multiple_feeds(TECH_NEWS_FEEDS, limit_per_feed)
-    finally:
-        await fetcher.close()
+    return await _get_fetcher().fetch_multiple_feeds(TECH_NEWS_FEEDS, limit_per_feed)
 
 
 async def fetch_user_feeds(limit_per_feed: int = 10) -> List[Dict]:
@@ -289,22 +444,19 @@ async def fetch_user_feeds(limit_per_feed: int = 10) -> List[Dict]:
     # Convert to format expected by fetch_multiple_feeds
     feeds = [{"url": f["url"], "name": f["name"]} for f in db_feeds]
 
-    fetcher = RSSFetcher()
-    try:
-        all_articles = []
-        for db_feed in db_feeds:
-            articles = await fetcher.fetch_feed(
-                feed_url=db_feed["url"],
-                source_name=db_feed["name"],
-                limit=limit_per_feed
-            )
-            all_articles.extend(articles)
+    fetcher = _get_fetcher()
+    all_articles = []
+    for db_feed in db_feeds:
+        articles = await fetcher.fetch_feed(
+            feed_url=db_feed["url"],
+            source_name=db_feed["name"],
+            limit=limit_per_feed
+        )
+        all_articles.extend(articles)
 
-            # Update last fetched timestamp
-            if articles:
-                await update_feed_last_fetched(db_feed["id"])
+        # Update last fetched timestamp
+        if articles:
+            await update_feed_last_fetched(db_feed["id"])
 
-        logger.info("user_feeds_fetched", count=len(all_articles), feeds=len(db_feeds))
-        return all_articles
-    finally:
-        await fetcher.close()
+    logger.info("user_feeds_fetched", count=len(all_articles), feeds=len(db_feeds))
+    return all_articles
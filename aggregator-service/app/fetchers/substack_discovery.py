@@ -5,56 +5,125 @@ Fetches trending posts from popular Substack newsletters using the substack-api
 Aggregates top posts across curated tech/business newsletters for content discovery.
 """
 
+import feedparser
 import structlog
+from cachetools import TTLCache
 from datetime import datetime
-from typing import List, Dict, Optional
+from dateutil import parser as date_parser
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
+from typing import List, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
 import asyncio
 
+from app.config import settings
+from .article import clean_summary, copy_articles, iso_utc_from_struct
+from .feed_parsing import fast_parse
+from .http_client import get_shared_client
+
 logger = structlog.get_logger()
 
+# Concurrent newsletter fetches overall, and per host (a newsletter listed
+# under several categories is then fetched once and served from the cache)
+MAX_CONCURRENT_NEWSLETTERS = 8
+MAX_CONCURRENT_PER_HOST = 1
+
+
+class CuratedNewsletter(NamedTuple):
+    """A curated Substack newsletter"""
+
+    url: str
+    name: str
+
 
-# Curated list of popular tech/business Substacks for discovery
+# Curated list of popular tech/business Substacks for discovery.
+# Immutable tuples; identical URL/name literals share one string object.
 POPULAR_SUBSTACKS = {
-    "technology": [
-        {"url": "https://stratechery.com", "name": "Stratechery"},
-        {"url": "https://www.platformer.news", "name": "Platformer"},
-        {"url": "https://www.theverge.com", "name": "The Verge"},  # Has RSS
-        {"url": "https://newsletter.pragmaticengineer.com", "name": "Pragmatic Engineer"},
-        {"url": "https://www.lennysnewsletter.com", "name": "Lenny's Newsletter"},
-        {"url": "https://www.notboring.co", "name": "Not Boring"},
-        {"url": "https://www.semianalysis.com", "name": "SemiAnalysis"},
-    ],
-    "programming": [
-        {"url": "https://newsletter.pragmaticengineer.com", "name": "Pragmatic Engineer"},
-        {"url": "https://blog.bytebytego.com", "name": "ByteByteGo"},
-        {"url": "https://www.developing.dev", "name": "Developing Dev"},
-        {"url": "https://www.theengineeringmanager.com", "name": "The Engineering Manager"},
-    ],
-    "ai": [
-        {"url": "https://www.oneusefulthing.org", "name": "One Useful Thing"},
-        {"url": "https://www.importai.net", "name": "Import AI"},
-        {"url": "https://simonwillison.substack.com", "name": "Simon Willison"},
-        {"url": "https://aisnakeoil.substack.com", "name": "AI Snake Oil"},
-    ],
-    "startup": [
-        {"url": "https://www.notboring.co", "name": "Not Boring"},
-        {"url": "https://www.lennysnewsletter.com", "name": "Lenny's Newsletter"},
-        {"url": "https://www.growthunhinged.com", "name": "Growth Unhinged"},
-        {"url": "https://every.to", "name": "Every"},
-    ],
-    "finance": [
-        {"url": "https://www.thegeneralist.com", "name": "The Generalist"},
-        {"url": "https://www.platformer.news", "name": "Platformer"},
-        {"url": "https://diff.substack.com", "name": "The Diff"},
-    ],
+    "technology": (
+        CuratedNewsletter("https://stratechery.com", "Stratechery"),
+        CuratedNewsletter("https://www.platformer.news", "Platformer"),
+        CuratedNewsletter("https://www.theverge.com", "The Verge"),  # Has RSS
+        CuratedNewsletter("https://newsletter.pragmaticengineer.com", "Pragmatic Engineer"),
+        CuratedNewsletter("https://www.lennysnewsletter.com", "Lenny's Newsletter"),
+        CuratedNewsletter("https://www.notboring.co", "Not Boring"),
+        CuratedNewsletter("https://www.semianalysis.com", "SemiAnalysis"),
+    ),
+    "programming": (
+        CuratedNewsletter("https://newsletter.pragmaticengineer.com", "Pragmatic Engineer"),
+        CuratedNewsletter("https://blog.bytebytego.com", "ByteByteGo"),
+        CuratedNewsletter("https://www.developing.dev", "Developing Dev"),
+        CuratedNewsletter("https://www.theengineeringmanager.com", "The Engineering Manager"),
+    ),
+    "ai": (
+        CuratedNewsletter("https://www.oneusefulthing.org", "One Useful Thing"),
+        CuratedNewsletter("https://www.importai.net", "Import AI"),
+        CuratedNewsletter("https://simonwillison.substack.com", "Simon Willison"),
+        CuratedNewsletter("https://aisnakeoil.substack.com", "AI Snake Oil"),
+    ),
+    "startup": (
+        CuratedNewsletter("https://www.notboring.co", "Not Boring"),
+        CuratedNewsletter("https://www.lennysnewsletter.com", "Lenny's Newsletter"),
+        CuratedNewsletter("https://www.growthunhinged.com", "Growth Unhinged"),
+        CuratedNewsletter("https://every.to", "Every"),
+    ),
+    "finance": (
+        CuratedNewsletter("https://www.thegeneralist.com", "The Generalist"),
+        CuratedNewsletter("https://www.platformer.news", "Platformer"),
+        CuratedNewsletter("https://diff.substack.com", "The Diff"),
+    ),
 }
 
 
+def _build_publication_index() -> tuple:
+    """
+    Flatten POPULAR_SUBSTACKS into publication entries, once per profile URL
+
+    A newsletter listed under several categories keeps its first category.
+    """
+    index = {}
+    for category, newsletters in POPULAR_SUBSTACKS.items():
+        for nl in newsletters:
+            if nl.url in index:
+                continue
+            index[nl.url] = {
+                "name": nl.name,
+                "platform": "substack",
+                "handle": nl.url.split("//")[1].split(".")[0],
+                "feed_url": f"{nl.url.rstrip('/')}/feed",
+                "profile_url": nl.url,
+                "category": category,
+                "description": f"Popular {category} newsletter on Substack",
+            }
+    return tuple(index.values())
+
+
+# Unique publications with derived fields, searched by search_publications
+_PUBLICATIONS = _build_publication_index()
+
+
 class SubstackDiscoveryFetcher:
     """Fetches trending posts from popular Substack newsletters"""
 
-    def __init__(self):
+    def __init__(self, post_cache_ttl: Optional[int] = None):
+        """
+        Initialize Substack discovery fetcher
+
+        Args:
+            post_cache_ttl: Seconds to cache top posts per newsletter
+                            (default: settings.substack_post_cache_ttl)
+        """
         self._newsletter_cache = {}
+        # Top posts per (newsletter_url, limit)
+        self._post_cache = TTLCache(
+            maxsize=128,
+            ttl=post_cache_ttl or settings.substack_post_cache_ttl
+        )
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_NEWSLETTERS)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        # (feed_url, limit) -> (conditional request headers, articles they validate)
+        self._feed_validators: Dict[tuple, Tuple[Dict[str, str], List[Dict]]] = {}
 
     async def fetch_newsletter_top_posts(
         self,
@@ -65,6 +134,10 @@ class SubstackDiscoveryFetcher:
         """
         Fetch top posts from a specific Substack newsletter
 
+        Repeat calls within the post cache TTL are served from the cache
+        (as copies, since callers add fields in place). Fetches are bounded
+        overall and per host.
+
         Args:
             newsletter_url: Base URL of the Substack newsletter
             newsletter_name: Display name for the newsletter
@@ -73,6 +146,37 @@ class SubstackDiscoveryFetcher:
         Returns:
             List of article dictionaries in standardized format
         """
+        cache_key = (newsletter_url, limit)
+        if cache_key in self._post_cache:
+            return copy_articles(self._post_cache[cache_key])
+
+        host = urlsplit(newsletter_url).netloc
+        host_semaphore = self._host_semaphores.get(host)
+        if host_semaphore is None:
+            host_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PER_HOST)
+            self._host_semaphores[host] = host_semaphore
+
+        # Take the host slot first so a slow host doesn't hold a global slot idle
+        async with host_semaphore:
+            if cache_key in self._post_cache:
+                return copy_articles(self._post_cache[cache_key])
+            async with self._semaphore:
+                articles = await self._fetch_newsletter_posts(
+                    newsletter_url, newsletter_name, limit
+                )
+
+            # Empty results are usually errors, so only cache real posts
+            if articles:
+                self._post_cache[cache_key] = articles
+        return copy_articles(articles)
+
+    async def _fetch_newsletter_posts(
+        self,
+        newsletter_url: str,
+        newsletter_name: str,
+        limit: int
+    ) -> List[Dict]:
+        """Fetch top posts via substack-api, falling back to the RSS feed"""
         try:
             from substack_api import Newsletter
 
@@ -82,22 +186,25 @@ class SubstackDiscoveryFetcher:
 
             newsletter = self._newsletter_cache[newsletter_url]
 
-            # Fetch top posts sorted by popularity
-            posts = newsletter.get_posts(sorting="top", limit=limit)
+            # Fetch top posts sorted by popularity (blocking HTTP, so off the loop)
+            posts = await asyncio.to_thread(newsletter.get_posts, sorting="top", limit=limit)
 
+            source = f"substack:{newsletter_name}"
             articles = []
             for post in posts:
                 try:
+                    attrs = _post_attributes(post)
+                    score = self._get_score(attrs)
                     article = {
-                        "title": getattr(post, "title", "Untitled"),
-                        "url": getattr(post, "canonical_url", newsletter_url),
-                        "author": getattr(post, "author_name", newsletter_name),
-                        "source": f"substack:{newsletter_name}",
+                        "title": attrs.get("title", "Untitled"),
+                        "url": attrs.get("canonical_url", newsletter_url),
+                        "author": attrs.get("author_name", newsletter_name),
+                        "source": source,
                         "source_type": "substack",
-                        "published_at": self._parse_date(getattr(post, "post_date", None)),
-                        "summary": self._get_summary(post),
-                        "score": self._get_score(post),
-                        "engagement_score": self._get_score(post) * 10,  # Normalized
+                        "published_at": self._parse_date(attrs.get("post_date")),
+                        "summary": self._get_summary(attrs),
+                        "score": score,
+                        "engagement_score": score * 10,  # Normalized
                         "type": "substack_discovery",
                         "newsletter_url": newsletter_url,
                     }
@@ -135,42 +242,57 @@ class SubstackDiscoveryFetcher:
     ) -> List[Dict]:
         """Fallback to RSS feed if substack-api fails"""
         try:
-            import feedparser
-            import httpx
-
             # Substack RSS is at /feed
             feed_url = f"{newsletter_url.rstrip('/')}/feed"
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(feed_url)
-                if response.status_code != 200:
-                    return []
+            # Send ETag/Last-Modified validators so unchanged feeds return 304
+            validator_key = (feed_url, limit)
+            conditional_headers, previous_articles = self._feed_validators.get(
+                validator_key, ({}, None)
+            )
+
+            # Reuse pooled connections across newsletters (closed on app shutdown)
+            response = await get_shared_client().get(feed_url, headers=conditional_headers)
+            if response.status_code == 304 and previous_articles is not None:
+                logger.info("substack_rss_not_modified", newsletter=newsletter_name)
+                return copy_articles(previous_articles)
+            if response.status_code != 200:
+                return []
 
-                feed = feedparser.parse(response.content)
-                articles = []
+            entries = await asyncio.to_thread(_parse_feed_entries, response.content, limit)
+            articles = []
 
-                for entry in feed.entries[:limit]:
-                    articles.append({
-                        "title": entry.get("title", "Untitled"),
-                        "url": entry.get("link", newsletter_url),
-                        "author": newsletter_name,
-                        "source": f"substack:{newsletter_name}",
-                        "source_type": "substack",
-                        "published_at": self._parse_feed_date(entry),
-                        "summary": self._clean_summary(entry.get("summary", "")),
-                        "score": 0,  # RSS doesn't provide scores
-                        "engagement_score": 0,
-                        "type": "substack_discovery",
-                        "newsletter_url": newsletter_url,
-                        "fallback": True,
-                    })
+            for entry in entries:
+                articles.append({
+                    "title": entry.get("title", "Untitled"),
+                    "url": entry.get("link", newsletter_url),
+                    "author": newsletter_name,
+                    "source": f"substack:{newsletter_name}",
+                    "source_type": "substack",
+                    "published_at": self._parse_feed_date(entry),
+                    "summary": clean_summary(entry.get("summary", "")),
+                    "score": 0,  # RSS doesn't provide scores
+                    "engagement_score": 0,
+                    "type": "substack_discovery",
+                    "newsletter_url": newsletter_url,
+                    "fallback": True,
+                })
 
-                logger.info(
-                    "substack_rss_fallback",
-                    newsletter=newsletter_name,
-                    count=len(articles)
-                )
-                return articles
+            logger.info(
+                "substack_rss_fallback",
+                newsletter=newsletter_name,
+                count=len(articles)
+            )
+
+            validators = {}
+            if "ETag" in response.headers:
+                validators["If-None-Match"] = response.headers["ETag"]
+            if "Last-Modified" in response.headers:
+                validators["If-Modified-Since"] = response.headers["Last-Modified"]
+            if validators:
+                self._feed_validators[validator_key] = (validators, articles)
+
+            return copy_articles(articles)
 
         except Exception as e:
             logger.error(
@@ -197,7 +319,7 @@ class SubstackDiscoveryFetcher:
         Returns:
             List of articles sorted by engagement score
         """
-        newsletters = POPULAR_SUBSTACKS.get(category, [])
+        newsletters = POPULAR_SUBSTACKS.get(category, ())
         if not newsletters:
             logger.warning("unknown_substack_category", category=category)
             return []
@@ -205,8 +327,8 @@ class SubstackDiscoveryFetcher:
         # Fetch from all newsletters concurrently
         tasks = [
             self.fetch_newsletter_top_posts(
-                nl["url"],
-                nl["name"],
+                nl.url,
+                nl.name,
                 posts_per_newsletter
             )
             for nl in newsletters
@@ -214,15 +336,13 @@ class SubstackDiscoveryFetcher:
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Flatten and filter out exceptions
-        all_articles = []
-        for result in results:
-            if isinstance(result, list):
-                all_articles.extend(result)
-
-        # Sort by engagement score and limit
-        all_articles.sort(key=lambda x: x.get("engagement_score", 0), reverse=True)
-        return all_articles[:max_total]
+        # Flatten (skipping exceptions) and keep the most engaging posts
+        all_articles = (
+            article
+            for result in results if isinstance(result, list)
+            for article in result
+        )
+        return nlargest(max_total, all_articles, key=_engagement)
 
     async def fetch_all_trending(
         self,
@@ -242,32 +362,42 @@ class SubstackDiscoveryFetcher:
             Aggregated list of trending posts
         """
         categories = categories or list(POPULAR_SUBSTACKS.keys())
+        per_category = limit // len(categories)
+
+        # Newsletters listed under several categories are fetched once
+        newsletters: Dict[CuratedNewsletter, List[str]] = {}
+        for category in categories:
+            if category not in POPULAR_SUBSTACKS:
+                logger.warning("unknown_substack_category", category=category)
+                continue
+            for nl in POPULAR_SUBSTACKS[category]:
+                newsletters.setdefault(nl, []).append(category)
+
+        results = await asyncio.gather(
+            *[
+                self.fetch_newsletter_top_posts(nl.url, nl.name, posts_per_newsletter)
+                for nl in newsletters
+            ],
+            return_exceptions=True
+        )
+
+        # Regroup by category so each keeps its own top posts, as before
+        by_category: Dict[str, List[Dict]] = {category: [] for category in categories}
+        for nl_categories, result in zip(newsletters.values(), results):
+            if isinstance(result, list):
+                for category in nl_categories:
+                    by_category[category].extend(result)
 
-        # Fetch from all categories concurrently
-        tasks = [
-            self.fetch_category_top_posts(
-                cat,
-                posts_per_newsletter,
-                max_total=limit // len(categories)
-            )
-            for cat in categories
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Flatten and deduplicate by URL
+        # Deduplicate by URL, then keep the most engaging posts
         seen_urls = set()
-        all_articles = []
-        for result in results:
-            if isinstance(result, list):
-                for article in result:
-                    if article["url"] not in seen_urls:
-                        seen_urls.add(article["url"])
-                        all_articles.append(article)
+        unique_articles = []
+        for category_articles in by_category.values():
+            for article in nlargest(per_category, category_articles, key=_engagement):
+                if article["url"] not in seen_urls:
+                    seen_urls.add(article["url"])
+                    unique_articles.append(article)
 
-        # Sort by engagement score
-        all_articles.sort(key=lambda x: x.get("engagement_score", 0), reverse=True)
-        return all_articles[:limit]
+        return nlargest(limit, unique_articles, key=_engagement)
 
     async def search_publications(
         self,
@@ -288,30 +418,9 @@ class SubstackDiscoveryFetcher:
             List of matching publications
         """
         query_lower = query.lower()
-        matches = []
-
-        for category, newsletters in POPULAR_SUBSTACKS.items():
-            for nl in newsletters:
-                if query_lower in nl["name"].lower():
-                    matches.append({
-                        "name": nl["name"],
-                        "platform": "substack",
-                        "handle": nl["url"].split("//")[1].split(".")[0],
-                        "feed_url": f"{nl['url'].rstrip('/')}/feed",
-                        "profile_url": nl["url"],
-                        "category": category,
-                        "description": f"Popular {category} newsletter on Substack",
-                    })
-
-        # Deduplicate by URL
-        seen = set()
-        unique = []
-        for m in matches:
-            if m["profile_url"] not in seen:
-                seen.add(m["profile_url"])
-                unique.append(m)
-
-        return unique[:limit]
+        matches = [pub for pub in _PUBLICATIONS if query_lower in pub["name"].lower()]
+        # Copy so callers can't modify the shared index
+        return [dict(pub) for pub in matches[:limit]]
 
     def _parse_date(self, date_value) -> str:
         """Parse date from substack-api post"""
@@ -325,49 +434,108 @@ class SubstackDiscoveryFetcher:
 
     def _parse_feed_date(self, entry: Dict) -> str:
         """Parse date from RSS entry"""
-        from dateutil import parser as date_parser
-
-        for field in ["published", "updated", "created"]:
-            if field in entry:
-                try:
-                    return date_parser.parse(entry[field]).isoformat()
-                except Exception:
-                    continue
+        parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+        if parsed:
+            return iso_utc_from_struct(parsed)
+
+        for field in _FEED_DATE_FIELDS:
+            value = entry.get(field)
+            if value:
+                published_at = _parse_date_string(value)
+                if published_at:
+                    return published_at
         return datetime.utcnow().isoformat()
 
-    def _get_summary(self, post) -> str:
-        """Extract summary from post"""
-        subtitle = getattr(post, "subtitle", None)
+    def _get_summary(self, attrs: Dict) -> str:
+        """Extract summary from post attributes"""
+        subtitle = attrs.get("subtitle")
         if subtitle:
             return subtitle[:300]
 
-        body = getattr(post, "truncated_body_text", None)
+        body = attrs.get("truncated_body_text")
         if body:
             return body[:300]
 
         return ""
 
-    def _get_score(self, post) -> int:
-        """Extract engagement score from post"""
-        reactions = getattr(post, "reactions", None)
+    def _get_score(self, attrs: Dict) -> int:
+        """Extract engagement score from post attributes"""
+        reactions = attrs.get("reactions")
         if reactions and isinstance(reactions, dict):
             return reactions.get("like", 0) + reactions.get("love", 0)
 
-        likes = getattr(post, "likes", 0)
-        if likes:
-            return likes
+        return attrs.get("likes") or 0
 
-        return 0
 
-    def _clean_summary(self, html: str) -> str:
-        """Clean HTML summary"""
-        from bs4 import BeautifulSoup
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-            text = soup.get_text(separator=" ", strip=True)
-            return text[:300]
-        except Exception:
-            return html[:300]
+_FEED_DATE_FIELDS = ("published", "updated", "created")
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(value: str) -> Optional[str]:
+    """
+    Parse an RSS/Atom date string to ISO-8601, or None if unparseable
+
+    Tries the RFC 2822 and ISO-8601 parsers before the much slower generic
+    dateutil parser. Cached because feeds repeat the same date strings
+    across refreshes.
+    """
+    try:
+        return parsedate_to_datetime(value).isoformat()
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(value).isoformat()
+    except ValueError:
+        pass
+    try:
+        return date_parser.parse(value).isoformat()
+    except Exception:
+        return None
+
+
+# substack-api post attributes read when building articles
+_POST_FIELDS = (
+    "title", "canonical_url", "author_name", "post_date",
+    "subtitle", "truncated_body_text", "reactions", "likes",
+)
+
+
+def _post_attributes(post) -> Dict:
+    """
+    Get a post's known attributes as a dict, read once per post
+
+    Uses one getattr per field so instance attributes, slots, properties
+    and class attributes are all picked up. Missing or None fields are left out.
+    """
+    return {
+        name: value
+        for name in _POST_FIELDS
+        if (value := getattr(post, name, None)) is not None
+    }
+
+
+# Every article dict sets engagement_score (0 for RSS fallbacks)
+_engagement = itemgetter("engagement_score")
+
+
+def _parse_feed_entries(content: bytes, limit: int) -> List[Dict]:
+    """
+    Parse the first `limit` entries of a feed
+
+    Well-formed RSS/Atom goes through the lxml fast path, which stops after
+    `limit` entries; feedparser is only the last resort for malformed feeds.
+
+    Args:
+        content: Raw feed body
+        limit: Maximum number of entries
+
+    Returns:
+        feedparser-style entries
+    """
+    entries = fast_parse(content, limit)
+    if entries is None:
+        entries = feedparser.parse(content).entries[:limit]
+    return entries
 
 
 # Module-level convenience functions
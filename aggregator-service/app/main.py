@@ -5,29 +5,101 @@ Fetches content from multiple sources (RSS, Reddit, Hacker News, etc.)
 and detects trending topics using keyword extraction and velocity analysis.
 """
 
+import asyncio
+import atexit
+import logging
+import queue
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+import orjson
 import structlog
 
 # Import API routes and scheduler
 from app.api import routes
 from app import scheduler as feed_scheduler
+from app.config import settings
+from app.fetchers.http_client import close_shared_client
+from app.fetchers.rss import shutdown_rss
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records while the queue is full, counting them"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # handleError would print a traceback per record under load
+            self.dropped += 1
+
+
+# Log lines are queued and written to stdout by a background thread, so a
+# slow stdout never blocks the event loop (bounded; overflow is dropped)
+_log_queue = queue.Queue(maxsize=10000)
+_log_handler = _DroppingQueueHandler(_log_queue)
+_log_output = logging.getLogger("aggregator")
+_log_output.addHandler(_log_handler)
+_log_output.setLevel(logging.DEBUG)
+_log_output.propagate = False
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+
+def _dumps(obj, **kwargs) -> str:
+    """Serialize a log event with orjson (stdlib logging expects str)"""
+    return orjson.dumps(obj, **kwargs).decode()
+
 
 # Configure structured logging
 structlog.configure(
     processors=[
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer()
-    ]
+        structlog.processors.JSONRenderer(serializer=_dumps)
+    ],
+    logger_factory=lambda *args: _log_output
 )
 
 logger = structlog.get_logger()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Size the blocking-call thread pool; stop jobs and release resources on shutdown"""
+    # Blocking client libraries (PRAW, substack-api) run via asyncio.to_thread;
+    # give their fan-out more workers than the CPU-based default
+    executor = ThreadPoolExecutor(max_workers=32)
+    asyncio.get_running_loop().set_default_executor(executor)
+    yield
+    # Stop scheduled fetches before closing the clients they use
+    if feed_scheduler.scheduler_state.running:
+        feed_scheduler.stop_scheduler()
+    await shutdown_rss()
+    await close_shared_client()
+    executor.shutdown(wait=False)
+    if _log_handler.dropped:
+        logger.warning("log_records_dropped", count=_log_handler.dropped)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Trending Topics Aggregator",
     description="Multi-source news aggregator with trending topic detection",
-    version="1.0.0"
+    version="1.0.0",
+    # Without an OpenAPI URL FastAPI also skips the /docs and /redoc pages
+    openapi_url="/openapi.json" if settings.enable_api_docs else None,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -78,4 +150,4 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
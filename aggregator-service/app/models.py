@@ -7,9 +7,13 @@ Table names match Prisma's @@map() directives.
 
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, Integer, Float, Boolean, DateTime, Text, ForeignKey, Index
+from sqlalchemy import JSON, String, Integer, Float, Boolean, DateTime, Text, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+# Binary JSONB on PostgreSQL (parsed once on insert), plain JSON elsewhere
+JSONList = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models"""
@@ -65,15 +69,18 @@ class HotTopic(Base):
     score: Mapped[float] = mapped_column(Float, nullable=False)
     mentions: Mapped[int] = mapped_column(Integer, nullable=False)
     summary: Mapped[str] = mapped_column(Text, nullable=False)
-    sources: Mapped[str] = mapped_column(Text, nullable=False)  # JSON array
-    sampleUrls: Mapped[str] = mapped_column(Text, nullable=False)  # JSON array
+    sources: Mapped[list] = mapped_column(JSONList, nullable=False)
+    sampleUrls: Mapped[list] = mapped_column(JSONList, nullable=False)
     fetchedAt: Mapped[datetime] = mapped_column(DateTime, nullable=False)
-    createdAt: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    createdAt: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     __table_args__ = (
-        Index('ix_hot_topics_timeframe_rank_fetched', 'timeframe', 'rank', 'fetchedAt'),
+        # Latest snapshot per timeframe, read back in rank order
+        Index('ix_hot_topics_timeframe_fetched_rank', 'timeframe', 'fetchedAt', 'rank'),
         Index('ix_hot_topics_fetched', 'fetchedAt'),
         Index('ix_hot_topics_keyword_timeframe', 'keyword', 'timeframe'),
+        # Containment queries, e.g. sources @> '["HackerNews"]'
+        Index('ix_hot_topics_sources', 'sources', postgresql_using='gin'),
     )
 
 
@@ -90,13 +97,14 @@ class TrendingUpTopic(Base):
     previousVolume: Mapped[int] = mapped_column(Integer, nullable=False)
     percentGrowth: Mapped[float] = mapped_column(Float, nullable=False)
     summary: Mapped[str] = mapped_column(Text, nullable=False)
-    sources: Mapped[str] = mapped_column(Text, nullable=False)  # JSON array
-    sampleUrls: Mapped[str] = mapped_column(Text, nullable=False)  # JSON array
+    sources: Mapped[list] = mapped_column(JSONList, nullable=False)
+    sampleUrls: Mapped[list] = mapped_column(JSONList, nullable=False)
     fetchedAt: Mapped[datetime] = mapped_column(DateTime, nullable=False)
-    createdAt: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    createdAt: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     __table_args__ = (
-        Index('ix_trending_up_timeframe_rank_fetched', 'timeframe', 'rank', 'fetchedAt'),
+        # Latest snapshot per timeframe, read back in rank order
+        Index('ix_trending_up_timeframe_fetched_rank', 'timeframe', 'fetchedAt', 'rank'),
         Index('ix_trending_up_fetched', 'fetchedAt'),
         Index('ix_trending_up_keyword_timeframe', 'keyword', 'timeframe'),
     )
@@ -109,12 +117,11 @@ class KeywordHistory(Base):
     id: Mapped[str] = mapped_column(String, primary_key=True)
     keyword: Mapped[str] = mapped_column(String, nullable=False)
     mentions: Mapped[int] = mapped_column(Integer, nullable=False)
-    sources: Mapped[str] = mapped_column(Text, nullable=False)  # JSON array
+    sources: Mapped[list] = mapped_column(JSONList, nullable=False)
     date: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    createdAt: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    createdAt: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     __table_args__ = (
         Index('ix_keyword_history_keyword_date', 'keyword', 'date'),
         Index('ix_keyword_history_date', 'date'),
-        Index('ix_keyword_history_keyword', 'keyword'),
     )
@@ -11,7 +11,9 @@ Supports:
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from typing import Optional
 import structlog
 import asyncio
 
@@ -20,16 +22,24 @@ logger = structlog.get_logger()
 # Global scheduler instance
 scheduler: AsyncIOScheduler | None = None
 
-# Scheduler state tracking
-scheduler_state = {
-    "running": False,
-    "paused": False,
-    "interval_minutes": 30,
-    "last_run": None,
-    "next_run": None,
-    "total_runs": 0,
-    "last_error": None
-}
+@dataclass(slots=True)
+class SchedulerState:
+    """Scheduler state tracking"""
+
+    running: bool = False
+    paused: bool = False
+    interval_minutes: int = 30
+    last_run: Optional[str] = None
+    next_run: Optional[str] = None
+    total_runs: int = 0
+    last_error: Optional[str] = None
+
+
+scheduler_state = SchedulerState()
+
+# Background task for the current immediate fetch, if any
+_immediate_task: asyncio.Task | None = None
+_immediate_job_id: str | None = None
 
 
 def get_scheduler() -> AsyncIOScheduler:
@@ -52,18 +62,18 @@ async def scheduled_fetch_job():
 
     try:
         logger.info("scheduled_fetch_started", job_id=job_id)
-        scheduler_state["last_run"] = datetime.now().isoformat()
-        scheduler_state["total_runs"] += 1
+        scheduler_state.last_run = datetime.now().isoformat()
+        scheduler_state.total_runs += 1
 
         # Run the fetch job
         await fetch_and_process_content(job_id=job_id, sources=None)
 
         logger.info("scheduled_fetch_completed", job_id=job_id)
-        scheduler_state["last_error"] = None
+        scheduler_state.last_error = None
 
     except Exception as e:
         logger.error("scheduled_fetch_failed", job_id=job_id, error=str(e))
-        scheduler_state["last_error"] = str(e)
+        scheduler_state.last_error = str(e)
 
 
 def start_scheduler(interval_minutes: int = 30) -> dict:
@@ -99,14 +109,14 @@ def start_scheduler(interval_minutes: int = 30) -> dict:
     if not sched.running:
         sched.start()
 
-    scheduler_state["running"] = True
-    scheduler_state["paused"] = False
-    scheduler_state["interval_minutes"] = interval_minutes
+    scheduler_state.running = True
+    scheduler_state.paused = False
+    scheduler_state.interval_minutes = interval_minutes
 
     # Get next run time
     job = sched.get_job("feed_refresh")
     if job and job.next_run_time:
-        scheduler_state["next_run"] = job.next_run_time.isoformat()
+        scheduler_state.next_run = job.next_run_time.isoformat()
 
     logger.info("scheduler_started", interval_minutes=interval_minutes)
 
@@ -130,9 +140,9 @@ def stop_scheduler() -> dict:
         global scheduler
         scheduler = None
 
-    scheduler_state["running"] = False
-    scheduler_state["paused"] = False
-    scheduler_state["next_run"] = None
+    scheduler_state.running = False
+    scheduler_state.paused = False
+    scheduler_state.next_run = None
 
     logger.info("scheduler_stopped")
 
@@ -153,8 +163,8 @@ def pause_scheduler() -> dict:
     job = sched.get_job("feed_refresh")
     if job:
         job.pause()
-        scheduler_state["paused"] = True
-        scheduler_state["next_run"] = None
+        scheduler_state.paused = True
+        scheduler_state.next_run = None
         logger.info("scheduler_paused")
 
     return get_scheduler_status()
@@ -174,9 +184,9 @@ def resume_scheduler() -> dict:
     job = sched.get_job("feed_refresh")
     if job:
         job.resume()
-        scheduler_state["paused"] = False
+        scheduler_state.paused = False
         if job.next_run_time:
-            scheduler_state["next_run"] = job.next_run_time.isoformat()
+            scheduler_state.next_run = job.next_run_time.isoformat()
         logger.info("scheduler_resumed")
 
     return get_scheduler_status()
@@ -192,12 +202,12 @@ def update_interval(interval_minutes: int) -> dict:
     Returns:
         Status dict with scheduler info
     """
-    if scheduler_state["running"] and not scheduler_state["paused"]:
+    if scheduler_state.running and not scheduler_state.paused:
         # Restart with new interval
         return start_scheduler(interval_minutes)
 
     # Just update the stored value for next start
-    scheduler_state["interval_minutes"] = interval_minutes
+    scheduler_state.interval_minutes = interval_minutes
     return get_scheduler_status()
 
 
@@ -212,16 +222,11 @@ def get_scheduler_status() -> dict:
 
     job = sched.get_job("feed_refresh") if sched.running else None
 
-    return {
-        "running": scheduler_state["running"],
-        "paused": scheduler_state["paused"],
-        "interval_minutes": scheduler_state["interval_minutes"],
-        "last_run": scheduler_state["last_run"],
-        "next_run": job.next_run_time.isoformat() if job and job.next_run_time else scheduler_state["next_run"],
-        "total_runs": scheduler_state["total_runs"],
-        "last_error": scheduler_state["last_error"],
-        "job_exists": job is not None
-    }
+    status = asdict(scheduler_state)
+    if job and job.next_run_time:
+        status["next_run"] = job.next_run_time.isoformat()
+    status["job_exists"] = job is not None
+    return status
 
 
 async def trigger_immediate_fetch() -> dict:
@@ -231,11 +236,21 @@ async def trigger_immediate_fetch() -> dict:
     Returns:
         Dict with job info
     """
+    global _immediate_task, _immediate_job_id
+
+    # Coalesce repeated triggers into the fetch that is already running
+    if _immediate_task is not None and not _immediate_task.done():
+        return {
+            "message": "Immediate fetch already running",
+            "job_id": _immediate_job_id
+        }
+
     import uuid
     job_id = f"immediate-{uuid.uuid4().hex[:8]}"
 
-    # Run in background
-    asyncio.create_task(scheduled_fetch_job())
+    # Run in background, keeping a reference so the task isn't garbage collected
+    _immediate_task = asyncio.create_task(scheduled_fetch_job())
+    _immediate_job_id = job_id
 
     return {
         "message": "Immediate fetch triggered",
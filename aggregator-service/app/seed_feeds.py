@@ -10,504 +10,134 @@ This script populates the database with high-quality feeds across:
 - Design and UX
 """
 
-import asyncio
+import logging
+import logging.handlers
+import os
 import sqlite3
+import sys
+from collections import Counter
 from datetime import datetime
-from typing import List, Dict
-import secrets
-
-# Database path
-DB_PATH = "../../prisma/data/dashboard.db"
-
-def generate_cuid():
-    """Generate a simple unique ID (simplified cuid)"""
-    return f"cl{secrets.token_hex(12)}"
-
-# Curated feed sources organized by category
-FEED_SOURCES = [
-    # === TECH NEWS (Major Publications) ===
-    {
-        "name": "TechCrunch",
-        "url": "https://techcrunch.com/feed/",
-        "type": "rss",
-        "category": "tech",
-        "update_frequency": 30
-    },
-    {
-        "name": "The Verge",
-        "url": "https://www.theverge.com/rss/index.xml",
-        "type": "rss",
-        "category": "tech",
-        "update_frequency": 30
-    },
-    {
-        "name": "Ars Technica",
-        "url": "https://feeds.arstechnica.com/arstechnica/index",
-        "type": "rss",
-        "category": "tech",
-        "update_frequency": 60
-    },
-    {
-        "name": "Wired",
-        "url": "https://www.wired.com/feed/rss",
-        "type": "rss",
-        "category": "tech",
-        "update_frequency": 60
-    },
-    {
-        "name": "MIT Technology Review",
-        "url": "https://www.technologyreview.com/feed/",
-        "type": "rss",
-        "category": "tech",
-        "update_frequency": 120
-    },
-    {
-        "name": "Engadget",
-        "url": "https://www.engadget.com/rss.xml",
-        "type": "rss",
-        "category": "tech",
-        "update_frequency": 60
-    },
-    {
-        "name": "VentureBeat",
-        "url": "https://venturebeat.com/feed/",
-        "type": "rss",
-        "category": "tech",
-        "update_frequency": 60
-    },
-    {
-        "name": "The Next Web",
-        "url": "https://thenextweb.com/feed/",
-        "type": "rss",
-        "category": "tech",
-        "update_frequency": 60
-    },
-
-    # === DEVELOPER PLATFORMS ===
-    {
-        "name": "Hacker News",
-        "url": "https://hacker-news.firebaseio.com/v0",
-        "type": "hackernews",
-        "category": "developer",
-        "update_frequency": 30
-    },
-    {
-        "name": "Dev.to",
-        "url": "https://dev.to/feed",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 60
-    },
-    {
-        "name": "Hashnode",
-        "url": "https://hashnode.com/rss",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 60
-    },
-    {
-        "name": "InfoQ",
-        "url": "https://www.infoq.com/feed",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 120
-    },
-
-    # === REDDIT (Tech Subreddits) ===
-    {
-        "name": "r/technology",
-        "url": "https://www.reddit.com/r/technology.json",
-        "type": "reddit",
-        "category": "tech",
-        "update_frequency": 60
-    },
-    {
-        "name": "r/programming",
-        "url": "https://www.reddit.com/r/programming.json",
-        "type": "reddit",
-        "category": "developer",
-        "update_frequency": 60
-    },
-    {
-        "name": "r/webdev",
-        "url": "https://www.reddit.com/r/webdev.json",
-        "type": "reddit",
-        "category": "developer",
-        "update_frequency": 60
-    },
-    {
-        "name": "r/machinelearning",
-        "url": "https://www.reddit.com/r/machinelearning.json",
-        "type": "reddit",
-        "category": "science",
-        "update_frequency": 120
-    },
-    {
-        "name": "r/datascience",
-        "url": "https://www.reddit.com/r/datascience.json",
-        "type": "reddit",
-        "category": "science",
-        "update_frequency": 120
-    },
-    {
-        "name": "r/artificial",
-        "url": "https://www.reddit.com/r/artificial.json",
-        "type": "reddit",
-        "category": "science",
-        "update_frequency": 120
-    },
-    {
-        "name": "r/startups",
-        "url": "https://www.reddit.com/r/startups.json",
-        "type": "reddit",
-        "category": "business",
-        "update_frequency": 120
-    },
-
-    # === GOOGLE NEWS (Topics) ===
-    {
-        "name": "Google News - Technology",
-        "url": "https://news.google.com/rss/topics/CAAqJggKIiBDQkFTRWdvSUwyMHZNRGRqTVhZU0FtVnVHZ0pWVXlnQVAB",
-        "type": "rss",
-        "category": "tech",
-        "update_frequency": 60
-    },
-    {
-        "name": "Google News - Business",
-        "url": "https://news.google.com/rss/topics/CAAqJggKIiBDQkFTRWdvSUwyMHZNRGx6TVdZU0FtVnVHZ0pWVXlnQVAB",
-        "type": "rss",
-        "category": "business",
-        "update_frequency": 60
-    },
-    {
-        "name": "Google News - Science",
-        "url": "https://news.google.com/rss/topics/CAAqJggKIiBDQkFTRWdvSUwyMHZNRFpxYW5RU0FtVnVHZ0pWVXlnQVAB",
-        "type": "rss",
-        "category": "science",
-        "update_frequency": 120
-    },
-
-    # === SUBSTACK NEWSLETTERS (Developer-Focused) ===
-    {
-        "name": "ByteByteGo",
-        "url": "https://blog.bytebytego.com/feed",
-        "type": "substack",
-        "category": "developer",
-        "update_frequency": 1440  # Daily
-    },
-    {
-        "name": "The Pragmatic Engineer",
-        "url": "https://newsletter.pragmaticengineer.com/feed",
-        "type": "substack",
-        "category": "developer",
-        "update_frequency": 1440
-    },
-    {
-        "name": "Lenny's Newsletter",
-        "url": "https://www.lennysnewsletter.com/feed",
-        "type": "substack",
-        "category": "business",
-        "update_frequency": 1440
-    },
-    {
-        "name": "Stratechery",
-        "url": "https://stratechery.com/feed/",
-        "type": "substack",
-        "category": "business",
-        "update_frequency": 1440
-    },
-    {
-        "name": "Not Boring",
-        "url": "https://www.notboring.co/feed",
-        "type": "substack",
-        "category": "business",
-        "update_frequency": 1440
-    },
-    {
-        "name": "platformer",
-        "url": "https://www.platformer.news/feed",
-        "type": "substack",
-        "category": "tech",
-        "update_frequency": 1440
-    },
-
-    # === MEDIUM PUBLICATIONS ===
-    {
-        "name": "Better Programming",
-        "url": "https://betterprogramming.pub/feed",
-        "type": "medium",
-        "category": "developer",
-        "update_frequency": 120
-    },
-    {
-        "name": "The Startup",
-        "url": "https://medium.com/feed/swlh",
-        "type": "medium",
-        "category": "business",
-        "update_frequency": 120
-    },
-    {
-        "name": "Towards Data Science",
-        "url": "https://towardsdatascience.com/feed",
-        "type": "medium",
-        "category": "science",
-        "update_frequency": 120
-    },
-    {
-        "name": "JavaScript in Plain English",
-        "url": "https://javascript.plainenglish.io/feed",
-        "type": "medium",
-        "category": "developer",
-        "update_frequency": 120
-    },
-    {
-        "name": "Level Up Coding",
-        "url": "https://levelup.gitconnected.com/feed",
-        "type": "medium",
-        "category": "developer",
-        "update_frequency": 120
-    },
-    {
-        "name": "UX Collective",
-        "url": "https://uxdesign.cc/feed",
-        "type": "medium",
-        "category": "design",
-        "update_frequency": 120
-    },
-    {
-        "name": "Bootcamp",
-        "url": "https://bootcamp.uxdesign.cc/feed",
-        "type": "medium",
-        "category": "design",
-        "update_frequency": 120
-    },
-
-    # === INDIVIDUAL TECH BLOGS ===
-    {
-        "name": "Dan Abramov (overreacted.io)",
-        "url": "https://overreacted.io/rss.xml",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 1440
-    },
-    {
-        "name": "Kent C. Dodds",
-        "url": "https://kentcdodds.com/blog/rss.xml",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 1440
-    },
-    {
-        "name": "Martin Fowler",
-        "url": "https://martinfowler.com/feed.atom",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 1440
-    },
-    {
-        "name": "Joel on Software",
-        "url": "https://www.joelonsoftware.com/feed/",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 1440
-    },
-    {
-        "name": "CSS-Tricks",
-        "url": "https://css-tricks.com/feed/",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 120
-    },
-    {
-        "name": "Smashing Magazine",
-        "url": "https://www.smashingmagazine.com/feed/",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 120
-    },
-
-    # === PROGRAMMING LANGUAGES ===
-    {
-        "name": "The Rust Blog",
-        "url": "https://blog.rust-lang.org/feed.xml",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 1440
-    },
-    {
-        "name": "Go Blog",
-        "url": "https://go.dev/blog/feed.atom",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 1440
-    },
-    {
-        "name": "Python Insider",
-        "url": "https://blog.python.org/feeds/posts/default",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 1440
-    },
-    {
-        "name": "Node.js Blog",
-        "url": "https://nodejs.org/en/feed/blog.xml",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 1440
-    },
-
-    # === AI/ML FOCUSED ===
-    {
-        "name": "OpenAI Blog",
-        "url": "https://openai.com/blog/rss/",
-        "type": "rss",
-        "category": "science",
-        "update_frequency": 1440
-    },
-    {
-        "name": "DeepMind Blog",
-        "url": "https://deepmind.google/blog/rss.xml",
-        "type": "rss",
-        "category": "science",
-        "update_frequency": 1440
-    },
-    {
-        "name": "Anthropic News",
-        "url": "https://www.anthropic.com/news/rss",
-        "type": "rss",
-        "category": "science",
-        "update_frequency": 1440
-    },
-    {
-        "name": "AI News (Google)",
-        "url": "https://ai.googleblog.com/feeds/posts/default",
-        "type": "rss",
-        "category": "science",
-        "update_frequency": 1440
-    },
-
-    # === CLOUD & DEVOPS ===
-    {
-        "name": "AWS News Blog",
-        "url": "https://aws.amazon.com/blogs/aws/feed/",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 120
-    },
-    {
-        "name": "Google Cloud Blog",
-        "url": "https://cloud.google.com/blog/rss",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 120
-    },
-    {
-        "name": "Azure Blog",
-        "url": "https://azure.microsoft.com/en-us/blog/feed/",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 120
-    },
-    {
-        "name": "Docker Blog",
-        "url": "https://www.docker.com/blog/feed/",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 1440
-    },
-    {
-        "name": "Kubernetes Blog",
-        "url": "https://kubernetes.io/feed.xml",
-        "type": "rss",
-        "category": "developer",
-        "update_frequency": 1440
-    },
-
-    # === SECURITY ===
-    {
-        "name": "Krebs on Security",
-        "url": "https://krebsonsecurity.com/feed/",
-        "type": "rss",
-        "category": "tech",
-        "update_frequency": 1440
-    },
-    {
-        "name": "The Hacker News",
-        "url": "https://feeds.feedburner.com/TheHackersNews",
-        "type": "rss",
-        "category": "tech",
-        "update_frequency": 120
-    },
-    {
-        "name": "BleepingComputer",
-        "url": "https://www.bleepingcomputer.com/feed/",
-        "type": "rss",
-        "category": "tech",
-        "update_frequency": 120
-    },
-
-    # === BUSINESS & STARTUPS ===
-    {
-        "name": "Y Combinator Blog",
-        "url": "https://www.ycombinator.com/blog/feed",
-        "type": "rss",
-        "category": "business",
-        "update_frequency": 1440
-    },
-    {
-        "name": "First Round Review",
-        "url": "https://review.firstround.com/feed",
-        "type": "rss",
-        "category": "business",
-        "update_frequency": 1440
-    },
-    {
-        "name": "a16z",
-        "url": "https://a16z.com/feed/",
-        "type": "rss",
-        "category": "business",
-        "update_frequency": 1440
-    },
-    {
-        "name": "Product Hunt",
-        "url": "https://www.producthunt.com/feed",
-        "type": "rss",
-        "category": "business",
-        "update_frequency": 60
-    },
-
-    # === DESIGN ===
-    {
-        "name": "Nielsen Norman Group",
-        "url": "https://www.nngroup.com/feed/rss/",
-        "type": "rss",
-        "category": "design",
-        "update_frequency": 1440
-    },
-    {
-        "name": "A List Apart",
-        "url": "https://alistapart.com/main/feed/",
-        "type": "rss",
-        "category": "design",
-        "update_frequency": 1440
-    },
-    {
-        "name": "Sidebar",
-        "url": "https://sidebar.io/feed",
-        "type": "rss",
-        "category": "design",
-        "update_frequency": 1440
-    },
-]
-
-
-async def seed_database():
-    """Seed the database with curated feed sources"""
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+from typing import List, NamedTuple, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Database path (resolved from this file, not the working directory)
+DB_PATH = Path(__file__).resolve().parent.parent.parent / "prisma" / "data" / "dashboard.db"
+
+def generate_cuids(count: int) -> List[str]:
+    """Generate `count` simple unique IDs from a single os.urandom call"""
+    raw = os.urandom(12 * count)
+    return ["cl" + raw[i:i + 12].hex() for i in range(0, len(raw), 12)]
+
+
+class FeedSource(NamedTuple):
+    """Seed row in feed_sources column order"""
+
+    name: str
+    url: str
+    type: str
+    category: str
+    update_frequency: int
+
+
+# Curated feed sources (kept in JSON so edits don't touch code)
+FEED_SOURCES_PATH = Path(__file__).with_name("feed_sources.json")
+
+INSERT_FEED_SOURCE_PREFIX = """
+    INSERT INTO feed_sources (
+        id, name, url, type, category, updateFrequency,
+        enabled, createdAt, updatedAt
+    ) VALUES """
+ROW_PLACEHOLDER = "(?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+# Existing rows (matched on their unique url) keep id/createdAt and only
+# refresh the curated fields, so reseeding doesn't rewrite the whole table
+UPSERT_FEED_SOURCE_SUFFIX = """
+    ON CONFLICT(url) DO UPDATE SET
+        name = excluded.name,
+        type = excluded.type,
+        category = excluded.category,
+        updateFrequency = excluded.updateFrequency,
+        updatedAt = excluded.updatedAt
+"""
+INSERT_FEED_SOURCE_SQL = INSERT_FEED_SOURCE_PREFIX + ROW_PLACEHOLDER + UPSERT_FEED_SOURCE_SUFFIX
+
+# ON CONFLICT(url) needs a unique index on url; the Prisma schema doesn't
+# define feed_sources, so make sure one exists (Prisma's naming, idempotent)
+CREATE_URL_INDEX_SQL = (
+    'CREATE UNIQUE INDEX IF NOT EXISTS "feed_sources_url_key" ON feed_sources (url)'
+)
+
+# SQLite's default limit is 999 bound parameters per statement (9 per row)
+ROWS_PER_INSERT = 999 // 9
+
+
+@lru_cache(maxsize=8)
+def upsert_feed_sources_sql(row_count: int) -> str:
+    """
+    Multi-row upsert statement for `row_count` rows
+
+    Cached so repeated chunk sizes reuse the same SQL text, which is what the
+    connection's prepared-statement cache is keyed on.
+    """
+    return (
+        INSERT_FEED_SOURCE_PREFIX
+        + ",".join([ROW_PLACEHOLDER] * row_count)
+        + UPSERT_FEED_SOURCE_SUFFIX
+    )
 
-    print(f"Seeding database with {len(FEED_SOURCES)} feed sources...")
 
-    # Connect to database
-    conn = sqlite3.connect(DB_PATH)
+def drop_secondary_indexes(cursor: sqlite3.Cursor) -> List[str]:
+    """
+    Drop the non-unique, explicitly created indexes on feed_sources
+
+    Args:
+        cursor: Cursor inside the seeding transaction
+
+    Returns:
+        CREATE INDEX statements to recreate the dropped indexes
+    """
+    cursor.execute("""
+        SELECT m.name, m.sql
+        FROM sqlite_master AS m
+        JOIN pragma_index_list('feed_sources') AS i ON i.name = m.name
+        WHERE m.type = 'index' AND m.sql IS NOT NULL AND i."unique" = 0
+    """)
+    indexes = cursor.fetchall()
+    for name, _ in indexes:
+        cursor.execute(f'DROP INDEX "{name}"')
+    return [index_sql for _, index_sql in indexes]
+
+
+def load_feed_sources(raw: bytes) -> Tuple[FeedSource, ...]:
+    """Parse feed_sources.json contents into FeedSource rows"""
+    return tuple(FeedSource(**feed) for feed in orjson.loads(raw))
+
+
+def seed_database():
+    """Seed the database with curated feed sources"""
+
+    feed_sources = load_feed_sources(FEED_SOURCES_PATH.read_bytes())
+
+    # Connect to database (autocommit mode; the transaction is managed explicitly)
+    conn = sqlite3.connect(
+        f"{Path(DB_PATH).as_uri()}?mode=rwc",
+        uri=True,
+        isolation_level=None,
+        cached_statements=256
+    )
+    # Connection-scoped bulk-write pragmas only; the journal mode and locking
+    # mode of the shared app database are left alone
+    conn.executescript("""
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-64000;
+    """)
     cursor = conn.cursor()
 
     # Check if table exists
@@ -517,62 +147,102 @@ async def seed_database():
     """)
 
     if not cursor.fetchone():
-        print("Error: feed_sources table does not exist. Please run migrations first.")
+        logger.error("feed_sources table does not exist. Please run migrations first.")
         conn.close()
         return
 
-    # Clear existing seeds (optional - comment out to keep existing)
-    cursor.execute("DELETE FROM feed_sources")
-    print("Cleared existing feed sources")
-
-    # Insert feed sources
-    inserted_count = 0
-    skipped_count = 0
+    # Skip the write when every curated feed is already stored unchanged;
+    # deleted or edited feeds make the rows differ and are reseeded
+    cursor.execute("SELECT name, url, type, category, updateFrequency FROM feed_sources")
+    if set(feed_sources) <= set(cursor.fetchall()):
+        logger.info("Feed sources already up to date, nothing to do.")
+        conn.close()
+        return
 
-    for feed in FEED_SOURCES:
+    logger.info("Seeding database with %d feed sources...", len(feed_sources))
+
+    # One seeding timestamp and one batch of IDs shared by every row
+    now_iso = datetime.now().isoformat()
+    feed_ids = generate_cuids(len(feed_sources))
+
+    # Upsert inside one transaction so SQLite flushes once; IMMEDIATE takes
+    # the write lock up front instead of upgrading from a shared lock
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        # Drop non-unique secondary indexes for the bulk load and rebuild them
+        # once afterwards; unique indexes stay since ON CONFLICT needs them
+        secondary_indexes = drop_secondary_indexes(cursor)
+        cursor.execute(CREATE_URL_INDEX_SQL)
+
+        # Upsert feed sources with as few multi-row statements as possible
+        rows = [
+            (feed_id, name, url, feed_type, category, update_frequency, 1, now_iso, now_iso)
+            for feed_id, (name, url, feed_type, category, update_frequency)
+            in zip(feed_ids, feed_sources)
+        ]
+
+        inserted_count = 0
+        skipped: List[str] = []
+        failed: List[str] = []
+
+        cursor.execute("SAVEPOINT seed_rows")
         try:
-            cursor.execute("""
-                INSERT INTO feed_sources (
-                    id, name, url, type, category, updateFrequency,
-                    enabled, createdAt, updatedAt
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                generate_cuid(),  # Generate unique ID
-                feed["name"],
-                feed["url"],
-                feed["type"],
-                feed["category"],
-                feed["update_frequency"],
-                1,  # enabled = true
-                datetime.now().isoformat(),
-                datetime.now().isoformat()
-            ))
-            inserted_count += 1
-        except sqlite3.IntegrityError as e:
-            print(f"WARNING: Skipped duplicate: {feed['name']}")
-            skipped_count += 1
-        except Exception as e:
-            print(f"ERROR inserting {feed['name']}: {e}")
-            skipped_count += 1
-
-    # Commit changes
-    conn.commit()
-    conn.close()
-
-    # Print summary
-    print(f"\nDatabase seeding complete!")
-    print(f"   Inserted: {inserted_count} feeds")
-    print(f"   Skipped: {skipped_count} feeds")
-    print(f"\nCategory breakdown:")
-
-    category_counts = {}
-    for feed in FEED_SOURCES:
-        category = feed["category"]
-        category_counts[category] = category_counts.get(category, 0) + 1
-
-    for category, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True):
-        print(f"   {category.capitalize()}: {count} feeds")
+            for start in range(0, len(rows), ROWS_PER_INSERT):
+                chunk = rows[start:start + ROWS_PER_INSERT]
+                cursor.execute(
+                    upsert_feed_sources_sql(len(chunk)),
+                    list(chain.from_iterable(chunk))
+                )
+            inserted_count = len(rows)
+        except sqlite3.IntegrityError:
+            # Undo the partial batch and upsert row by row to skip bad rows;
+            # the single-row SQL is a constant, so it is prepared only once
+            cursor.execute("ROLLBACK TO seed_rows")
+            for feed, row in zip(feed_sources, rows):
+                try:
+                    cursor.execute(INSERT_FEED_SOURCE_SQL, row)
+                    inserted_count += 1
+                except sqlite3.IntegrityError:
+                    skipped.append(feed.name)
+                except Exception as e:
+                    failed.append(f"{feed.name}: {e}")
+        cursor.execute("RELEASE seed_rows")
+
+        for index_sql in secondary_indexes:
+            cursor.execute(index_sql)
+
+        cursor.execute("COMMIT")
+    except Exception:
+        cursor.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+    # Summary (collected, then logged once rather than per row)
+    if skipped:
+        logger.warning("Skipped %d conflicting feeds: %s", len(skipped), ", ".join(skipped))
+    if failed:
+        logger.error("Failed to insert %d feeds: %s", len(failed), "; ".join(failed))
+
+    category_counts = Counter(feed.category for feed in feed_sources)
+    breakdown = "\n".join(
+        f"   {category.capitalize()}: {count} feeds"
+        for category, count in category_counts.most_common()
+    )
+    logger.info(
+        "Database seeding complete!\n   Upserted: %d feeds\n   Skipped: %d feeds\n"
+        "Category breakdown:\n%s",
+        inserted_count, len(skipped) + len(failed), breakdown
+    )
 
 
 if __name__ == "__main__":
-    asyncio.run(seed_database())
+    # Buffer records and write them in one go (errors flush immediately)
+    handler = logging.handlers.MemoryHandler(
+        capacity=100,
+        flushLevel=logging.ERROR,
+        target=logging.StreamHandler(sys.stdout)
+    )
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[handler])
+    seed_database()
+    logging.shutdown()
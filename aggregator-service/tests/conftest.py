@@ -2,140 +2,396 @@
 Shared test fixtures and configuration for aggregator service tests.
 """
 
+import copy
+import inspect
+import httpx
+import orjson
 import pytest
+import pytest_asyncio
+import respx
+from collections import Counter
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Dict, List
+from unittest.mock import patch
 
-# Test data fixtures
+from app.analyzers.deduplicator import ArticleDeduplicator
+from app.analyzers.hot_scorer import HotScorer
+from app.fetchers.hackernews import BASE_URL as HN_BASE_URL, HackerNewsFetcher
+from app.fetchers.http_client import CircuitBreaker
+from app.fetchers.rss import RSSFetcher
 
-@pytest.fixture
-def sample_article():
+
+def _json_response(obj, status_code: int = 200) -> httpx.Response:
+    """Mock JSON response with the body encoded by orjson."""
+    return httpx.Response(
+        status_code,
+        content=orjson.dumps(obj),
+        headers={"content-type": "application/json"},
+    )
+
+
+# Test data fixtures (session-scoped and read-only; copy before mutating)
+
+@pytest.fixture(scope="session")
+def _now():
+    """Single reference time shared by all sample data."""
+    return datetime.now()
+
+
+@pytest.fixture(scope="session")
+def _now_iso(_now):
+    """ISO-8601 form of the shared reference time."""
+    return _now.isoformat()
+
+
+@pytest.fixture(scope="session")
+def sample_article(_now_iso):
     """Sample article data for testing."""
-    return {
+    return MappingProxyType({
         "title": "GPT-5 Release Announcement",
         "url": "https://example.com/gpt5-release",
         "source": "TechNews",
-        "published_at": datetime.now().isoformat(),
+        "published_at": _now_iso,
         "score": 100,
         "comments": 50,
-    }
+    })
 
 
-@pytest.fixture
-def sample_articles():
+@pytest.fixture(scope="session")
+def sample_articles(_now):
     """Multiple sample articles for testing."""
-    base_time = datetime.now()
-    return [
-        {
+    base_time = _now
+    return (
+        MappingProxyType({
             "title": "GPT-5 launches with new features",
             "url": "https://example.com/gpt5",
             "source": "HackerNews",
             "published_at": (base_time - timedelta(hours=2)).isoformat(),
             "score": 150,
             "comments": 75,
-        },
-        {
+        }),
+        MappingProxyType({
             "title": "Rust async programming improvements",
             "url": "https://example.com/rust-async",
             "source": "Reddit",
             "published_at": (base_time - timedelta(hours=5)).isoformat(),
             "score": 80,
             "comments": 30,
-        },
-        {
+        }),
+        MappingProxyType({
             "title": "Python 3.13 beta released",
             "url": "https://example.com/python-313",
             "source": "Medium",
             "published_at": (base_time - timedelta(hours=8)).isoformat(),
             "score": 60,
             "comments": 20,
-        },
-    ]
+        }),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def scored_sample_articles(sample_articles):
+    """sample_articles scored once with a default HotScorer (read-only)."""
+    return tuple(
+        MappingProxyType(article)
+        for article in HotScorer().score_articles(sample_articles)
+    )
+
+
+@pytest.fixture(scope="session")
 def sample_keywords():
     """Sample keywords with counts for testing."""
-    return {
+    return MappingProxyType({
         "gpt-5 launches": 15,
         "rust async programming": 8,
         "python 3.13 beta": 5,
         "machine learning models": 12,
         "docker container optimization": 7,
-    }
+    })
 
 
-@pytest.fixture
-def sample_hackernews_story():
+@pytest.fixture(scope="session")
+def sample_hackernews_story(_now):
     """Sample Hacker News story data."""
-    return {
+    return MappingProxyType({
         "id": 12345,
         "title": "Show HN: My New Project",
         "url": "https://example.com/project",
         "score": 100,
         "descendants": 50,
-        "time": int(datetime.now().timestamp()),
+        "time": int(_now.timestamp()),
         "type": "story",
         "by": "username",
-    }
+    })
 
 
-@pytest.fixture
-def sample_reddit_post():
+@pytest.fixture(scope="session")
+def sample_reddit_post(_now):
     """Sample Reddit post data."""
-    return {
+    return MappingProxyType({
         "id": "abc123",
         "title": "Interesting development in AI",
         "url": "https://example.com/ai-development",
         "score": 250,
         "num_comments": 75,
-        "created_utc": datetime.now().timestamp(),
+        "created_utc": _now.timestamp(),
         "subreddit": "technology",
         "author": "testuser",
         "selftext": "This is the post content...",
-    }
+    })
 
 
-@pytest.fixture
-def sample_rss_entry():
+@pytest.fixture(scope="session")
+def sample_rss_entry(_now_iso):
     """Sample RSS feed entry."""
-    return {
+    return MappingProxyType({
         "title": "New Framework Released",
         "link": "https://example.com/framework",
-        "published": datetime.now().isoformat(),
+        "published": _now_iso,
         "summary": "A new web framework has been released...",
         "author": "Framework Team",
-    }
+    })
 
 
-@pytest.fixture
-def mock_keyword_history():
+@pytest.fixture(scope="session")
+def mock_keyword_history(_now):
     """Mock historical keyword data for velocity testing."""
-    base_date = datetime.now()
-    return [
-        {
+    base_date = _now
+    return (
+        MappingProxyType({
             "keyword": "gpt-5",
             "mentions": 10,
             "date": (base_date - timedelta(days=7)).isoformat(),
-        },
-        {
+        }),
+        MappingProxyType({
             "keyword": "gpt-5",
             "mentions": 15,
             "date": (base_date - timedelta(days=6)).isoformat(),
-        },
-        {
+        }),
+        MappingProxyType({
             "keyword": "gpt-5",
             "mentions": 20,
             "date": (base_date - timedelta(days=5)).isoformat(),
-        },
-        {
+        }),
+        MappingProxyType({
             "keyword": "rust async",
             "mentions": 5,
             "date": (base_date - timedelta(days=7)).isoformat(),
-        },
-        {
+        }),
+        MappingProxyType({
             "keyword": "rust async",
             "mentions": 8,
             "date": (base_date - timedelta(days=5)).isoformat(),
-        },
-    ]
+        }),
+    )
+
+
+@pytest.fixture(scope="module")
+def dedup_factory():
+    """
+    Factory for fresh ArticleDeduplicator instances.
+
+    Building a MinHashLSH index solves for its band/row parameters, so one
+    empty deduplicator is built per (threshold, num_perm) and each test gets
+    a deep copy of it with an independent, empty index.
+    """
+    templates = {}
+
+    def make(threshold: float = 0.5, num_perm: int = 128) -> ArticleDeduplicator:
+        key = (threshold, num_perm)
+        if key not in templates:
+            templates[key] = ArticleDeduplicator(threshold=threshold, num_perm=num_perm)
+        return copy.deepcopy(templates[key])
+
+    return make
+
+
+@pytest.fixture(scope="module")
+def _praw_reddit_patch():
+    """Patch praw.Reddit once per test module."""
+    with patch("app.fetchers.reddit.praw.Reddit") as mock_class:
+        yield mock_class
+
+
+@pytest.fixture
+def mock_reddit_class(_praw_reddit_patch):
+    """Module-patched praw.Reddit class, reset before each test."""
+    _praw_reddit_patch.reset_mock(return_value=True, side_effect=True)
+    return _praw_reddit_patch
+
+
+@pytest.fixture(scope="module")
+def _feedparser_patch():
+    """Patch feedparser.parse (as used by the RSS fetcher) once per test module."""
+    with patch("app.fetchers.rss.feedparser.parse") as mock_parse:
+        yield mock_parse
+
+
+@pytest.fixture
+def mock_parse(_feedparser_patch):
+    """Module-patched feedparser.parse, reset before each test."""
+    _feedparser_patch.reset_mock(return_value=True, side_effect=True)
+    return _feedparser_patch
+
+
+@pytest.fixture(scope="module")
+def _respx_router():
+    """respx router started once per test module."""
+    with respx.mock(assert_all_called=False) as router:
+        yield router
+
+
+@pytest.fixture
+def router(_respx_router):
+    """Module-shared respx router with routes and call history cleared."""
+    _respx_router.clear()
+    _respx_router.reset()
+    return _respx_router
+
+
+class MockHNApi:
+    """
+    In-memory HN API served to the fetcher through httpx.MockTransport.
+
+    Outcomes are registered per URL (query string ignored) and looked up with
+    a single dict access per request. An outcome is an httpx.Response, an
+    exception to raise, or a (sync or async) callable taking the request.
+    Unregistered URLs answer 404.
+    """
+
+    def __init__(self):
+        self._routes: Dict[str, List] = {}
+        self.calls: Counter = Counter()
+
+    def reset(self):
+        """Forget all registered outcomes and call counts."""
+        self._routes.clear()
+        self.calls.clear()
+
+    def respond(self, url: str, *outcomes):
+        """Serve outcomes for url in order, repeating the last one."""
+        self._routes[url] = list(outcomes)
+
+    def items(self, stories_by_id: Dict[int, Dict], listing: str = None):
+        """
+        Serve {story_id: item_json} (and optionally a listing such as
+        "topstories" returning the ids in order). Bodies are encoded once
+        here rather than on every request.
+        """
+        if listing:
+            self.respond(f"{HN_BASE_URL}/{listing}.json", _json_response(list(stories_by_id)))
+        for story_id, story in stories_by_id.items():
+            self.respond(f"{HN_BASE_URL}/item/{story_id}.json", _json_response(story))
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """MockTransport handler: serve the next outcome registered for the URL."""
+        url = str(request.url.copy_with(query=None))
+        self.calls[url] += 1
+        outcomes = self._routes.get(url)
+        if not outcomes:
+            return httpx.Response(404)
+
+        outcome = outcomes.pop(0) if len(outcomes) > 1 else outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        if callable(outcome):
+            outcome = outcome(request)
+            if inspect.isawaitable(outcome):
+                outcome = await outcome
+        # Fresh Response per request so repeated outcomes never share state
+        return httpx.Response(
+            outcome.status_code, headers=outcome.headers, content=outcome.content
+        )
+
+
+@pytest.fixture(scope="module")
+def _hn_api():
+    """MockHNApi shared by a test module (reset per test via hn_api)."""
+    return MockHNApi()
+
+
+@pytest.fixture
+def hn_api(_hn_api):
+    """Module-shared MockHNApi with no registered outcomes."""
+    _hn_api.reset()
+    return _hn_api
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def _hn_client(_hn_api):
+    """Client shared by a test module, answered by the fake HN API."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_hn_api.handle))
+    yield client
+    await client.aclose()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def _shared_hn_fetcher(_hn_client):
+    """One HackerNewsFetcher per test module, closed once at the end."""
+    fetcher = HackerNewsFetcher(client=_hn_client)
+    yield fetcher
+    await fetcher.close()
+
+
+@pytest.fixture
+def hn_fetcher(_shared_hn_fetcher, hn_api):
+    """
+    Module-shared HackerNewsFetcher with per-test state reset.
+
+    The caches, circuit breaker and fake API routes are cleared before each
+    test so mocked responses from one test never leak into the next.
+    """
+    _shared_hn_fetcher._ids_cache.clear()
+    _shared_hn_fetcher._item_cache.clear()
+    _shared_hn_fetcher._score_cache.clear()
+    _shared_hn_fetcher._circuit = CircuitBreaker()
+    return _shared_hn_fetcher
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def _shared_rss_fetcher():
+    """One RSSFetcher (and HTTP client) per test module, closed once at the end."""
+    fetcher = RSSFetcher()
+    yield fetcher
+    await fetcher.close()
+
+
+@pytest.fixture
+def rss_fetcher(_shared_rss_fetcher):
+    """
+    Module-shared RSSFetcher with per-test state reset.
+
+    The parsed-feed cache and conditional request validators are cleared so
+    one test's feeds are never served to the next.
+    """
+    _shared_rss_fetcher._feed_cache.clear()
+    _shared_rss_fetcher._validators.clear()
+    return _shared_rss_fetcher
+
+
+@pytest.fixture(scope="session")
+def json_response():
+    """Helper building mock JSON responses (orjson-encoded)."""
+    return _json_response
+
+
+@pytest.fixture(scope="session")
+def hn_story(_now):
+    """
+    Factory for HN item payloads.
+
+    Returns a helper building a canonical story dict for story_id with any
+    fields overridden by keyword arguments.
+    """
+    base_story = MappingProxyType({
+        "type": "story",
+        "by": "testuser",
+        "descendants": 10,
+        "time": int(_now.timestamp()),
+    })
+
+    def make(story_id: int, **overrides) -> Dict:
+        return {**base_story, "id": story_id, **overrides}
+
+    return make
@@ -0,0 +1,63 @@
+"""
+Tests for the standardized article helpers
+"""
+
+import pytest
+
+from app.fetchers.article import canonical_url, clean_summary, dedupe_by_url
+
+
+@pytest.mark.unit
+class TestArticleHelpers:
+    """Test URL normalization, deduplication and summary cleaning"""
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            pytest.param(
+                "HTTPS://Example.com/story/#top",
+                "https://example.com/story",
+                id="case_fragment_slash",
+            ),
+            pytest.param(
+                "https://example.com/story?utm_source=feed&id=7",
+                "https://example.com/story?id=7",
+                id="utm_params",
+            ),
+            pytest.param(
+                "https://medium.com/@writer/post-123?source=rss----abc",
+                "https://medium.com/@writer/post-123",
+                id="medium_source_param",
+            ),
+        ],
+    )
+    def test_canonical_url(self, url, expected):
+        """Test that tracking noise is stripped from URLs"""
+        assert canonical_url(url) == expected
+
+    def test_dedupe_keeps_first_copy(self):
+        """Test that the first article with a canonical URL wins"""
+        articles = [
+            {"url": "https://example.com/story", "title": "First"},
+            {"url": "https://example.com/story/?utm_source=x", "title": "Second"},
+        ]
+
+        assert [a["title"] for a in dedupe_by_url(articles)] == ["First"]
+
+    def test_dedupe_keeps_articles_without_url(self):
+        """Test that articles missing a URL are never merged"""
+        articles = [
+            {"title": "No URL key"},
+            {"url": "", "title": "Empty URL"},
+            {"url": None, "title": "None URL"},
+            {"url": "", "title": "Another empty URL"},
+        ]
+
+        assert dedupe_by_url(articles) == articles
+
+    def test_clean_summary(self):
+        """Test that summaries lose tags, entities and extra whitespace"""
+        summary = "<p>Ship &amp; iterate</p>\n\n  <b>fast</b>"
+
+        assert clean_summary(summary) == "Ship & iterate fast"
+        assert clean_summary("x" * 400) == "x" * 300
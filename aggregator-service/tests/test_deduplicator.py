@@ -3,85 +3,101 @@ Tests for Deduplicator (MinHash + LSH)
 """
 
 import pytest
-from app.analyzers.deduplicator import ArticleDeduplicator
 
 
 @pytest.mark.unit
 class TestDeduplicator:
     """Test deduplication functionality"""
 
-    def test_deduplicate_identical_articles(self):
-        """Test deduplication of identical articles"""
-        dedup = ArticleDeduplicator(threshold=0.8)
-
-        articles = [
-            {"id": "1", "title": "Same Article Title", "text": "Same content here", "url": "http://example.com/1"},
-            {"id": "2", "title": "Same Article Title", "text": "Same content here", "url": "http://example.com/2"},
-        ]
-
-        unique = dedup.deduplicate_articles(articles)
-
-        # Should keep only one
-        assert len(unique) == 1
-
-    def test_deduplicate_different_articles(self):
-        """Test that different articles are kept"""
-        dedup = Deduplicator(threshold=0.8)
-
-        articles = [
-            {"id": "1", "title": "Article about Python", "text": "Python programming language", "url": "http://example.com/1"},
-            {"id": "2", "title": "Article about Rust", "text": "Rust programming language", "url": "http://example.com/2"},
-        ]
-
-        unique = dedup.deduplicate_articles(articles)
-
-        # Should keep both
-        assert len(unique) == 2
-
-    def test_similar_but_not_identical_articles(self):
-        """Test articles that are similar but not identical"""
-        dedup = Deduplicator(threshold=0.9)  # High threshold
-
-        articles = [
-            {"id": "1", "title": "GPT-5 announced by OpenAI", "text": "OpenAI announces GPT-5", "url": "http://example.com/1"},
-            {"id": "2", "title": "OpenAI announces GPT-5", "text": "GPT-5 has been announced", "url": "http://example.com/2"},
-        ]
+    @pytest.mark.parametrize(
+        "threshold,articles,min_unique,max_unique",
+        [
+            pytest.param(
+                0.8,
+                [
+                    {"id": "1", "title": "Same Article Title", "text": "Same content here", "url": "http://example.com/1"},
+                    {"id": "2", "title": "Same Article Title", "text": "Same content here", "url": "http://example.com/2"},
+                ],
+                1, 1,
+                id="identical_articles",
+            ),
+            pytest.param(
+                0.8,
+                [
+                    {"id": "1", "title": "Article about Python", "text": "Python programming language", "url": "http://example.com/1"},
+                    {"id": "2", "title": "Article about Rust", "text": "Rust programming language", "url": "http://example.com/2"},
+                ],
+                2, 2,
+                id="different_articles",
+            ),
+            pytest.param(
+                0.9,  # High threshold: may be 1 or 2 depending on exact similarity
+                [
+                    {"id": "1", "title": "GPT-5 announced by OpenAI", "text": "OpenAI announces GPT-5", "url": "http://example.com/1"},
+                    {"id": "2", "title": "OpenAI announces GPT-5", "text": "GPT-5 has been announced", "url": "http://example.com/2"},
+                ],
+                1, 2,
+                id="similar_but_not_identical",
+            ),
+            pytest.param(
+                0.9,  # Deduplicate based on content, not URL
+                [
+                    {"id": "1", "title": "Exact Same Title", "text": "Exact same content", "url": "http://site1.com"},
+                    {"id": "2", "title": "Exact Same Title", "text": "Exact same content", "url": "http://site2.com"},
+                ],
+                1, 1,
+                id="only_url_different",
+            ),
+            pytest.param(
+                0.85,  # Should detect cross-source duplicates
+                [
+                    {"id": "1", "title": "Breaking News Story", "text": "Important event happened", "source": "HackerNews", "url": "http://hn.com/1"},
+                    {"id": "2", "title": "Breaking News Story", "text": "Important event occurred", "source": "Reddit", "url": "http://reddit.com/1"},
+                    {"id": "3", "title": "Breaking News Story", "text": "Important event took place", "source": "Medium", "url": "http://medium.com/1"},
+                ],
+                1, 2,
+                id="cross_source",
+            ),
+        ],
+    )
+    def test_dedup_variants(self, dedup_factory, threshold, articles, min_unique, max_unique):
+        """Test how many articles survive deduplication at a given threshold"""
+        dedup = dedup_factory(threshold=threshold)
 
         unique = dedup.deduplicate_articles(articles)
 
-        # With high threshold, should detect as duplicates
-        assert len(unique) <= 2  # May be 1 or 2 depending on exact similarity
+        assert min_unique <= len(unique) <= max_unique
 
-    def test_preserves_first_occurrence(self, sample_articles):
+    def test_preserves_first_occurrence(self, dedup_factory, sample_articles):
         """Test that first occurrence of duplicate is preserved"""
-        dedup = Deduplicator()
+        dedup = dedup_factory()
 
         # Add a duplicate of the first article
-        articles = sample_articles + [sample_articles[0].copy()]
+        articles = [*sample_articles, sample_articles[0].copy()]
 
         unique = dedup.deduplicate_articles(articles)
 
         # Should have deduplicated
         assert len(unique) < len(articles)
 
-    def test_empty_articles_list(self):
+    def test_empty_articles_list(self, dedup_factory):
         """Test handling of empty articles list"""
-        dedup = Deduplicator()
+        dedup = dedup_factory()
 
-        unique = dedup.deduplicate([])
+        unique = dedup.deduplicate_articles([])
 
         assert unique == []
 
-    def test_single_article(self, sample_article):
+    def test_single_article(self, dedup_factory, sample_article):
         """Test with single article"""
-        dedup = Deduplicator()
+        dedup = dedup_factory()
 
-        unique = dedup.deduplicate([sample_article])
+        unique = dedup.deduplicate_articles([sample_article])
 
         assert len(unique) == 1
         assert unique[0] == sample_article
 
-    def test_threshold_affects_strictness(self):
+    def test_threshold_affects_strictness(self, dedup_factory):
         """Test that threshold parameter affects deduplication strictness"""
         articles = [
             {"id": "1", "title": "Machine learning tutorial", "text": "Learn ML basics", "url": "http://example.com/1"},
@@ -89,19 +105,19 @@ class TestDeduplicator:
         ]
 
         # Low threshold (lenient - more duplicates detected)
-        lenient_dedup = Deduplicator(threshold=0.5)
-        lenient_unique = lenient_dedup.deduplicate(articles)
+        lenient_dedup = dedup_factory(threshold=0.5)
+        lenient_unique = lenient_dedup.deduplicate_articles(articles)
 
         # High threshold (strict - fewer duplicates detected)
-        strict_dedup = Deduplicator(threshold=0.95)
-        strict_unique = strict_dedup.deduplicate(articles)
+        strict_dedup = dedup_factory(threshold=0.95)
+        strict_unique = strict_dedup.deduplicate_articles(articles)
 
         # Lenient should find more duplicates (keep fewer articles)
         assert len(lenient_unique) <= len(strict_unique)
 
-    def test_articles_without_text_field(self):
+    def test_articles_without_text_field(self, dedup_factory):
         """Test handling articles with missing text field"""
-        dedup = Deduplicator()
+        dedup = dedup_factory()
 
         articles = [
             {"id": "1", "title": "Title Only Article", "url": "http://example.com/1"},
@@ -114,26 +130,12 @@ class TestDeduplicator:
         assert isinstance(unique, list)
         assert len(unique) <= len(articles)
 
-    def test_articles_with_only_url_different(self):
-        """Test that articles with same content but different URLs are deduplicated"""
-        dedup = Deduplicator(threshold=0.9)
-
-        articles = [
-            {"id": "1", "title": "Exact Same Title", "text": "Exact same content", "url": "http://site1.com"},
-            {"id": "2", "title": "Exact Same Title", "text": "Exact same content", "url": "http://site2.com"},
-        ]
-
-        unique = dedup.deduplicate_articles(articles)
-
-        # Should deduplicate based on content, not URL
-        assert len(unique) == 1
-
-    def test_deduplication_preserves_first(self, sample_articles):
+    def test_deduplication_preserves_first(self, dedup_factory, sample_articles):
         """Test that deduplication preserves first occurrence"""
-        dedup = ArticleDeduplicator()
+        dedup = dedup_factory()
 
         # Add some duplicates
-        articles_with_dupes = sample_articles + [sample_articles[0].copy(), sample_articles[1].copy()]
+        articles_with_dupes = [*sample_articles, sample_articles[0].copy(), sample_articles[1].copy()]
 
         unique = dedup.deduplicate_articles(articles_with_dupes)
 
@@ -141,9 +143,9 @@ class TestDeduplicator:
         assert len(unique) < len(articles_with_dupes)
         assert len(unique) == len(sample_articles)
 
-    def test_preserve_metadata(self):
+    def test_preserve_metadata(self, dedup_factory):
         """Test that article metadata is preserved during deduplication"""
-        dedup = ArticleDeduplicator()
+        dedup = dedup_factory()
 
         articles = [
             {
@@ -174,19 +176,19 @@ class TestDeduplicator:
             assert "score" in article
             assert "published_at" in article
 
-    def test_find_duplicates_method(self, sample_articles):
+    def test_find_duplicates_method(self, dedup_factory, sample_articles):
         """Test finding duplicate groups"""
-        dedup = ArticleDeduplicator(threshold=0.8)
+        dedup = dedup_factory(threshold=0.8)
 
         # Add a duplicate
-        articles_with_dupes = sample_articles + [sample_articles[0].copy()]
+        articles_with_dupes = [*sample_articles, sample_articles[0].copy()]
 
         duplicates = dedup.find_duplicates(articles_with_dupes)
 
         # Should find duplicate groups
         assert isinstance(duplicates, dict)
 
-    def test_num_perm_affects_accuracy(self):
+    def test_num_perm_affects_accuracy(self, dedup_factory):
         """Test that num_perm parameter affects accuracy"""
         articles = [
             {"id": "1", "title": "Article about AI", "text": "Artificial intelligence content", "url": "http://example.com/1"},
@@ -194,28 +196,13 @@ class TestDeduplicator:
         ]
 
         # Lower num_perm (faster but less accurate)
-        fast_dedup = ArticleDeduplicator(threshold=0.8, num_perm=64)
+        fast_dedup = dedup_factory(threshold=0.8, num_perm=64)
         fast_unique = fast_dedup.deduplicate_articles(articles)
 
         # Higher num_perm (slower but more accurate)
-        accurate_dedup = ArticleDeduplicator(threshold=0.8, num_perm=256)
+        accurate_dedup = dedup_factory(threshold=0.8, num_perm=256)
         accurate_unique = accurate_dedup.deduplicate_articles(articles)
 
         # Both should work
         assert isinstance(fast_unique, list)
         assert isinstance(accurate_unique, list)
-
-    def test_cross_source_deduplication(self):
-        """Test deduplication across different sources"""
-        dedup = ArticleDeduplicator(threshold=0.85)
-
-        articles = [
-            {"id": "1", "title": "Breaking News Story", "text": "Important event happened", "source": "HackerNews", "url": "http://hn.com/1"},
-            {"id": "2", "title": "Breaking News Story", "text": "Important event occurred", "source": "Reddit", "url": "http://reddit.com/1"},
-            {"id": "3", "title": "Breaking News Story", "text": "Important event took place", "source": "Medium", "url": "http://medium.com/1"},
-        ]
-
-        unique = dedup.deduplicate_articles(articles)
-
-        # Should detect cross-source duplicates
-        assert len(unique) < len(articles)
@@ -2,11 +2,12 @@
 Tests for Hacker News Fetcher
 """
 
+import asyncio
+import functools
 import pytest
-import respx
 import httpx
-from datetime import datetime, timezone
 
+import app.fetchers.hackernews as hackernews_module
 from app.fetchers.hackernews import HackerNewsFetcher, fetch_trending_hn, BASE_URL
 
 
@@ -15,257 +16,298 @@ from app.fetchers.hackernews import HackerNewsFetcher, fetch_trending_hn, BASE_U
 class TestHackerNewsFetcher:
     """Test HackerNews fetcher functionality"""
 
-    @respx.mock
-    async def test_fetch_top_stories_success(self):
-        """Test successful fetch of top stories"""
-        # Mock the top stories endpoint
-        story_ids = [12345, 12346, 12347]
-        respx.get(f"{BASE_URL}/topstories.json").mock(
-            return_value=httpx.Response(200, json=story_ids)
-        )
-
-        # Mock individual story endpoints
-        for i, story_id in enumerate(story_ids):
-            story_data = {
-                "id": story_id,
-                "type": "story",
-                "title": f"Test Story {i+1}",
-                "url": f"https://example.com/story{i+1}",
-                "score": 100 + i * 10,
-                "by": "testuser",
-                "descendants": 50,
-                "time": int(datetime.now(timezone.utc).timestamp()),
-            }
-            respx.get(f"{BASE_URL}/item/{story_id}.json").mock(
-                return_value=httpx.Response(200, json=story_data)
+    @pytest.mark.parametrize(
+        "method,listing,scores,kwargs,expected_scores",
+        [
+            pytest.param(
+                "fetch_top_stories", "topstories", [100, 110, 120], {}, [100, 110, 120],
+                id="top_stories",
+            ),
+            pytest.param(
+                # Only stories with score >= 100 should be returned
+                "fetch_top_stories", "topstories", [50, 100, 150], {"min_score": 100}, [100, 150],
+                id="top_stories_min_score",
+            ),
+            pytest.param(
+                "fetch_best_stories", "beststories", [200, 200], {}, [200, 200],
+                id="best_stories",
+            ),
+        ],
+    )
+    async def test_fetch_stories(
+        self, hn_fetcher, hn_api, hn_story, method, listing, scores, kwargs,
+        expected_scores
+    ):
+        """Test fetching a story listing, with and without a score filter"""
+        story_ids = [12345 + i for i in range(len(scores))]
+        hn_api.items({
+            story_id: hn_story(
+                story_id,
+                title=f"Story with score {score}",
+                url=f"https://example.com/story{i+1}",
+                score=score,
             )
+            for i, (story_id, score) in enumerate(zip(story_ids, scores))
+        }, listing=listing)
 
-        fetcher = HackerNewsFetcher()
-        try:
-            stories = await fetcher.fetch_top_stories(limit=3)
-
-            assert len(stories) == 3
-            assert stories[0]["title"] == "Test Story 1"
-            assert stories[0]["source"] == "HackerNews"
-            assert stories[0]["score"] == 100
-            assert "published_at" in stories[0]
-        finally:
-            await fetcher.close()
-
-    @respx.mock
-    async def test_fetch_top_stories_with_min_score(self):
-        """Test fetching stories with minimum score filter"""
-        story_ids = [12345, 12346, 12347]
-        respx.get(f"{BASE_URL}/topstories.json").mock(
-            return_value=httpx.Response(200, json=story_ids)
-        )
+        stories = await getattr(hn_fetcher, method)(limit=len(story_ids), **kwargs)
 
-        # Mock stories with different scores
-        scores = [50, 100, 150]
-        for story_id, score in zip(story_ids, scores):
-            story_data = {
-                "id": story_id,
-                "type": "story",
-                "title": f"Story with score {score}",
-                "url": f"https://example.com/story",
-                "score": score,
-                "by": "testuser",
-                "descendants": 10,
-                "time": int(datetime.now(timezone.utc).timestamp()),
-            }
-            respx.get(f"{BASE_URL}/item/{story_id}.json").mock(
-                return_value=httpx.Response(200, json=story_data)
-            )
+        assert [story["score"] for story in stories] == expected_scores
+        assert stories[0]["title"] == f"Story with score {expected_scores[0]}"
+        assert all(story["source"] == "HackerNews" for story in stories)
+        assert all("published_at" in story for story in stories)
 
-        fetcher = HackerNewsFetcher()
-        try:
-            # Only stories with score >= 100 should be returned
-            stories = await fetcher.fetch_top_stories(limit=3, min_score=100)
-
-            assert len(stories) == 2
-            assert all(story["score"] >= 100 for story in stories)
-        finally:
-            await fetcher.close()
-
-    @respx.mock
-    async def test_fetch_story_handles_deleted(self):
+    async def test_fetch_story_handles_deleted(self, hn_fetcher, hn_api, json_response):
         """Test that deleted stories are filtered out"""
         story_id = 12345
 
         # Mock deleted story
-        respx.get(f"{BASE_URL}/item/{story_id}.json").mock(
-            return_value=httpx.Response(200, json={"id": story_id, "deleted": True})
+        hn_api.respond(
+            f"{BASE_URL}/item/{story_id}.json", json_response({"id": story_id, "deleted": True})
         )
 
-        fetcher = HackerNewsFetcher()
-        try:
-            story = await fetcher._fetch_story(story_id)
-            assert story is None
-        finally:
-            await fetcher.close()
-
-    @respx.mock
-    async def test_fetch_story_handles_non_story_types(self):
+        story = await hn_fetcher._fetch_story(story_id)
+        assert story is None
+
+    async def test_fetch_story_handles_non_story_types(self, hn_fetcher, hn_api, json_response):
         """Test that non-story items (comments, polls) are filtered out"""
         story_id = 12345
 
         # Mock comment item
-        respx.get(f"{BASE_URL}/item/{story_id}.json").mock(
-            return_value=httpx.Response(
-                200,
-                json={"id": story_id, "type": "comment", "text": "This is a comment"}
+        hn_api.respond(
+            f"{BASE_URL}/item/{story_id}.json",
+            json_response(
+                {"id": story_id, "type": "comment", "text": "This is a comment"}
             )
         )
 
-        fetcher = HackerNewsFetcher()
-        try:
-            story = await fetcher._fetch_story(story_id)
-            assert story is None
-        finally:
-            await fetcher.close()
-
-    @respx.mock
-    async def test_fetch_story_with_ask_hn_post(self):
+        story = await hn_fetcher._fetch_story(story_id)
+        assert story is None
+
+    async def test_fetch_story_with_ask_hn_post(
+        self, hn_fetcher, hn_api, hn_story, json_response
+    ):
         """Test fetching Ask HN posts without URL"""
         story_id = 12345
-        story_data = {
-            "id": story_id,
-            "type": "story",
-            "title": "Ask HN: What's your favorite framework?",
-            "text": "I'm curious about what frameworks people use...",
-            "score": 75,
-            "by": "testuser",
-            "descendants": 30,
-            "time": int(datetime.now(timezone.utc).timestamp()),
-        }
-
-        respx.get(f"{BASE_URL}/item/{story_id}.json").mock(
-            return_value=httpx.Response(200, json=story_data)
+        story_data = hn_story(
+            story_id,
+            title="Ask HN: What's your favorite framework?",
+            text="I'm curious about what frameworks people use...",
+            score=75,
         )
 
-        fetcher = HackerNewsFetcher()
-        try:
-            story = await fetcher._fetch_story(story_id)
-
-            assert story is not None
-            assert story["title"] == "Ask HN: What's your favorite framework?"
-            assert story["text"] == "I'm curious about what frameworks people use..."
-            # Ask HN posts without URL should use HN item URL
-            assert story["url"] == f"https://news.ycombinator.com/item?id={story_id}"
-        finally:
-            await fetcher.close()
-
-    @respx.mock
-    async def test_fetch_best_stories(self):
-        """Test fetching best stories"""
-        story_ids = [12345, 12346]
-        respx.get(f"{BASE_URL}/beststories.json").mock(
-            return_value=httpx.Response(200, json=story_ids)
-        )
-
-        for i, story_id in enumerate(story_ids):
-            story_data = {
-                "id": story_id,
-                "type": "story",
-                "title": f"Best Story {i+1}",
-                "url": f"https://example.com/best{i+1}",
-                "score": 200,
-                "by": "testuser",
-                "descendants": 100,
-                "time": int(datetime.now(timezone.utc).timestamp()),
-            }
-            respx.get(f"{BASE_URL}/item/{story_id}.json").mock(
-                return_value=httpx.Response(200, json=story_data)
+        hn_api.respond(f"{BASE_URL}/item/{story_id}.json", json_response(story_data))
+
+        story = await hn_fetcher._fetch_story(story_id)
+
+        assert story is not None
+        assert story["title"] == "Ask HN: What's your favorite framework?"
+        assert story["text"] == "I'm curious about what frameworks people use..."
+        # Ask HN posts without URL should use HN item URL
+        assert story["url"] == f"https://news.ycombinator.com/item?id={story_id}"
+
+    @pytest.mark.parametrize(
+        "failure",
+        [
+            pytest.param(httpx.Response(500), id="server_error"),
+            pytest.param(httpx.ConnectError("boom"), id="request_error"),
+        ],
+    )
+    async def test_fetch_handles_api_error(self, hn_fetcher, hn_api, failure):
+        """Test graceful handling of API errors (error status or raised request error)"""
+        hn_api.respond(f"{BASE_URL}/topstories.json", failure)
+
+        stories = await hn_fetcher.fetch_top_stories()
+        # Should return empty list on error
+        assert stories == []
+
+    async def test_fetch_trending_hn_convenience_function(
+        self, hn_fetcher, hn_api, hn_story, monkeypatch
+    ):
+        """Test the convenience function"""
+        monkeypatch.setattr(hackernews_module, "_fetcher", hn_fetcher)
+        hn_api.items({
+            12345: hn_story(
+                12345, title="Trending Story", url="https://example.com/trending", score=150
             )
+        }, listing="topstories")
 
-        fetcher = HackerNewsFetcher()
-        try:
-            stories = await fetcher.fetch_best_stories(limit=2)
-
-            assert len(stories) == 2
-            assert stories[0]["title"] == "Best Story 1"
-        finally:
-            await fetcher.close()
-
-    @respx.mock
-    async def test_fetch_handles_api_error(self):
-        """Test graceful handling of API errors"""
-        respx.get(f"{BASE_URL}/topstories.json").mock(
-            return_value=httpx.Response(500, json={"error": "Internal Server Error"})
-        )
+        stories = await fetch_trending_hn(min_score=100, limit=1)
 
-        fetcher = HackerNewsFetcher()
-        try:
-            stories = await fetcher.fetch_top_stories()
-            # Should return empty list on error
-            assert stories == []
-        finally:
-            await fetcher.close()
-
-    @respx.mock
-    async def test_fetch_trending_hn_convenience_function(self):
-        """Test the convenience function"""
-        story_ids = [12345]
-        respx.get(f"{BASE_URL}/topstories.json").mock(
-            return_value=httpx.Response(200, json=story_ids)
+        assert len(stories) == 1
+        assert stories[0]["score"] >= 100
+
+    async def test_story_standardization(self, hn_fetcher, hn_api, hn_story, json_response):
+        """Test that stories are returned in standardized format"""
+        story_id = 12345
+        story_data = hn_story(
+            story_id,
+            title="Test Title",
+            url="https://example.com",
+            score=100,
+            by="author123",
+            descendants=25,
+            time=1234567890,
         )
 
-        story_data = {
-            "id": 12345,
-            "type": "story",
-            "title": "Trending Story",
-            "url": "https://example.com/trending",
-            "score": 150,
-            "by": "testuser",
-            "descendants": 50,
-            "time": int(datetime.now(timezone.utc).timestamp()),
-        }
-        respx.get(f"{BASE_URL}/item/12345.json").mock(
-            return_value=httpx.Response(200, json=story_data)
+        hn_api.respond(f"{BASE_URL}/item/{story_id}.json", json_response(story_data))
+
+        story = await hn_fetcher._fetch_story(story_id)
+
+        # Verify all expected fields are present
+        assert "id" in story
+        assert "title" in story
+        assert "url" in story
+        assert "score" in story
+        assert "author" in story
+        assert "comments" in story
+        assert "published_at" in story
+        assert "source" in story
+        assert "source_id" in story
+
+        # Verify values
+        assert story["source"] == "HackerNews"
+        assert story["source_id"] == str(story_id)
+        assert story["comments"] == 25
+
+    async def test_fetch_story_uses_cache(self, hn_fetcher, hn_api, hn_story, json_response):
+        """Test that repeated story fetches are served from the item cache"""
+        story_id = 12345
+        url = f"{BASE_URL}/item/{story_id}.json"
+        hn_api.respond(url, json_response(hn_story(story_id, title="Cached Story", score=10)))
+
+        first = await hn_fetcher._fetch_story(story_id)
+        second = await hn_fetcher._fetch_story(story_id)
+
+        assert first == second
+        assert hn_api.calls[url] == 1
+
+    async def test_fetch_top_stories_via_algolia(self, hn_fetcher, hn_api, json_response):
+        """Test that small front page requests use a single Algolia request"""
+        from app.fetchers.hackernews import ALGOLIA_URL
+
+        hn_api.respond(
+            f"{ALGOLIA_URL}/search",
+            json_response({
+                "hits": [
+                    {
+                        "objectID": "111",
+                        "title": "Algolia Story",
+                        "url": "https://example.com/algolia",
+                        "points": 120,
+                        "author": "testuser",
+                        "num_comments": 40,
+                        "created_at_i": 1234567890,
+                    },
+                    {
+                        "objectID": "222",
+                        "title": "Low Score Story",
+                        "url": None,
+                        "points": 10,
+                        "author": "testuser",
+                        "num_comments": 2,
+                        "created_at_i": 1234567890,
+                    },
+                ]
+            })
         )
 
-        stories = await fetch_trending_hn(min_score=100, limit=1)
+        stories = await hn_fetcher.fetch_top_stories(limit=2, min_score=50)
 
         assert len(stories) == 1
-        assert stories[0]["score"] >= 100
-
-    @respx.mock
-    async def test_story_standardization(self):
-        """Test that stories are returned in standardized format"""
+        assert stories[0]["id"] == "111"
+        assert stories[0]["score"] == 120
+        assert stories[0]["comments"] == 40
+        assert stories[0]["source"] == "HackerNews"
+        assert hn_api.calls[f"{BASE_URL}/topstories.json"] == 0
+
+    async def test_algolia_failures_count_toward_circuit(self, hn_fetcher, hn_api):
+        """Test that the Algolia fast path goes through the circuit breaker"""
+        from app.fetchers.hackernews import ALGOLIA_URL
+
+        search_url = f"{ALGOLIA_URL}/search"
+        hn_api.respond(search_url, httpx.Response(503))
+        for _ in range(10):
+            assert await hn_fetcher._fetch_via_algolia(limit=2) is None
+
+        assert hn_fetcher._circuit.is_open
+        assert await hn_fetcher.fetch_top_stories(limit=2) == []
+        assert hn_api.calls[search_url] == 10
+
+    async def test_fetch_story_retries_transient_errors(
+        self, hn_fetcher, hn_api, hn_story, json_response
+    ):
+        """Test that a 5xx response is retried before giving up"""
         story_id = 12345
-        story_data = {
-            "id": story_id,
-            "type": "story",
-            "title": "Test Title",
-            "url": "https://example.com",
-            "score": 100,
-            "by": "author123",
-            "descendants": 25,
-            "time": 1234567890,
-        }
-
-        respx.get(f"{BASE_URL}/item/{story_id}.json").mock(
-            return_value=httpx.Response(200, json=story_data)
+        url = f"{BASE_URL}/item/{story_id}.json"
+        hn_api.respond(
+            url,
+            httpx.Response(503),
+            json_response(hn_story(story_id, title="Recovered Story", score=10)),
         )
 
+        story = await hn_fetcher._fetch_story(story_id)
+
+        assert story is not None
+        assert story["title"] == "Recovered Story"
+        assert hn_api.calls[url] == 2
+
+    async def test_fetch_stories_skips_known_low_scores(
+        self, hn_fetcher, hn_api, hn_story, json_response
+    ):
+        """Test that stories recently seen below min_score are not re-fetched"""
+        low = f"{BASE_URL}/item/1.json"
+        high = f"{BASE_URL}/item/2.json"
+        hn_api.respond(low, json_response(hn_story(1, title="Low", score=10)))
+        hn_api.respond(high, json_response(hn_story(2, title="High", score=200)))
+
+        first = await hn_fetcher._fetch_stories([1, 2], min_score=100)
+        hn_fetcher._item_cache.clear()
+        second = await hn_fetcher._fetch_stories([1, 2], min_score=100)
+
+        assert [story["id"] for story in first] == ["2"]
+        assert [story["id"] for story in second] == ["2"]
+        assert hn_api.calls[low] == 1
+        assert hn_api.calls[high] == 2
+
+    async def test_fetch_stories_concurrently_in_order(
+        self, hn_fetcher, hn_api, hn_story, json_response
+    ):
+        """Test that item requests overlap and results keep story_ids order"""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_item(request, item_id):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Earlier ids answer last, so completion order is reversed
+            await asyncio.sleep(0.01 * (4 - int(item_id)))
+            in_flight -= 1
+            return json_response(hn_story(int(item_id), title=f"Story {item_id}", score=100))
+
+        for item_id in (1, 2, 3):
+            hn_api.respond(
+                f"{BASE_URL}/item/{item_id}.json", functools.partial(slow_item, item_id=item_id)
+            )
+
+        stories = await hn_fetcher._fetch_stories([1, 2, 3])
+
+        assert [story["id"] for story in stories] == ["1", "2", "3"]
+        assert max_in_flight > 1
+
+    async def test_default_client_follows_shared_client_lifecycle(self):
+        """Test that a fetcher without its own client survives close_shared_client"""
+        from app.fetchers.http_client import close_shared_client, get_shared_client
+
         fetcher = HackerNewsFetcher()
-        try:
-            story = await fetcher._fetch_story(story_id)
-
-            # Verify all expected fields are present
-            assert "id" in story
-            assert "title" in story
-            assert "url" in story
-            assert "score" in story
-            assert "author" in story
-            assert "comments" in story
-            assert "published_at" in story
-            assert "source" in story
-            assert "source_id" in story
-
-            # Verify values
-            assert story["source"] == "HackerNews"
-            assert story["source_id"] == str(story_id)
-            assert story["comments"] == 25
-        finally:
-            await fetcher.close()
+        first = fetcher.client
+        assert first is get_shared_client()
+
+        # e.g. app lifespan shutdown, then a second lifespan in the same process
+        await close_shared_client()
+
+        assert first.is_closed
+        assert not fetcher.client.is_closed
+        assert fetcher.client is get_shared_client()
+        await close_shared_client()
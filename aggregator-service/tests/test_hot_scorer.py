@@ -4,6 +4,8 @@ Tests for Hot Scorer (Hacker News Algorithm)
 
 import pytest
 from datetime import datetime, timedelta, timezone
+
+import app.analyzers.hot_scorer as hot_scorer_module
 from app.analyzers.hot_scorer import (
     HotScorer,
     calculate_hot_scores,
@@ -11,16 +13,60 @@ from app.analyzers.hot_scorer import (
 )
 
 
+# Scoring runs against a frozen clock so article ages are exact constants
+FIXED_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+T_NOW = FIXED_NOW.isoformat()
+T_1H_AGO = (FIXED_NOW - timedelta(hours=1)).isoformat()
+T_2H_AGO = (FIXED_NOW - timedelta(hours=2)).isoformat()
+T_3H_AGO = (FIXED_NOW - timedelta(hours=3)).isoformat()
+T_5H_AGO = (FIXED_NOW - timedelta(hours=5)).isoformat()
+T_24H_AGO = (FIXED_NOW - timedelta(hours=24)).isoformat()
+T_7D_AGO = (FIXED_NOW - timedelta(days=7)).isoformat()
+T_365D_AGO = (FIXED_NOW - timedelta(days=365)).isoformat()
+T_2H_AHEAD = (FIXED_NOW + timedelta(hours=2)).isoformat()
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns FIXED_NOW"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return FIXED_NOW if tz is None else FIXED_NOW.astimezone(tz)
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    """Freeze the hot scorer's clock at FIXED_NOW"""
+    monkeypatch.setattr(hot_scorer_module, "datetime", _FrozenDatetime)
+    return FIXED_NOW
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    """Default HotScorer shared by the module (scoring is stateless)"""
+    return HotScorer()
+
+
+@pytest.fixture(scope="module")
+def low_gravity():
+    """Slow time decay"""
+    return HotScorer(gravity=1.0)
+
+
+@pytest.fixture(scope="module")
+def high_gravity():
+    """Fast time decay"""
+    return HotScorer(gravity=2.5)
+
+
 @pytest.mark.unit
 class TestHotScorer:
     """Test hot scoring functionality"""
 
-    def test_calculate_score_basic(self):
+    def test_calculate_score_basic(self, scorer):
         """Test basic hot score calculation"""
-        scorer = HotScorer(gravity=1.8)
-
         # Recent article with good engagement
-        published_at = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+        published_at = T_2H_AGO
         score = scorer.calculate_score(
             engagement=100,
             published_at=published_at
@@ -29,12 +75,10 @@ class TestHotScorer:
         assert score > 0
         assert isinstance(score, float)
 
-    def test_recent_article_scores_higher(self):
+    def test_recent_article_scores_higher(self, scorer):
         """Test that more recent articles score higher with same engagement"""
-        scorer = HotScorer()
-
-        recent_time = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
-        old_time = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat()
+        recent_time = T_1H_AGO
+        old_time = T_24H_AGO
 
         recent_score = scorer.calculate_score(100, recent_time)
         old_score = scorer.calculate_score(100, old_time)
@@ -42,20 +86,18 @@ class TestHotScorer:
         # Recent should score higher
         assert recent_score > old_score
 
-    def test_higher_engagement_scores_higher(self):
+    def test_higher_engagement_scores_higher(self, scorer):
         """Test that higher engagement scores higher"""
-        scorer = HotScorer()
-        published_at = (datetime.now(timezone.utc) - timedelta(hours=5)).isoformat()
+        published_at = T_5H_AGO
 
         high_engagement = scorer.calculate_score(200, published_at)
         low_engagement = scorer.calculate_score(50, published_at)
 
         assert high_engagement > low_engagement
 
-    def test_source_weight_multiplier(self):
+    def test_source_weight_multiplier(self, scorer):
         """Test that source weight multiplies the score"""
-        scorer = HotScorer()
-        published_at = (datetime.now(timezone.utc) - timedelta(hours=3)).isoformat()
+        published_at = T_3H_AGO
 
         base_score = scorer.calculate_score(100, published_at, source_weight=1.0)
         weighted_score = scorer.calculate_score(100, published_at, source_weight=1.5)
@@ -63,12 +105,9 @@ class TestHotScorer:
         # Weighted should be 1.5x the base
         assert weighted_score == pytest.approx(base_score * 1.5, rel=0.01)
 
-    def test_gravity_affects_time_decay(self):
+    def test_gravity_affects_time_decay(self, low_gravity, high_gravity):
         """Test that gravity parameter affects time decay rate"""
-        low_gravity = HotScorer(gravity=1.0)
-        high_gravity = HotScorer(gravity=2.5)
-
-        old_time = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat()
+        old_time = T_24H_AGO
 
         low_g_score = low_gravity.calculate_score(100, old_time)
         high_g_score = high_gravity.calculate_score(100, old_time)
@@ -76,22 +115,19 @@ class TestHotScorer:
         # Higher gravity = faster decay = lower score for old content
         assert high_g_score < low_g_score
 
-    def test_prevent_negative_hours(self):
+    def test_prevent_negative_hours(self, scorer):
         """Test that future timestamps don't cause negative hours"""
-        scorer = HotScorer()
-
         # Future timestamp (should be treated as 0 hours)
-        future_time = (datetime.now(timezone.utc) + timedelta(hours=2)).isoformat()
+        future_time = T_2H_AHEAD
 
         score = scorer.calculate_score(100, future_time)
 
         # Should return a valid positive score
         assert score > 0
 
-    def test_score_articles_with_hot_score_field(self, sample_articles):
+    def test_score_articles_with_hot_score_field(self, sample_articles, scored_sample_articles):
         """Test scoring multiple articles and adding hot_score field"""
-        scorer = HotScorer()
-        scored = scorer.score_articles(sample_articles)
+        scored = scored_sample_articles
 
         assert len(scored) == len(sample_articles)
 
@@ -102,20 +138,20 @@ class TestHotScorer:
         scores = [article["hot_score"] for article in scored]
         assert scores == sorted(scores, reverse=True)
 
-    def test_score_articles_with_source_weights(self):
+    def test_score_articles_with_source_weights(self, scorer):
         """Test applying source weights when scoring articles"""
         articles = [
             {
                 "title": "HN Article",
                 "source": "HackerNews",
                 "score": 100,
-                "published_at": (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+                "published_at": T_2H_AGO
             },
             {
                 "title": "Medium Article",
                 "source": "Medium",
                 "score": 100,
-                "published_at": (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+                "published_at": T_2H_AGO
             }
         ]
 
@@ -124,8 +160,7 @@ class TestHotScorer:
             "Medium": 0.8
         }
 
-        scorer = HotScorer()
-        scored = scorer.score_articles(articles, source_weights=source_weights)
+        scored = scorer.score_articles(articles, source_weights=source_weights, copy=False)
 
         # HackerNews should score higher due to weight
         hn_article = [a for a in scored if a["source"] == "HackerNews"][0]
@@ -133,56 +168,48 @@ class TestHotScorer:
 
         assert hn_article["hot_score"] > medium_article["hot_score"]
 
-    def test_fallback_to_comments_for_engagement(self):
+    def test_fallback_to_comments_for_engagement(self, scorer):
         """Test using comment count when score is 0"""
-        scorer = HotScorer()
-
         article = {
             "title": "Test",
             "score": 0,  # No score
             "comments": 50,  # Has comments
-            "published_at": datetime.now(timezone.utc).isoformat()
+            "published_at": T_NOW
         }
 
-        scored = scorer.score_articles([article])
+        scored = scorer.score_articles([article], copy=False)
 
         # Should use comments as engagement metric
         assert scored[0]["hot_score"] > 0
 
-    def test_minimum_engagement_value(self):
+    def test_minimum_engagement_value(self, scorer):
         """Test that articles with no metrics get minimum engagement"""
-        scorer = HotScorer()
-
         article = {
             "title": "Test",
             "score": 0,
             "comments": 0,
-            "published_at": datetime.now(timezone.utc).isoformat()
+            "published_at": T_NOW
         }
 
-        scored = scorer.score_articles([article])
+        scored = scorer.score_articles([article], copy=False)
 
         # Should get a score based on minimum engagement (1)
         assert scored[0]["hot_score"] >= 0
 
-    def test_missing_timestamp_gets_zero_score(self):
+    def test_missing_timestamp_gets_zero_score(self, scorer):
         """Test that articles without timestamp get zero score"""
-        scorer = HotScorer()
-
         article = {
             "title": "Test",
             "score": 100
             # No published_at field
         }
 
-        scored = scorer.score_articles([article])
+        scored = scorer.score_articles([article], copy=False)
 
         assert scored[0]["hot_score"] == 0.0
 
-    def test_get_top_hot_articles(self, sample_articles):
+    def test_get_top_hot_articles(self, scorer, sample_articles):
         """Test getting top N hottest articles"""
-        scorer = HotScorer()
-
         top_articles = scorer.get_top_hot_articles(
             sample_articles,
             top_n=2,
@@ -192,23 +219,22 @@ class TestHotScorer:
         assert len(top_articles) <= 2
         assert all(article["hot_score"] >= 0.1 for article in top_articles)
 
-    def test_min_score_filter(self):
+    def test_min_score_filter(self, scorer):
         """Test minimum score filtering"""
         # Create articles with very different timestamps for score variation
         articles = [
             {
                 "title": "Hot Article",
                 "score": 200,
-                "published_at": (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+                "published_at": T_1H_AGO
             },
             {
                 "title": "Old Article",
                 "score": 50,
-                "published_at": (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
+                "published_at": T_7D_AGO
             }
         ]
 
-        scorer = HotScorer()
         top_articles = scorer.get_top_hot_articles(
             articles,
             top_n=10,
@@ -218,10 +244,8 @@ class TestHotScorer:
         # Old article should be filtered out
         assert all(article["hot_score"] >= 5.0 for article in top_articles)
 
-    def test_score_calculation_error_handling(self):
+    def test_score_calculation_error_handling(self, scorer):
         """Test graceful error handling with invalid data"""
-        scorer = HotScorer()
-
         # Invalid timestamp
         score = scorer.calculate_score(
             engagement=100,
@@ -231,9 +255,8 @@ class TestHotScorer:
         # Should return 0 instead of crashing
         assert score == 0.0
 
-    def test_article_copy_not_mutation(self, sample_article):
+    def test_article_copy_not_mutation(self, scorer, sample_article):
         """Test that scoring doesn't mutate original articles"""
-        scorer = HotScorer()
         original_keys = set(sample_article.keys())
 
         scored = scorer.score_articles([sample_article])
@@ -245,6 +268,15 @@ class TestHotScorer:
         # Scored copy should have hot_score
         assert "hot_score" in scored[0]
 
+    def test_score_articles_in_place(self, scorer):
+        """Test that copy=False adds hot_score to the original articles"""
+        article = {"title": "In place", "score": 10, "published_at": T_1H_AGO}
+
+        scored = scorer.score_articles([article], copy=False)
+
+        assert scored[0] is article
+        assert article["hot_score"] > 0
+
     def test_default_source_weights_exist(self):
         """Test that default source weights are defined"""
         assert isinstance(DEFAULT_SOURCE_WEIGHTS, dict)
@@ -263,10 +295,9 @@ class TestHotScorer:
         assert len(hot_articles) <= 5
         assert all("hot_score" in article for article in hot_articles)
 
-    def test_zero_engagement_handling(self):
+    def test_zero_engagement_handling(self, scorer):
         """Test handling of zero engagement gracefully"""
-        scorer = HotScorer()
-        published_at = datetime.now(timezone.utc).isoformat()
+        published_at = T_NOW
 
         # Engagement of 0 should still produce a score
         score = scorer.calculate_score(0, published_at)
@@ -275,11 +306,9 @@ class TestHotScorer:
         # This will be negative, but clamped to 0
         assert score >= 0
 
-    def test_very_old_content_low_score(self):
+    def test_very_old_content_low_score(self, scorer):
         """Test that very old content gets very low scores"""
-        scorer = HotScorer()
-
-        old_time = (datetime.now(timezone.utc) - timedelta(days=365)).isoformat()
+        old_time = T_365D_AGO
 
         score = scorer.calculate_score(1000, old_time)  # Even with high engagement
 
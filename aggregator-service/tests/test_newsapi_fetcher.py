@@ -0,0 +1,98 @@
+"""
+Tests for NewsAPI Fetcher
+"""
+
+import pytest
+import httpx
+
+import app.fetchers.newsapi as newsapi_module
+from app.fetchers.http_client import CircuitBreaker
+from app.fetchers.newsapi import fetch_trending_news, BASE_URL
+
+
+HEADLINES_URL = f"{BASE_URL}/top-headlines"
+
+
+@pytest.fixture(autouse=True)
+def fresh_module_fetcher(monkeypatch):
+    """Start every test without a module-level NewsAPI fetcher or failures"""
+    monkeypatch.setattr(newsapi_module, "_fetcher", None)
+    monkeypatch.setattr(newsapi_module, "_circuit", CircuitBreaker())
+
+
+@pytest.mark.unit
+class TestNewsAPIFetcher:
+    """Test NewsAPI fetcher functionality"""
+
+    async def test_repeat_trending_fetches_served_from_cache(self, router, json_response):
+        """Test that a second fetch_trending_news call makes no HTTP requests"""
+        route = router.get(HEADLINES_URL).mock(
+            return_value=json_response({
+                "status": "ok",
+                "articles": [
+                    {
+                        "title": "Headline",
+                        "url": "https://example.com/headline",
+                        "publishedAt": "2024-01-01T12:00:00Z",
+                        "source": {"name": "Example News"},
+                    }
+                ],
+            })
+        )
+
+        first = await fetch_trending_news("test-key", categories=["technology"])
+        calls_after_first = route.call_count
+        expected = [dict(article) for article in first]
+        # Scoring adds fields in place; that must not reach the cache
+        first[0]["hot_score"] = 1.0
+        second = await fetch_trending_news("test-key", categories=["technology"])
+
+        # One request per category (technology plus general), none on the repeat
+        assert calls_after_first == 2
+        assert route.call_count == calls_after_first
+        assert second == expected
+        assert second[0]["source"] == "Example News"
+
+    async def test_new_api_key_gets_new_fetcher(self):
+        """Test that the module-level fetcher follows the configured API key"""
+        first = newsapi_module._get_fetcher("key-one")
+
+        assert newsapi_module._get_fetcher("key-one") is first
+        assert newsapi_module._get_fetcher("key-two").api_key == "key-two"
+
+    async def test_circuit_breaker_opens_across_calls(self, router):
+        """Test that failures from separate fetch_trending_news calls trip one breaker"""
+        route = router.get(HEADLINES_URL).mock(return_value=httpx.Response(503))
+
+        # 4 requests per call (3 default categories plus general), which is
+        # below the 10 samples the breaker needs, so it takes several calls
+        for _ in range(3):
+            assert await fetch_trending_news("test-key") == []
+        calls = route.call_count
+        assert calls >= 10
+
+        # Breaker is open now, so the next run short-circuits without requests
+        assert await fetch_trending_news("test-key") == []
+        assert route.call_count == calls
+
+        # A fetcher for another key shares the same breaker
+        assert newsapi_module.NewsAPIFetcher("other-key")._circuit.is_open
+
+    async def test_server_error_not_retried(self, router):
+        """Test that each headline request is sent once, since retries spend quota"""
+        route = router.get(HEADLINES_URL).mock(return_value=httpx.Response(503))
+
+        await fetch_trending_news("test-key", categories=["technology"])
+
+        # technology plus general, one attempt each
+        assert route.call_count == 2
+
+    @pytest.mark.parametrize("status", [401, 429])
+    async def test_client_errors_do_not_open_breaker(self, router, status):
+        """Test that a bad key or exhausted quota isn't counted as an outage"""
+        router.get(HEADLINES_URL).mock(return_value=httpx.Response(status))
+
+        for _ in range(4):
+            assert await fetch_trending_news("test-key") == []
+
+        assert not newsapi_module._circuit.is_open
@@ -2,21 +2,33 @@
 Tests for Reddit Fetcher
 """
 
+import time
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock, patch, AsyncMock
 from datetime import datetime, timezone
 
+import app.fetchers.reddit as reddit_module
 from app.fetchers.reddit import RedditFetcher, fetch_trending_reddit
 
 
+# Default created_utc for mock submissions, read from the clock once at import
+_DEFAULT_TS = datetime.now(timezone.utc).timestamp()
+
+
 class MockSubmission:
     """Mock Reddit submission for testing"""
 
+    __slots__ = (
+        "id", "title", "url", "score", "num_comments", "created_utc",
+        "is_self", "selftext", "author", "stickied", "permalink",
+    )
+
     def __init__(
         self,
         id="test123",
         title="Test Post",
-        url="https://example.com",
+        url=None,
         score=100,
         num_comments=50,
         created_utc=None,
@@ -28,10 +40,10 @@ class MockSubmission:
     ):
         self.id = id
         self.title = title
-        self.url = url
+        self.url = url or f"https://example.com/{id}"
         self.score = score
         self.num_comments = num_comments
-        self.created_utc = created_utc or datetime.now(timezone.utc).timestamp()
+        self.created_utc = created_utc if created_utc is not None else _DEFAULT_TS
         self.is_self = is_self
         self.selftext = selftext
         self.author = author
@@ -39,16 +51,68 @@ class MockSubmission:
         self.permalink = permalink
 
 
+# Shared submissions, built once at import (the fetcher only reads them)
+DEFAULT_POST = MockSubmission()
+TOP_POSTS = (
+    MockSubmission(id="post1", title="Top Post 1", score=500),
+    MockSubmission(id="post2", title="Top Post 2", score=450),
+)
+STANDARDIZATION_POST = MockSubmission(
+    id="test123",
+    title="Test Title",
+    url="https://example.com",
+    score=100,
+    num_comments=25,
+    created_utc=1234567890,
+    author="testuser",
+    permalink="/r/technology/comments/test123/test_title/"
+)
+
+
+def _listing(submissions):
+    """
+    praw-style listing method returning submissions on every call (the
+    sequence itself, so repeated calls never see an exhausted iterator)
+    """
+    return lambda **kwargs: submissions
+
+
+def _fake_subreddit(hot=(), top=()):
+    """Attribute-only stand-in for a praw Subreddit (no call recording)"""
+    return SimpleNamespace(
+        hot=_listing(hot), top=_listing(top), new=_listing(()), rising=_listing(())
+    )
+
+
+def _fake_reddit(subreddit=None, subreddit_for=None, limits=None):
+    """
+    Attribute-only stand-in for praw.Reddit serving one subreddit, or
+    subreddit_for(name) when given
+    """
+    return SimpleNamespace(
+        subreddit=subreddit_for or (lambda name: subreddit),
+        auth=SimpleNamespace(limits=limits),
+    )
+
+
+def _wire_subreddit(mock_reddit_class, submissions, listing="hot"):
+    """Have the patched praw.Reddit serve submissions from one subreddit listing"""
+    mock_reddit_class.return_value = _fake_reddit(_fake_subreddit(**{listing: submissions}))
+
+
+@pytest.fixture(autouse=True)
+def fresh_module_fetcher(monkeypatch):
+    """Start every test without a module-level Reddit fetcher"""
+    monkeypatch.setattr(reddit_module, "_fetcher", None)
+
+
 @pytest.mark.unit
-@pytest.mark.asyncio
 class TestRedditFetcher:
     """Test Reddit fetcher functionality"""
 
-    @patch("app.fetchers.reddit.praw.Reddit")
-    async def test_initialization_with_oauth(self, mock_reddit_class):
+    def test_initialization_with_oauth(self, mock_reddit_class):
         """Test fetcher initializes correctly with OAuth credentials"""
-        mock_reddit = Mock()
-        mock_reddit_class.return_value = mock_reddit
+        mock_reddit_class.return_value = _fake_reddit(_fake_subreddit())
 
         fetcher = RedditFetcher(
             client_id="test_client_id",
@@ -58,147 +122,140 @@ class TestRedditFetcher:
         assert fetcher.reddit is not None
         mock_reddit_class.assert_called_once()
 
-    async def test_initialization_without_oauth(self):
+    def test_initialization_without_oauth(self):
         """Test fetcher initializes without OAuth credentials"""
         fetcher = RedditFetcher()
 
         assert fetcher.reddit is None
 
-    @patch("app.fetchers.reddit.praw.Reddit")
-    async def test_fetch_hot_posts_success(self, mock_reddit_class):
-        """Test successfully fetching hot posts"""
-        # Create mock submissions
-        mock_submissions = [
-            MockSubmission(id="post1", title="Hot Post 1", score=150),
-            MockSubmission(id="post2", title="Hot Post 2", score=120),
-        ]
-
-        # Mock the subreddit and hot method
-        mock_subreddit = Mock()
-        mock_subreddit.hot.return_value = iter(mock_submissions)
-
-        mock_reddit = Mock()
-        mock_reddit.subreddit.return_value = mock_subreddit
-        mock_reddit_class.return_value = mock_reddit
+    @pytest.mark.parametrize(
+        "submissions,kwargs,expected_len,expected_first,predicate",
+        [
+            pytest.param(
+                [
+                    MockSubmission(id="post1", title="Hot Post 1", score=150),
+                    MockSubmission(id="post2", title="Hot Post 2", score=120),
+                ],
+                {"limit": 25},
+                2,
+                {"title": "Hot Post 1", "source": "Reddit", "score": 150},
+                lambda post: "published_at" in post,
+                id="basic",
+            ),
+            pytest.param(
+                [
+                    MockSubmission(id="post1", score=50),
+                    MockSubmission(id="post2", score=100),
+                    MockSubmission(id="post3", score=150),
+                ],
+                {"limit": 25, "min_score": 100},
+                # Only posts with score >= 100 should be returned
+                2,
+                {},
+                lambda post: post["score"] >= 100,
+                id="min_score",
+            ),
+            pytest.param(
+                [
+                    MockSubmission(id="post1", title="Normal Post", stickied=False),
+                    MockSubmission(id="post2", title="Stickied Post", stickied=True),
+                ],
+                {},
+                # Stickied post should be filtered out
+                1,
+                {"title": "Normal Post"},
+                None,
+                id="stickied",
+            ),
+            pytest.param(
+                [
+                    MockSubmission(
+                        id="post1",
+                        title="Ask: What framework?",
+                        is_self=True,
+                        selftext="I'm looking for a good framework...",
+                        url="https://reddit.com/r/programming/..."
+                    )
+                ],
+                {},
+                1,
+                {"text": "I'm looking for a good framework..."},
+                lambda post: post["is_self"] is True,
+                id="self_post",
+            ),
+            pytest.param(
+                [MockSubmission(id="post1", title="Post with deleted author", author=None)],
+                {},
+                1,
+                {"author": "[deleted]"},
+                None,
+                id="deleted_author",
+            ),
+        ],
+    )
+    async def test_hot_posts_scenarios(
+        self, mock_reddit_class, submissions, kwargs, expected_len, expected_first, predicate
+    ):
+        """Test fetching hot posts: standardization, filtering and edge cases"""
+        _wire_subreddit(mock_reddit_class, submissions)
 
         fetcher = RedditFetcher(
             client_id="test_id",
             client_secret="test_secret"
         )
 
-        posts = await fetcher.fetch_hot_posts(
-            subreddits=["technology"],
-            limit=25
-        )
+        posts = await fetcher.fetch_hot_posts(subreddits=["technology"], **kwargs)
 
-        assert len(posts) == 2
-        assert posts[0]["title"] == "Hot Post 1"
-        assert posts[0]["source"] == "Reddit"
-        assert posts[0]["score"] == 150
-        assert "published_at" in posts[0]
-
-    @patch("app.fetchers.reddit.praw.Reddit")
-    async def test_fetch_posts_with_min_score_filter(self, mock_reddit_class):
-        """Test filtering posts by minimum score"""
-        mock_submissions = [
-            MockSubmission(id="post1", score=50),
-            MockSubmission(id="post2", score=100),
-            MockSubmission(id="post3", score=150),
-        ]
+        assert len(posts) == expected_len
+        for key, value in expected_first.items():
+            assert posts[0][key] == value
+        if predicate:
+            assert all(predicate(post) for post in posts)
 
-        mock_subreddit = Mock()
-        mock_subreddit.hot.return_value = iter(mock_submissions)
+    async def test_top_posts_stop_at_first_low_score(self, mock_reddit_class):
+        """Test that score-ordered top listings stop at the first post below min_score"""
+        consumed = []
 
-        mock_reddit = Mock()
-        mock_reddit.subreddit.return_value = mock_subreddit
-        mock_reddit_class.return_value = mock_reddit
+        def listing():
+            for score in (300, 200, 50, 400):
+                consumed.append(score)
+                yield MockSubmission(id=f"post{score}", score=score)
 
-        fetcher = RedditFetcher(
-            client_id="test_id",
-            client_secret="test_secret"
+        mock_reddit_class.return_value = _fake_reddit(
+            SimpleNamespace(top=lambda **kwargs: listing())
         )
 
-        posts = await fetcher.fetch_hot_posts(
-            subreddits=["technology"],
-            limit=25,
-            min_score=100
-        )
-
-        # Only posts with score >= 100 should be returned
-        assert len(posts) == 2
-        assert all(post["score"] >= 100 for post in posts)
-
-    @patch("app.fetchers.reddit.praw.Reddit")
-    async def test_skip_stickied_posts(self, mock_reddit_class):
-        """Test that stickied posts are filtered out"""
-        mock_submissions = [
-            MockSubmission(id="post1", title="Normal Post", stickied=False),
-            MockSubmission(id="post2", title="Stickied Post", stickied=True),
-        ]
-
-        mock_subreddit = Mock()
-        mock_subreddit.hot.return_value = iter(mock_submissions)
-
-        mock_reddit = Mock()
-        mock_reddit.subreddit.return_value = mock_subreddit
-        mock_reddit_class.return_value = mock_reddit
-
         fetcher = RedditFetcher(
             client_id="test_id",
             client_secret="test_secret"
         )
 
-        posts = await fetcher.fetch_hot_posts(subreddits=["technology"])
+        posts = await fetcher.fetch_top_posts(subreddits=["technology"], min_score=100)
 
-        # Stickied post should be filtered out
-        assert len(posts) == 1
-        assert posts[0]["title"] == "Normal Post"
-
-    @patch("app.fetchers.reddit.praw.Reddit")
-    async def test_fetch_self_posts(self, mock_reddit_class):
-        """Test fetching self (text) posts"""
-        mock_submissions = [
-            MockSubmission(
-                id="post1",
-                title="Ask: What framework?",
-                is_self=True,
-                selftext="I'm looking for a good framework...",
-                url="https://reddit.com/r/programming/..."
-            )
-        ]
+        assert [post["score"] for post in posts] == [300, 200]
+        assert consumed == [300, 200, 50]
 
-        mock_subreddit = Mock()
-        mock_subreddit.hot.return_value = iter(mock_submissions)
-
-        mock_reddit = Mock()
-        mock_reddit.subreddit.return_value = mock_subreddit
-        mock_reddit_class.return_value = mock_reddit
+    async def test_hot_posts_scan_past_low_scores(self, mock_reddit_class):
+        """Test that hot listings keep qualifying posts after a run of low scores"""
+        submissions = [MockSubmission(id=f"low{i}", score=10) for i in range(6)]
+        submissions.append(MockSubmission(id="high", score=500))
+        _wire_subreddit(mock_reddit_class, submissions)
 
         fetcher = RedditFetcher(
             client_id="test_id",
             client_secret="test_secret"
         )
 
-        posts = await fetcher.fetch_hot_posts(subreddits=["programming"])
+        posts = await fetcher.fetch_hot_posts(subreddits=["technology"], min_score=100)
 
-        assert len(posts) == 1
-        assert posts[0]["text"] == "I'm looking for a good framework..."
-        assert posts[0]["is_self"] is True
+        assert [post["id"] for post in posts] == ["high"]
 
-    @patch("app.fetchers.reddit.praw.Reddit")
     async def test_fetch_top_posts(self, mock_reddit_class):
         """Test fetching top posts by timeframe"""
-        mock_submissions = [
-            MockSubmission(id="post1", title="Top Post 1", score=500),
-            MockSubmission(id="post2", title="Top Post 2", score=450),
-        ]
-
+        # Mock (not a fake) since the listing call is asserted below
         mock_subreddit = Mock()
-        mock_subreddit.top.return_value = iter(mock_submissions)
-
-        mock_reddit = Mock()
-        mock_reddit.subreddit.return_value = mock_subreddit
-        mock_reddit_class.return_value = mock_reddit
+        mock_subreddit.top.return_value = TOP_POSTS
+        mock_reddit_class.return_value = _fake_reddit(mock_subreddit)
 
         fetcher = RedditFetcher(
             client_id="test_id",
@@ -217,28 +274,16 @@ class TestRedditFetcher:
         call_kwargs = mock_subreddit.top.call_args.kwargs
         assert call_kwargs["time_filter"] == "week"
 
-    @patch("app.fetchers.reddit.praw.Reddit")
     async def test_fetch_multiple_subreddits(self, mock_reddit_class):
-        """Test fetching from multiple subreddits"""
-        mock_submissions_tech = [
-            MockSubmission(id="tech1", title="Tech Post")
-        ]
-        mock_submissions_prog = [
-            MockSubmission(id="prog1", title="Programming Post")
-        ]
-
-        mock_reddit = Mock()
-
+        """Test fetching each subreddit with its own listing request"""
         def mock_subreddit(name):
-            subreddit = Mock()
-            if name == "technology":
-                subreddit.hot.return_value = iter(mock_submissions_tech)
-            else:
-                subreddit.hot.return_value = iter(mock_submissions_prog)
-            return subreddit
+            # A busy subreddit must not crowd out a small one
+            count = 25 if name == "technology" else 1
+            return _fake_subreddit(hot=[
+                MockSubmission(id=f"{name}{i}") for i in range(count)
+            ])
 
-        mock_reddit.subreddit = mock_subreddit
-        mock_reddit_class.return_value = mock_reddit
+        mock_reddit_class.return_value = _fake_reddit(subreddit_for=mock_subreddit)
 
         fetcher = RedditFetcher(
             client_id="test_id",
@@ -249,41 +294,36 @@ class TestRedditFetcher:
             subreddits=["technology", "programming"]
         )
 
-        # Should get posts from both subreddits
-        assert len(posts) == 2
+        assert len(posts) == 26
+        assert posts[-1]["subreddit"] == "programming"
+        assert posts[-1]["source_id"] == "r/programming/programming0"
 
-    @patch("app.fetchers.reddit.praw.Reddit")
-    async def test_handles_deleted_author(self, mock_reddit_class):
-        """Test handling posts with deleted authors"""
-        mock_submission = MockSubmission(
-            id="post1",
-            title="Post with deleted author",
-            author=None
-        )
-
-        mock_subreddit = Mock()
-        mock_subreddit.hot.return_value = iter([mock_submission])
+    async def test_failed_subreddit_keeps_others(self, mock_reddit_class):
+        """Test that one private or banned subreddit doesn't drop the rest"""
+        def mock_subreddit(name):
+            if name == "private":
+                raise Exception("403 Forbidden")
+            return _fake_subreddit(hot=[MockSubmission(id=f"{name}1")])
 
-        mock_reddit = Mock()
-        mock_reddit.subreddit.return_value = mock_subreddit
-        mock_reddit_class.return_value = mock_reddit
+        mock_reddit_class.return_value = _fake_reddit(subreddit_for=mock_subreddit)
 
         fetcher = RedditFetcher(
             client_id="test_id",
             client_secret="test_secret"
         )
 
-        posts = await fetcher.fetch_hot_posts(subreddits=["technology"])
+        posts = await fetcher.fetch_hot_posts(
+            subreddits=["technology", "private", "programming"]
+        )
 
-        assert len(posts) == 1
-        assert posts[0]["author"] == "[deleted]"
+        assert [post["subreddit"] for post in posts] == ["technology", "programming"]
 
-    @patch("app.fetchers.reddit.praw.Reddit")
     async def test_handles_fetch_error(self, mock_reddit_class):
         """Test graceful error handling when fetch fails"""
-        mock_reddit = Mock()
-        mock_reddit.subreddit.side_effect = Exception("API Error")
-        mock_reddit_class.return_value = mock_reddit
+        def failing_subreddit(name):
+            raise Exception("API Error")
+
+        mock_reddit_class.return_value = _fake_reddit(subreddit_for=failing_subreddit)
 
         fetcher = RedditFetcher(
             client_id="test_id",
@@ -303,26 +343,9 @@ class TestRedditFetcher:
 
         assert posts == []
 
-    @patch("app.fetchers.reddit.praw.Reddit")
     async def test_post_standardization(self, mock_reddit_class):
         """Test that posts are returned in standardized format"""
-        mock_submission = MockSubmission(
-            id="test123",
-            title="Test Title",
-            url="https://example.com",
-            score=100,
-            num_comments=25,
-            created_utc=1234567890,
-            author="testuser",
-            permalink="/r/technology/comments/test123/test_title/"
-        )
-
-        mock_subreddit = Mock()
-        mock_subreddit.hot.return_value = iter([mock_submission])
-
-        mock_reddit = Mock()
-        mock_reddit.subreddit.return_value = mock_subreddit
-        mock_reddit_class.return_value = mock_reddit
+        _wire_subreddit(mock_reddit_class, [STANDARDIZATION_POST])
 
         fetcher = RedditFetcher(
             client_id="test_id",
@@ -352,6 +375,48 @@ class TestRedditFetcher:
         assert post["source_id"] == "r/technology/test123"
         assert "reddit.com" in post["permalink"]
 
+    async def test_pauses_when_quota_nearly_exhausted(self, mock_reddit_class):
+        """Test that requests pause once PRAW reports the quota is nearly used"""
+        mock_reddit_class.return_value = _fake_reddit(
+            _fake_subreddit(hot=[DEFAULT_POST]),
+            limits={
+                "remaining": 1,
+                "reset_timestamp": time.time() + 60,
+                "used": 599,
+            },
+        )
+
+        fetcher = RedditFetcher(
+            client_id="test_id",
+            client_secret="test_secret"
+        )
+
+        posts = await fetcher.fetch_hot_posts(subreddits=["technology"])
+
+        assert len(posts) == 1
+        assert not fetcher._quota_ok.is_set()
+
+    async def test_repeated_listing_served_from_cache(self, mock_reddit_class):
+        """Test that identical listing queries within the TTL skip PRAW"""
+        # Mock (not a fake) since the listing call count is asserted below
+        mock_subreddit = Mock()
+        mock_subreddit.hot.return_value = [DEFAULT_POST]
+        mock_reddit_class.return_value = _fake_reddit(mock_subreddit)
+
+        fetcher = RedditFetcher(
+            client_id="test_id",
+            client_secret="test_secret"
+        )
+
+        first = await fetcher.fetch_hot_posts(subreddits=["technology"])
+        expected = [dict(post) for post in first]
+        # Scoring adds fields in place; that must not reach the cache
+        first[0]["hot_score"] = 1.0
+        second = await fetcher.fetch_hot_posts(subreddits=["technology"])
+
+        assert second == expected
+        assert mock_subreddit.hot.call_count == 1
+
     @patch("app.fetchers.reddit.RedditFetcher")
     async def test_fetch_trending_reddit_convenience(self, mock_fetcher_class):
         """Test the convenience function"""
@@ -372,3 +437,17 @@ class TestRedditFetcher:
         call_kwargs = mock_fetcher.fetch_hot_posts.call_args.kwargs
         assert "technology" in call_kwargs["subreddits"]
         assert "programming" in call_kwargs["subreddits"]
+
+    async def test_fetch_trending_reddit_reuses_fetcher(self, mock_reddit_class):
+        """Test that scheduler runs share one fetcher (quota state and cache)"""
+        mock_reddit_class.return_value = _fake_reddit(_fake_subreddit())
+
+        await fetch_trending_reddit(client_id="test_id", client_secret="test_secret")
+        fetcher = reddit_module._fetcher
+        await fetch_trending_reddit(client_id="test_id", client_secret="test_secret")
+
+        assert reddit_module._fetcher is fetcher
+        assert mock_reddit_class.call_count == 1
+
+        await fetch_trending_reddit(client_id="other_id", client_secret="test_secret")
+        assert reddit_module._fetcher is not fetcher
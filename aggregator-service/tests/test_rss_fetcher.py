@@ -2,10 +2,10 @@
 Tests for RSS Feed Fetcher
 """
 
+import re
 import pytest
-import respx
 import httpx
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock
 from datetime import datetime, timezone
 from time import struct_time
 
@@ -18,6 +18,16 @@ from app.fetchers.rss import (
 )
 
 
+# Feed URL patterns for the convenience tests, compiled once at import
+_GOOGLE_NEWS_RE = re.compile(r"https://news\.google\.com/.*")
+_SUBSTACK_RE = re.compile(r".*\.substack\.com/.*|.*bytebytego.*|.*pragmaticengineer.*|.*lennysnewsletter.*")
+_MEDIUM_RE = re.compile(r".*medium\.com/.*")
+_TECH_NEWS_RE = re.compile(r".*(techcrunch|theverge|arstechnica).*")
+
+# Default published_parsed for mock entries, read from the clock once at import
+_DEFAULT_TT = datetime.now(timezone.utc).timetuple()
+
+
 class MockFeedEntry:
     """Mock feedparser entry for testing"""
 
@@ -34,7 +44,7 @@ class MockFeedEntry:
         self.link = link
         self.summary = summary
         self.author = author
-        self.published_parsed = published_parsed or datetime.now(timezone.utc).timetuple()
+        self.published_parsed = published_parsed if published_parsed is not None else _DEFAULT_TT
         self.id = entry_id or link
 
     def get(self, key, default=None):
@@ -50,18 +60,19 @@ class MockFeed:
         self.bozo_exception = bozo_exception
 
 
+# One-entry feed shared by the convenience function tests (read-only)
+_SINGLE_ARTICLE_FEED = MockFeed(entries=[MockFeedEntry(title="Feed Article")])
+
+
 @pytest.mark.unit
-@pytest.mark.asyncio
 class TestRSSFetcher:
     """Test RSS fetcher functionality"""
 
-    @respx.mock
-    @patch("app.fetchers.rss.feedparser.parse")
-    async def test_fetch_feed_success(self, mock_parse):
+    async def test_fetch_feed_success(self, rss_fetcher, mock_parse, router):
         """Test successfully fetching an RSS feed"""
         # Mock HTTP response
         feed_url = "https://example.com/feed.xml"
-        respx.get(feed_url).mock(
+        router.get(feed_url).mock(
             return_value=httpx.Response(
                 200,
                 content=b"<rss>...</rss>"
@@ -83,26 +94,20 @@ class TestRSSFetcher:
         ]
         mock_parse.return_value = MockFeed(entries=mock_entries)
 
-        fetcher = RSSFetcher()
-        try:
-            articles = await fetcher.fetch_feed(
-                feed_url=feed_url,
-                source_name="Test Source"
-            )
+        articles = await rss_fetcher.fetch_feed(
+            feed_url=feed_url,
+            source_name="Test Source"
+        )
 
-            assert len(articles) == 2
-            assert articles[0]["title"] == "Article 1"
-            assert articles[0]["source"] == "Test Source"
-            assert "published_at" in articles[0]
-        finally:
-            await fetcher.close()
+        assert len(articles) == 2
+        assert articles[0]["title"] == "Article 1"
+        assert articles[0]["source"] == "Test Source"
+        assert "published_at" in articles[0]
 
-    @respx.mock
-    @patch("app.fetchers.rss.feedparser.parse")
-    async def test_fetch_feed_with_limit(self, mock_parse):
+    async def test_fetch_feed_with_limit(self, rss_fetcher, mock_parse, router):
         """Test fetching feed with entry limit"""
         feed_url = "https://example.com/feed.xml"
-        respx.get(feed_url).mock(
+        router.get(feed_url).mock(
             return_value=httpx.Response(200, content=b"<rss>...</rss>")
         )
 
@@ -111,25 +116,19 @@ class TestRSSFetcher:
         ]
         mock_parse.return_value = MockFeed(entries=mock_entries)
 
-        fetcher = RSSFetcher()
-        try:
-            articles = await fetcher.fetch_feed(
-                feed_url=feed_url,
-                source_name="Test Source",
-                limit=5
-            )
+        articles = await rss_fetcher.fetch_feed(
+            feed_url=feed_url,
+            source_name="Test Source",
+            limit=5
+        )
 
-            # Should only return 5 articles
-            assert len(articles) == 5
-        finally:
-            await fetcher.close()
+        # Should only return 5 articles
+        assert len(articles) == 5
 
-    @respx.mock
-    @patch("app.fetchers.rss.feedparser.parse")
-    async def test_feed_parse_warning(self, mock_parse):
+    async def test_feed_parse_warning(self, rss_fetcher, mock_parse, router):
         """Test handling of feed parsing warnings"""
         feed_url = "https://example.com/feed.xml"
-        respx.get(feed_url).mock(
+        router.get(feed_url).mock(
             return_value=httpx.Response(200, content=b"<rss>...</rss>")
         )
 
@@ -140,179 +139,146 @@ class TestRSSFetcher:
             bozo_exception=Exception("Parse error")
         )
 
-        fetcher = RSSFetcher()
-        try:
-            articles = await fetcher.fetch_feed(
-                feed_url=feed_url,
-                source_name="Test Source"
-            )
+        articles = await rss_fetcher.fetch_feed(
+            feed_url=feed_url,
+            source_name="Test Source"
+        )
 
-            # Should still return results even with warning
-            assert isinstance(articles, list)
-        finally:
-            await fetcher.close()
+        # Should still return results even with warning
+        assert isinstance(articles, list)
 
-    @respx.mock
-    async def test_fetch_feed_http_error(self, mock_parse):
+    async def test_fetch_feed_http_error(self, rss_fetcher, router):
         """Test handling HTTP errors"""
         feed_url = "https://example.com/feed.xml"
-        respx.get(feed_url).mock(
+        router.get(feed_url).mock(
             return_value=httpx.Response(500, content=b"Server Error")
         )
 
-        fetcher = RSSFetcher()
-        try:
-            articles = await fetcher.fetch_feed(
-                feed_url=feed_url,
-                source_name="Test Source"
-            )
-
-            # Should return empty list on error
-            assert articles == []
-        finally:
-            await fetcher.close()
-
-    @patch("app.fetchers.rss.feedparser.parse")
-    async def test_standardize_entry_with_all_fields(self, mock_parse):
-        """Test entry standardization with all fields present"""
-        entry = {
-            "title": "Full Article",
-            "link": "https://example.com/full",
-            "summary": "Full summary text",
-            "author": "John Doe",
-            "published_parsed": datetime(2024, 1, 1, 12, 0, 0).timetuple(),
-            "id": "article-123"
-        }
-
-        fetcher = RSSFetcher()
-        article = fetcher._standardize_entry(
-            entry,
-            source_name="Test Source",
-            feed_url="https://example.com/feed"
-        )
-
-        assert article is not None
-        assert article["title"] == "Full Article"
-        assert article["url"] == "https://example.com/full"
-        assert article["text"] == "Full summary text"
-        assert article["author"] == "John Doe"
-        assert article["source"] == "Test Source"
-        assert article["id"] == "article-123"
-
-    @patch("app.fetchers.rss.feedparser.parse")
-    async def test_standardize_entry_missing_title(self, mock_parse):
-        """Test that entries without title are filtered out"""
-        entry = {
-            "link": "https://example.com/article",
-            "summary": "Summary without title"
-        }
-
-        fetcher = RSSFetcher()
-        article = fetcher._standardize_entry(
-            entry,
-            source_name="Test Source",
-            feed_url="https://example.com/feed"
-        )
-
-        # Should return None for entries without title
-        assert article is None
-
-    @patch("app.fetchers.rss.feedparser.parse")
-    async def test_standardize_entry_missing_url(self, mock_parse):
-        """Test that entries without URL are filtered out"""
-        entry = {
-            "title": "Article without URL",
-            "summary": "Summary text"
-        }
-
-        fetcher = RSSFetcher()
-        article = fetcher._standardize_entry(
-            entry,
-            source_name="Test Source",
-            feed_url="https://example.com/feed"
-        )
-
-        # Should return None for entries without URL
-        assert article is None
-
-    @patch("app.fetchers.rss.feedparser.parse")
-    async def test_standardize_entry_fallback_description(self, mock_parse):
-        """Test description field fallback logic"""
-        # Test with 'description' instead of 'summary'
-        entry = {
-            "title": "Test Article",
-            "link": "https://example.com/article",
-            "description": "Description text"
-        }
-
-        fetcher = RSSFetcher()
-        article = fetcher._standardize_entry(
-            entry,
-            source_name="Test Source",
-            feed_url="https://example.com/feed"
-        )
-
-        assert article["text"] == "Description text"
-
-    @patch("app.fetchers.rss.feedparser.parse")
-    async def test_standardize_entry_content_field(self, mock_parse):
-        """Test using 'content' field for description"""
-        entry = {
-            "title": "Test Article",
-            "link": "https://example.com/article",
-            "content": [{"value": "Content text"}]
-        }
-
-        fetcher = RSSFetcher()
-        article = fetcher._standardize_entry(
-            entry,
-            source_name="Test Source",
-            feed_url="https://example.com/feed"
-        )
-
-        assert article["text"] == "Content text"
-
-    @patch("app.fetchers.rss.feedparser.parse")
-    async def test_standardize_entry_fallback_date(self, mock_parse):
-        """Test date field fallback to current time"""
-        entry = {
-            "title": "Test Article",
-            "link": "https://example.com/article"
-            # No date fields
-        }
-
-        fetcher = RSSFetcher()
-        article = fetcher._standardize_entry(
-            entry,
-            source_name="Test Source",
-            feed_url="https://example.com/feed"
+        articles = await rss_fetcher.fetch_feed(
+            feed_url=feed_url,
+            source_name="Test Source"
         )
 
-        # Should have a published_at field (current time)
-        assert "published_at" in article
-        assert article["published_at"] is not None
-
-    @patch("app.fetchers.rss.feedparser.parse")
-    async def test_standardize_entry_author_fallback(self, mock_parse):
-        """Test author field with authors array fallback"""
-        entry = {
-            "title": "Test Article",
-            "link": "https://example.com/article",
-            "authors": [{"name": "Jane Smith"}]
-        }
-
-        fetcher = RSSFetcher()
-        article = fetcher._standardize_entry(
+        # Should return empty list on error
+        assert articles == []
+
+    @pytest.mark.parametrize(
+        "entry,expected",
+        [
+            pytest.param(
+                {
+                    "title": "Full Article",
+                    "link": "https://example.com/full",
+                    "summary": "Full summary text",
+                    "author": "John Doe",
+                    "published_parsed": datetime(2024, 1, 1, 12, 0, 0).timetuple(),
+                    "id": "article-123",
+                },
+                {
+                    "title": "Full Article",
+                    "url": "https://example.com/full",
+                    "text": "Full summary text",
+                    "author": "John Doe",
+                    "source": "Test Source",
+                    "id": "article-123",
+                },
+                id="all_fields",
+            ),
+            pytest.param(
+                # Entries without a title are filtered out
+                {"link": "https://example.com/article", "summary": "Summary without title"},
+                None,
+                id="missing_title",
+            ),
+            pytest.param(
+                # Entries without a URL are filtered out
+                {"title": "Article without URL", "summary": "Summary text"},
+                None,
+                id="missing_url",
+            ),
+            pytest.param(
+                {
+                    "title": "Test Article",
+                    "link": "https://example.com/article",
+                    "description": "Description text",
+                },
+                {"text": "Description text"},
+                id="fallback_description",
+            ),
+            pytest.param(
+                {
+                    "title": "Test Article",
+                    "link": "https://example.com/article",
+                    "content": [{"value": "Content text"}],
+                },
+                {"text": "Content text"},
+                id="content_field",
+            ),
+            pytest.param(
+                # No date fields: published_at falls back to the current time
+                {"title": "Test Article", "link": "https://example.com/article"},
+                {"published_at": ANY},
+                id="fallback_date",
+            ),
+            pytest.param(
+                {
+                    "title": "Test Article",
+                    "link": "https://example.com/article",
+                    "authors": [{"name": "Jane Smith"}],
+                },
+                {"author": "Jane Smith"},
+                id="author_fallback",
+            ),
+            pytest.param(
+                # Standardized fields shared with the other sources, plus RSS defaults
+                {
+                    "title": "Test Article",
+                    "link": "https://example.com/article",
+                    "summary": "Article summary",
+                    "author": "Author Name",
+                    "published_parsed": datetime(2024, 1, 1).timetuple(),
+                    "id": "article-id",
+                },
+                {
+                    "id": ANY,
+                    "title": ANY,
+                    "url": ANY,
+                    "text": ANY,
+                    "author": ANY,
+                    "published_at": ANY,
+                    "source_id": ANY,
+                    "score": 0,
+                    "comments": 0,
+                    "source": "Test Source",
+                },
+                id="standardized_shape",
+            ),
+        ],
+    )
+    def test_standardize_entry(self, entry, expected):
+        """
+        Test entry standardization (expected None means the entry is
+        filtered out; ANY means the field must be present and not None)
+        """
+        article = RSSFetcher._standardize_entry(
             entry,
             source_name="Test Source",
             feed_url="https://example.com/feed"
         )
 
-        assert article["author"] == "Jane Smith"
+        if expected is None:
+            assert article is None
+            return
 
-    @respx.mock
-    @patch("app.fetchers.rss.feedparser.parse")
-    async def test_fetch_multiple_feeds(self, mock_parse):
+        assert article is not None
+        for key, value in expected.items():
+            assert key in article
+            if value is ANY:
+                assert article[key] is not None
+            else:
+                assert article[key] == value
+
+    async def test_fetch_multiple_feeds(self, rss_fetcher, mock_parse, router):
         """Test fetching multiple feeds concurrently"""
         feeds = [
             {"url": "https://feed1.com/rss", "name": "Feed 1"},
@@ -321,122 +287,173 @@ class TestRSSFetcher:
 
         # Mock HTTP responses
         for feed in feeds:
-            respx.get(feed["url"]).mock(
+            router.get(feed["url"]).mock(
                 return_value=httpx.Response(200, content=b"<rss>...</rss>")
             )
 
         # Mock feedparser responses
-        mock_parse.return_value = MockFeed(entries=[
-            MockFeedEntry(title="Article from feed")
-        ])
-
-        fetcher = RSSFetcher()
-        try:
-            articles = await fetcher.fetch_multiple_feeds(feeds, limit_per_feed=10)
-
-            # Should get articles from both feeds
-            assert len(articles) == 2
-        finally:
-            await fetcher.close()
-
-    @respx.mock
-    @patch("app.fetchers.rss.feedparser.parse")
-    async def test_fetch_google_news_convenience(self, mock_parse):
+        mock_parse.side_effect = [
+            MockFeed(entries=[
+                MockFeedEntry(title="Article from feed", link=f"https://example.com/article{i}")
+            ])
+            for i in range(2)
+        ]
+
+        articles = await rss_fetcher.fetch_multiple_feeds(feeds, limit_per_feed=10)
+
+        # Should get articles from both feeds
+        assert len(articles) == 2
+
+    async def test_fetch_google_news_convenience(self, mock_parse, router):
         """Test Google News convenience function"""
         # Mock all Google News feed URLs
-        respx.get(url__regex=r"https://news\.google\.com/.*").mock(
+        router.get(url__regex=_GOOGLE_NEWS_RE).mock(
             return_value=httpx.Response(200, content=b"<rss>...</rss>")
         )
 
-        mock_parse.return_value = MockFeed(entries=[
-            MockFeedEntry(title="Google News Article")
-        ])
+        mock_parse.return_value = _SINGLE_ARTICLE_FEED
 
         articles = await fetch_google_news(limit_per_feed=5)
 
         assert isinstance(articles, list)
         assert len(articles) > 0
 
-    @respx.mock
-    @patch("app.fetchers.rss.feedparser.parse")
-    async def test_fetch_substack_convenience(self, mock_parse):
+    async def test_fetch_substack_convenience(self, mock_parse, router):
         """Test Substack convenience function"""
-        respx.get(url__regex=r".*\.substack\.com/.*|.*bytebytego.*|.*pragmaticengineer.*|.*lennysnewsletter.*").mock(
+        router.get(url__regex=_SUBSTACK_RE).mock(
             return_value=httpx.Response(200, content=b"<rss>...</rss>")
         )
 
-        mock_parse.return_value = MockFeed(entries=[
-            MockFeedEntry(title="Substack Article")
-        ])
+        mock_parse.return_value = _SINGLE_ARTICLE_FEED
 
         articles = await fetch_substack_newsletters(limit_per_feed=5)
 
         assert isinstance(articles, list)
 
-    @respx.mock
-    @patch("app.fetchers.rss.feedparser.parse")
-    async def test_fetch_medium_convenience(self, mock_parse):
+    async def test_fetch_medium_convenience(self, mock_parse, router):
         """Test Medium convenience function"""
-        respx.get(url__regex=r".*medium\.com/.*").mock(
+        router.get(url__regex=_MEDIUM_RE).mock(
             return_value=httpx.Response(200, content=b"<rss>...</rss>")
         )
 
-        mock_parse.return_value = MockFeed(entries=[
-            MockFeedEntry(title="Medium Article")
-        ])
+        mock_parse.return_value = _SINGLE_ARTICLE_FEED
 
         articles = await fetch_medium_publications(limit_per_feed=5)
 
         assert isinstance(articles, list)
 
-    @respx.mock
-    @patch("app.fetchers.rss.feedparser.parse")
-    async def test_fetch_tech_news_convenience(self, mock_parse):
+    async def test_fetch_tech_news_convenience(self, mock_parse, router):
         """Test tech news convenience function"""
-        respx.get(url__regex=r".*(techcrunch|theverge|arstechnica).*").mock(
+        router.get(url__regex=_TECH_NEWS_RE).mock(
             return_value=httpx.Response(200, content=b"<rss>...</rss>")
         )
 
-        mock_parse.return_value = MockFeed(entries=[
-            MockFeedEntry(title="Tech News Article")
-        ])
+        mock_parse.return_value = _SINGLE_ARTICLE_FEED
 
         articles = await fetch_tech_news(limit_per_feed=5)
 
         assert isinstance(articles, list)
 
-    @patch("app.fetchers.rss.feedparser.parse")
-    async def test_rss_articles_standardization(self, mock_parse):
-        """Test that RSS articles have standardized format matching other sources"""
-        entry = {
-            "title": "Test Article",
-            "link": "https://example.com/article",
-            "summary": "Article summary",
-            "author": "Author Name",
-            "published_parsed": datetime(2024, 1, 1).timetuple(),
-            "id": "article-id"
-        }
-
-        fetcher = RSSFetcher()
-        article = fetcher._standardize_entry(
-            entry,
-            source_name="RSS Source",
-            feed_url="https://example.com/feed"
+    async def test_fetch_feed_fast_path_rss(self, rss_fetcher, mock_parse, router):
+        """Test that well-formed RSS 2.0 is parsed with lxml, skipping feedparser"""
+        feed_url = "https://example.com/feed.xml"
+        router.get(feed_url).mock(
+            return_value=httpx.Response(200, content=b"""<?xml version="1.0"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel>
+    <item>
+      <title>Fast Article</title>
+      <link>https://example.com/fast</link>
+      <guid>fast-1</guid>
+      <description>Fast summary</description>
+      <dc:creator>Jane Doe</dc:creator>
+      <pubDate>Mon, 01 Jan 2024 12:00:00 +0000</pubDate>
+    </item>
+  </channel>
+</rss>""")
+        )
+
+        articles = await rss_fetcher.fetch_feed(feed_url, source_name="Test Source")
+
+        assert not mock_parse.called
+        assert len(articles) == 1
+        assert articles[0]["title"] == "Fast Article"
+        assert articles[0]["url"] == "https://example.com/fast"
+        assert articles[0]["id"] == "fast-1"
+        assert articles[0]["text"] == "Fast summary"
+        assert articles[0]["author"] == "Jane Doe"
+        assert articles[0]["published_at"] == "2024-01-01T12:00:00+00:00"
+
+    async def test_cached_feed_returns_copies(self, rss_fetcher, mock_parse, router):
+        """Test that in-place changes to fetched articles don't reach the cache"""
+        feed_url = "https://example.com/feed.xml"
+        route = router.get(feed_url).mock(
+            return_value=httpx.Response(200, content=b"<rss>...</rss>")
         )
+        mock_parse.return_value = MockFeed(entries=[MockFeedEntry(title="Cached Article")])
+
+        first = await rss_fetcher.fetch_feed(feed_url, source_name="Test Source")
+        first[0]["hot_score"] = 1.0
+        second = await rss_fetcher.fetch_feed(feed_url, source_name="Test Source")
+
+        assert route.call_count == 1
+        assert second[0]["title"] == "Cached Article"
+        assert "hot_score" not in second[0]
+
+    async def test_fetch_feed_not_modified(self, rss_fetcher, mock_parse, router):
+        """Test that a 304 response reuses the previously parsed articles"""
+        feed_url = "https://example.com/feed.xml"
+        route = router.get(feed_url).mock(
+            side_effect=[
+                httpx.Response(200, content=b"<rss>...</rss>", headers={"ETag": '"v1"'}),
+                httpx.Response(304),
+            ]
+        )
+        mock_parse.return_value = MockFeed(entries=[MockFeedEntry(title="Cached Article")])
+
+        first = await rss_fetcher.fetch_feed(feed_url, source_name="Test Source")
+        rss_fetcher._feed_cache.clear()
+        second = await rss_fetcher.fetch_feed(feed_url, source_name="Test Source")
+
+        assert second == first
+        assert mock_parse.call_count == 1
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+    async def test_fetch_feed_stops_after_limit_entries(self, rss_fetcher, mock_parse, router):
+        """Test that a limited fetch is built from the first streamed entries"""
+        feed_url = "https://example.com/feed.xml"
+        items = "".join(
+            f"<item><title>Item {i}</title><link>https://example.com/{i}</link></item>"
+            for i in range(5)
+        )
+        router.get(feed_url).mock(
+            return_value=httpx.Response(
+                200,
+                content=f"<rss><channel>{items}</channel></rss>".encode()
+            )
+        )
+
+        articles = await rss_fetcher.fetch_feed(feed_url, source_name="Test Source", limit=2)
+
+        assert not mock_parse.called
+        assert [article["title"] for article in articles] == ["Item 0", "Item 1"]
+
+    async def test_fetch_multiple_feeds_dedupes_urls(self, rss_fetcher, mock_parse, router):
+        """Test that the same story from two feeds is only returned once"""
+        feeds = [
+            {"url": "https://feed1.com/rss", "name": "Feed 1"},
+            {"url": "https://feed2.com/rss", "name": "Feed 2"}
+        ]
+        for feed in feeds:
+            router.get(feed["url"]).mock(
+                return_value=httpx.Response(200, content=b"<rss>...</rss>")
+            )
+
+        mock_parse.side_effect = [
+            MockFeed(entries=[MockFeedEntry(link="https://example.com/story/")]),
+            MockFeed(entries=[MockFeedEntry(link="https://EXAMPLE.com/story?utm_source=feed#top")]),
+        ]
+
+        articles = await rss_fetcher.fetch_multiple_feeds(feeds)
 
-        # Verify all expected standardized fields
-        assert "id" in article
-        assert "title" in article
-        assert "url" in article
-        assert "text" in article
-        assert "score" in article
-        assert "author" in article
-        assert "comments" in article
-        assert "published_at" in article
-        assert "source" in article
-        assert "source_id" in article
-
-        # RSS-specific defaults
-        assert article["score"] == 0
-        assert article["comments"] == 0
-        assert article["source"] == "RSS Source"
+        assert len(articles) == 1
@@ -2,6 +2,9 @@
 Tests for Velocity Calculator (Trending Up Detection)
 """
 
+import statistics
+
+import numpy as np
 import pytest
 from datetime import datetime, timedelta, timezone
 from app.analyzers.velocity_calculator import (
@@ -414,3 +417,151 @@ class TestVelocityCalculator:
             )
 
             assert isinstance(trending, list)
+
+    def test_trending_metrics_match_scalar_methods(self):
+        """Test that batch metrics agree with calculate_velocity/percent_growth"""
+        calc = VelocityCalculator(min_growth_percent=0, min_current_volume=1)
+
+        old_date = (datetime.now(timezone.utc) - timedelta(days=10)).isoformat()
+        current_keywords = {"rising": 120, "steady": 40, "fresh": 30}
+        historical_data = {
+            "rising": [{"date": old_date, "mentions": 30}],
+            "steady": [{"date": old_date, "mentions": 40}],
+        }
+
+        trending = calc.find_trending_up_keywords(
+            current_keywords=current_keywords,
+            historical_data=historical_data,
+            timeframe_days=7
+        )
+
+        by_keyword = {kw["keyword"]: kw for kw in trending}
+        for keyword in ("rising", "steady"):
+            kw = by_keyword[keyword]
+            assert kw["velocity"] == pytest.approx(
+                calc.calculate_velocity(kw["current_volume"], kw["previous_volume"], 7)
+            )
+            assert kw["percent_growth"] == pytest.approx(
+                calc.calculate_percent_growth(kw["current_volume"], kw["previous_volume"])
+            )
+        assert by_keyword["fresh"]["is_new"] is True
+        assert [kw["keyword"] for kw in trending] == ["fresh", "rising", "steady"]
+
+    def test_previous_volume_treats_naive_dates_as_utc(self):
+        """Test that naive history dates are compared as UTC"""
+        calc = VelocityCalculator()
+
+        naive = (datetime.now(timezone.utc) - timedelta(days=10)).replace(tzinfo=None)
+        history = [{"date": naive.isoformat(), "mentions": 30}]
+
+        assert calc._calculate_previous_volume(history, timeframe_days=7) == 30
+
+    def test_percent_growth_vec_matches_scalar(self):
+        """Test that the array form agrees with calculate_percent_growth"""
+        calc = VelocityCalculator()
+        pairs = [(100, 50), (50, 0), (0, 0), (20, 40), (7, 7)]
+
+        growth = calc.calculate_percent_growth_vec(
+            np.array([c for c, _ in pairs], dtype=np.float64),
+            np.array([p for _, p in pairs], dtype=np.float64)
+        )
+
+        assert growth.tolist() == [calc.calculate_percent_growth(c, p) for c, p in pairs]
+
+    def test_previous_volume_uses_reference_time(self):
+        """Test that the previous period is measured from the given now"""
+        calc = VelocityCalculator()
+
+        now = datetime(2024, 1, 31, tzinfo=timezone.utc)
+        history = [
+            {"date": (now - timedelta(days=2)).isoformat(), "mentions": 90},
+            {"date": (now - timedelta(days=10)).isoformat(), "mentions": 20},
+            {"date": (now - timedelta(days=14)).isoformat(), "mentions": 40},
+        ]
+
+        # Days 7-14 before now (inclusive) hold the last two entries, in any order
+        assert calc._calculate_previous_volume(history, timeframe_days=7, now=now) == 30
+
+    def test_get_top_trending_up_matches_full_ranking(self):
+        """Test that top_n selection equals the head of the full ranking, ties included"""
+        calc = VelocityCalculator(min_growth_percent=0, min_current_volume=1)
+
+        # Repeated volumes give tied velocities around the top_n boundary
+        current_keywords = {f"keyword{i}": 100 + (i % 3) * 10 for i in range(12)}
+        historical_data = {
+            keyword: [
+                {"date": (datetime.now(timezone.utc) - timedelta(days=10)).isoformat(), "mentions": 50}
+            ]
+            for keyword in current_keywords
+        }
+
+        ranking = calc.find_trending_up_keywords(current_keywords, historical_data)
+        for top_n in (1, 4, 5, 12, 20):
+            top = calc.get_top_trending_up(current_keywords, historical_data, top_n=top_n)
+            assert top == ranking[:top_n]
+
+    def test_detect_spike_z_score_value(self):
+        """Test the z-score against a population mean/std computed directly"""
+        calc = VelocityCalculator()
+
+        mentions = [12, 15, 9, 20, 14, 11]
+        history = [{"date": datetime.now(timezone.utc).isoformat(), "mentions": m} for m in mentions]
+
+        is_spike, z_score = calc.detect_spike(current_volume=40, history=history)
+
+        assert is_spike is True
+        assert z_score == pytest.approx((40 - statistics.fmean(mentions)) / statistics.pstdev(mentions))
+
+    def test_previous_volume_mixed_date_formats(self):
+        """Test that UTC, 'Z', naive and offset dates land in the same window"""
+        calc = VelocityCalculator()
+
+        now = datetime(2024, 1, 31, tzinfo=timezone.utc)
+        day_10 = now - timedelta(days=10)
+        history = [
+            {"date": day_10.isoformat(), "mentions": 10},
+            {"date": day_10.isoformat().replace("+00:00", "Z"), "mentions": 20},
+            {"date": day_10.replace(tzinfo=None).isoformat(), "mentions": 30},
+            {"date": day_10.astimezone(timezone(timedelta(hours=5))).isoformat(), "mentions": 40},
+        ]
+
+        assert calc._calculate_previous_volume(history, timeframe_days=7, now=now) == 25
+
+    def test_in_place_history_changes_seen_by_next_call(self):
+        """Test that repeated calls on one dataset see edits to its histories"""
+        calc = VelocityCalculator(min_growth_percent=0, min_current_volume=1)
+
+        current_keywords = {"keyword": 100}
+        day_10 = (datetime.now(timezone.utc) - timedelta(days=10)).isoformat()
+        historical_data = {"keyword": [{"date": day_10, "mentions": 40}]}
+
+        first = calc.find_trending_up_keywords(current_keywords, historical_data, timeframe_days=7)
+        historical_data["keyword"].append({"date": day_10, "mentions": 80})
+        second = calc.find_trending_up_keywords(current_keywords, historical_data, timeframe_days=7)
+
+        assert first[0]["previous_volume"] == 40
+        assert second[0]["previous_volume"] == 60
+
+    def test_velocity_vec_matches_scalar(self):
+        """Test that the array form agrees with calculate_velocity"""
+        calc = VelocityCalculator()
+        pairs = [(100, 50), (50, 0), (0, 0), (50, 100), (200, 100)]
+
+        velocity = calc.calculate_velocity_vec(
+            np.array([c for c, _ in pairs], dtype=np.float64),
+            np.array([p for _, p in pairs], dtype=np.float64),
+            7
+        )
+
+        assert velocity.tolist() == [calc.calculate_velocity(c, p, 7) for c, p in pairs]
+
+    def test_vec_methods_accept_int_sequences(self):
+        """Test that the bulk API casts plain int sequences to float64"""
+        calc = VelocityCalculator()
+
+        velocity = calc.calculate_velocity_vec([100, 50], [50, 0], 7)
+        growth = calc.calculate_percent_growth_vec([100, 50], [50, 0])
+
+        assert velocity.dtype == np.float64
+        assert velocity.tolist() == [calc.calculate_velocity(100, 50, 7), 500.0]
+        assert growth.tolist() == [100.0, 1000.0]
@@ -0,0 +1,14 @@
+-- DropIndex
+DROP INDEX "hot_topics_timeframe_rank_fetchedAt_idx";
+
+-- DropIndex
+DROP INDEX "trending_up_topics_timeframe_rank_fetchedAt_idx";
+
+-- DropIndex
+DROP INDEX "keyword_history_keyword_idx";
+
+-- CreateIndex
+CREATE INDEX "hot_topics_timeframe_fetchedAt_rank_idx" ON "hot_topics"("timeframe", "fetchedAt", "rank");
+
+-- CreateIndex
+CREATE INDEX "trending_up_topics_timeframe_fetchedAt_rank_idx" ON "trending_up_topics"("timeframe", "fetchedAt", "rank");
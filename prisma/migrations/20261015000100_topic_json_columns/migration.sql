@@ -0,0 +1,13 @@
+-- AlterTable
+ALTER TABLE "hot_topics" ALTER COLUMN "sources" SET DATA TYPE JSONB USING "sources"::jsonb,
+ALTER COLUMN "sampleUrls" SET DATA TYPE JSONB USING "sampleUrls"::jsonb;
+
+-- AlterTable
+ALTER TABLE "trending_up_topics" ALTER COLUMN "sources" SET DATA TYPE JSONB USING "sources"::jsonb,
+ALTER COLUMN "sampleUrls" SET DATA TYPE JSONB USING "sampleUrls"::jsonb;
+
+-- AlterTable
+ALTER TABLE "keyword_history" ALTER COLUMN "sources" SET DATA TYPE JSONB USING "sources"::jsonb;
+
+-- CreateIndex
+CREATE INDEX "hot_topics_sources_idx" ON "hot_topics" USING GIN ("sources");